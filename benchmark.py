@@ -4,53 +4,144 @@
 최적화 전후 성능 비교 측정
 """
 
+import argparse
+import gc
+import os
 import time
 import tracemalloc
+import subprocess
+import statistics
 import sys
 import json
-from typing import Dict, List, Callable
+import tempfile
+from typing import Any, Dict, List, Callable, Optional
+
+
+# 회귀 판정에 쓰는 시간 지표 (결과 항목에 먼저 있는 것을 사용)
+TIME_METRICS = ("median_ms", "p50_ms", "import_time_ms")
+
+# 기준선 대비 이 비율보다 느려지면 회귀로 판정
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+# 잔류 메모리 집계에서 뺄 할당 (tracemalloc 자신, 임포트 기구)
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+)
+
+
+def summarize_samples(samples_ms: List[float]) -> Dict[str, float]:
+    """반복 측정 표본(ms)의 중앙값, IQR, p95 등 요약 통계"""
+    ordered = sorted(samples_ms)
+    if len(ordered) >= 2:
+        q1, _, q3 = statistics.quantiles(ordered, n=4, method="inclusive")
+        p95 = statistics.quantiles(ordered, n=20, method="inclusive")[18]
+    else:
+        q1 = q3 = p95 = ordered[0]
+    return {
+        'median_ms': round(statistics.median(ordered), 4),
+        'iqr_ms': round(q3 - q1, 4),
+        'p95_ms': round(p95, 4),
+        'min_ms': round(ordered[0], 4),
+        'mean_ms': round(statistics.mean(ordered), 4),
+    }
+
+
+def machine_metadata() -> Dict[str, Any]:
+    """결과 비교용 실행 환경 정보 (머신, 파이썬, 커밋)"""
+    import platform
+    
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    
+    return {
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'git_commit': commit,
+    }
 
 
 class PerformanceBenchmark:
-    """성능 벤치마크 클래스"""
+    """
+    성능 벤치마크 클래스
     
-    def __init__(self):
+    워밍업 후 iterations회 호출을 repeats번 반복해 호출당 시간의 중앙값,
+    IQR, p95를 구합니다. tracemalloc은 호출 시간을 부풀리므로 시간 측정과
+    분리된 메모리 측정 패스에서만 켭니다.
+    """
+    
+    def __init__(self, repeats: int = 7, warmup: Optional[int] = None, measure_memory: bool = True):
+        """
+        Args:
+            repeats: 시간 측정 반복 횟수 (반복마다 표본 하나)
+            warmup: 측정 전 호출 횟수 (None이면 iterations의 10%)
+            measure_memory: 별도 메모리 측정 패스 실행 여부
+        """
         self.results: Dict[str, Dict] = {}
+        self.repeats = max(1, repeats)
+        self.warmup = warmup
+        self.measure_memory = measure_memory
         self.current_test = None
     
     def run_test(self, test_name: str, test_function: Callable, iterations: int = 1000):
         """성능 테스트 실행"""
         print(f"🔍 테스트 실행 중: {test_name}")
+        self.current_test = test_name
         
-        # 메모리 추적 시작
-        tracemalloc.start()
-        
-        # 시간 측정
-        start_time = time.perf_counter()
-        
-        for _ in range(iterations):
+        # 워밍업 (캐시, 지연 임포트, 지연 초기화를 측정에서 제외)
+        warmup = self.warmup if self.warmup is not None else max(1, iterations // 10)
+        for _ in range(warmup):
             test_function()
         
-        end_time = time.perf_counter()
+        # 시간 측정: 반복마다 호출당 평균 시간 하나
+        samples = []
+        for _ in range(self.repeats):
+            gc.collect()
+            start_time = time.perf_counter()
+            for _ in range(iterations):
+                test_function()
+            samples.append((time.perf_counter() - start_time) / iterations * 1000)  # ms
         
-        # 메모리 사용량 측정
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+        result: Dict[str, Any] = summarize_samples(samples)
+        result['execution_time_ms'] = result['median_ms']  # 이전 결과 형식 호환
+        result['iterations'] = iterations
+        result['repeats'] = self.repeats
+        result['warmup'] = warmup
         
-        # 결과 저장
-        execution_time = (end_time - start_time) / iterations * 1000  # ms
+        # 메모리 측정 (시간 측정과 분리)
+        if self.measure_memory:
+            gc.collect()
+            tracemalloc.start()
+            for _ in range(iterations):
+                test_function()
+            current, peak = tracemalloc.get_traced_memory()
+            gc.collect()
+            snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+            tracemalloc.stop()
+            result['memory_current_mb'] = round(current / 1024 / 1024, 4)
+            result['memory_peak_mb'] = round(peak / 1024 / 1024, 4)
+            # 측정 중 할당되어 끝난 뒤에도 살아 있는 블록/바이트 (호출당, 캐시·누수 추적용).
+            # tracemalloc은 시작 후의 할당만 추적하므로 스냅샷이 곧 빈 기준선과의 차이이며,
+            # 이미 해제된 임시 할당은 세지 않습니다.
+            stats = snapshot.statistics('filename')
+            result['retained_blocks_per_op'] = round(sum(stat.count for stat in stats) / iterations, 3)
+            result['retained_bytes_per_op'] = round(sum(stat.size for stat in stats) / iterations, 1)
         
-        self.results[test_name] = {
-            'execution_time_ms': round(execution_time, 3),
-            'memory_current_mb': round(current / 1024 / 1024, 2),
-            'memory_peak_mb': round(peak / 1024 / 1024, 2),
-            'iterations': iterations
-        }
-        
-        print(f"✅ 완료: {execution_time:.3f}ms (평균)")
+        self.results[test_name] = result
+        print(f"✅ 완료: 중앙값 {result['median_ms']:.4f}ms (IQR {result['iqr_ms']:.4f}ms, "
+              f"p95 {result['p95_ms']:.4f}ms, {self.repeats}회 반복)")
     
     def compare_tests(self, baseline: str, optimized: str):
-        """두 테스트 결과 비교"""
+        """두 테스트 결과 비교 (중앙값 기준, 차이가 IQR 안이면 잡음으로 표시)"""
         if baseline not in self.results or optimized not in self.results:
             print("❌ 비교할 테스트 결과가 없습니다.")
             return
@@ -58,21 +149,24 @@ class PerformanceBenchmark:
         baseline_result = self.results[baseline]
         optimized_result = self.results[optimized]
         
-        time_improvement = (
-            (baseline_result['execution_time_ms'] - optimized_result['execution_time_ms']) /
-            baseline_result['execution_time_ms'] * 100
-        )
-        
-        memory_improvement = (
-            (baseline_result['memory_peak_mb'] - optimized_result['memory_peak_mb']) /
-            baseline_result['memory_peak_mb'] * 100
-        )
+        difference = baseline_result['median_ms'] - optimized_result['median_ms']
+        time_improvement = difference / baseline_result['median_ms'] * 100
+        noise = max(baseline_result['iqr_ms'], optimized_result['iqr_ms'])
         
         print(f"\n📊 **성능 비교: {baseline} vs {optimized}**")
         print("=" * 50)
-        print(f"실행 시간 개선: {time_improvement:+.1f}%")
-        print(f"메모리 사용량 개선: {memory_improvement:+.1f}%")
-        print(f"절대 시간 단축: {baseline_result['execution_time_ms'] - optimized_result['execution_time_ms']:.3f}ms")
+        print(f"실행 시간 개선 (중앙값): {time_improvement:+.1f}%")
+        print(f"절대 시간 단축: {difference:.4f}ms")
+        if abs(difference) <= noise:
+            print(f"⚠️ 차이가 측정 잡음(IQR {noise:.4f}ms) 안에 있습니다.")
+        
+        if 'memory_peak_mb' in baseline_result and 'memory_peak_mb' in optimized_result \
+                and baseline_result['memory_peak_mb'] > 0:
+            memory_improvement = (
+                (baseline_result['memory_peak_mb'] - optimized_result['memory_peak_mb']) /
+                baseline_result['memory_peak_mb'] * 100
+            )
+            print(f"메모리 사용량 개선: {memory_improvement:+.1f}%")
     
     def generate_report(self):
         """성능 리포트 생성"""
@@ -81,21 +175,80 @@ class PerformanceBenchmark:
         
         for test_name, result in self.results.items():
             print(f"\n🔹 {test_name}")
-            print(f"   실행 시간: {result['execution_time_ms']:.3f}ms")
-            print(f"   메모리 사용량: {result['memory_current_mb']:.2f}MB")
-            print(f"   최대 메모리: {result['memory_peak_mb']:.2f}MB")
-            print(f"   반복 횟수: {result['iterations']}")
+            print(f"   실행 시간: 중앙값 {result['median_ms']:.4f}ms / IQR {result['iqr_ms']:.4f}ms"
+                  f" / p95 {result['p95_ms']:.4f}ms")
+            if 'memory_peak_mb' in result:
+                print(f"   메모리 사용량: {result['memory_current_mb']:.4f}MB")
+                print(f"   최대 메모리: {result['memory_peak_mb']:.4f}MB")
+            print(f"   반복 횟수: {result['iterations']} × {result['repeats']}회")
     
     def save_results(self, filename: str = "benchmark_results.json"):
-        """결과를 파일로 저장"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, indent=2, ensure_ascii=False)
+        """결과를 실행 환경 정보와 함께 파일로 저장"""
+        write_results(filename, self.results)
         print(f"💾 결과 저장: {filename}")
 
 
-def benchmark_data_loading():
-    """데이터 로딩 성능 테스트"""
-    benchmark = PerformanceBenchmark()
+def write_results(filename: str, results: Dict[str, Any]):
+    """결과를 실행 환경 정보와 함께 JSON으로 저장합니다."""
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump({'metadata': machine_metadata(), 'results': results}, f, indent=2, ensure_ascii=False)
+
+
+def load_results(filename: str) -> Dict[str, Any]:
+    """저장된 결과 파일에서 결과 항목을 읽습니다. (메타데이터 없는 이전 형식도 지원)"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data.get('results', data) if isinstance(data, dict) and 'metadata' in data else data
+
+
+def _time_metric(result: Dict[str, Any]) -> Optional[str]:
+    for metric in TIME_METRICS:
+        if metric in result:
+            return metric
+    return None
+
+
+def check_regressions(results: Dict[str, Any], baseline: Dict[str, Any],
+                      threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+                      tracked: Optional[List[str]] = None) -> List[str]:
+    """
+    기준선 대비 느려진 벤치마크를 찾습니다.
+    
+    현재 값이 기준선보다 threshold 비율 이상 느리고, 그 차이가 양쪽 IQR
+    (측정 잡음) 중 큰 값보다 클 때만 회귀로 봅니다. tracked가 없으면 양쪽에
+    모두 있는 프로젝트 항목을 비교합니다. ('project': False인 외부 라이브러리
+    비교 항목은 --track으로 지정할 때만 확인)
+    
+    Returns:
+        회귀 설명 문자열 목록 (비어 있으면 통과)
+    """
+    if tracked is not None:
+        names = tracked
+    else:
+        names = [name for name in results
+                 if name in baseline and results[name].get('project', True) and baseline[name].get('project', True)]
+    regressions = []
+    
+    for name in names:
+        if name not in results or name not in baseline:
+            print(f"⚠️ 추적 대상 벤치마크가 없습니다: {name}")
+            continue
+        metric = _time_metric(baseline[name])
+        if metric is None or metric not in results[name]:
+            continue
+        
+        before = baseline[name][metric]
+        after = results[name][metric]
+        noise = max(baseline[name].get('iqr_ms', 0.0), results[name].get('iqr_ms', 0.0))
+        if before > 0 and after > before * (1 + threshold) and after - before > noise:
+            regressions.append(f"{name}: {before:.4f}ms → {after:.4f}ms ({(after / before - 1) * 100:+.1f}%, {metric})")
+    
+    return regressions
+
+
+def benchmark_data_loading(**options):
+    """데이터 로딩 성능 테스트 (options는 PerformanceBenchmark 설정)"""
+    benchmark = PerformanceBenchmark(**options)
     
     # 기존 방식 (개별 JSON 로딩)
     def old_loading():
@@ -125,9 +278,9 @@ def benchmark_data_loading():
     return benchmark
 
 
-def benchmark_inventory_operations():
-    """인벤토리 연산 성능 테스트"""
-    benchmark = PerformanceBenchmark()
+def benchmark_inventory_operations(**options):
+    """인벤토리 연산 성능 테스트 (options는 PerformanceBenchmark 설정)"""
+    benchmark = PerformanceBenchmark(**options)
     
     # 기존 인벤토리
     def old_inventory_test():
@@ -158,19 +311,256 @@ def benchmark_inventory_operations():
     return benchmark
 
 
-def main():
-    """메인 벤치마크 실행"""
+def measure_import_time(module: str, runs: int = 5) -> Optional[Dict[str, float]]:
+    """`python -X importtime`으로 모듈의 누적 임포트 시간(ms)을 측정 (중앙값, IQR)"""
+    samples = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            return None
+        
+        # 형식: "import time: self [us] | cumulative | imported package"
+        for line in proc.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                samples.append(int(parts[1].strip()) / 1000)
+                break
+    
+    if not samples:
+        return None
+    summary = summarize_samples(samples)
+    return {'import_time_ms': summary['median_ms'], 'iqr_ms': summary['iqr_ms']}
+
+
+def benchmark_import_time():
+    """임포트 시간 비교 테스트 (-X importtime, numpy는 비교용이라 기본 회귀 검사에서 제외)"""
+    results = {}
+    targets = {
+        "experience_모듈": ("systems.experience", True),
+        "numpy_단독": ("numpy", False),
+    }
+    
+    for label, (module, project) in targets.items():
+        measured = measure_import_time(module)
+        if measured is None:
+            print(f"⚠️ {module} 임포트 실패 (설치되지 않음)")
+            continue
+        results[label] = measured if project else {**measured, 'project': False}
+        print(f"✅ {module}: {measured['import_time_ms']:.3f}ms (누적, 중앙값 / IQR {measured['iqr_ms']:.3f}ms)")
+    
+    if "experience_모듈" in results and "numpy_단독" in results:
+        saved = results["numpy_단독"]['import_time_ms']
+        print(f"📊 experience 임포트 시 NumPy 로딩 회피: 약 {saved:.3f}ms 절약")
+    
+    return results
+
+
+def benchmark_startup(runs: int = 5) -> Dict[str, Dict[str, Any]]:
+    """
+    게임 진입점 콜드 스타트 시간 (새 프로세스, 임포트 + 초기화 함수별)
+    
+    -X importtime 없이 재므로 실제 시작 시간과 같고, --baseline으로 기준선과
+    비교됩니다. 모듈별 순위는 main_optimized.py --profile-startup으로 봅니다.
+    """
+    from utility.startup_profiler import STARTUP_ENTRY, profile_startup
+    
+    profiles = [profile_startup(importtime=False) for _ in range(runs)]
+    totals = [profile['total_ms'] for profile in profiles]
+    
+    results = {"시작_시간_전체": {
+        **summarize_samples(totals),
+        'import_ms': round(statistics.median(p['import_ms'] for p in profiles), 4),
+        'runs': runs,
+    }}
+    for item in profiles[0]['initializers']:
+        samples = [next(i['ms'] for i in p['initializers'] if i['name'] == item['name']) for p in profiles]
+        results[f"시작_초기화_{item['name']}"] = summarize_samples(samples)
+    
+    stats = results["시작_시간_전체"]
+    print(f"✅ {STARTUP_ENTRY} 시작: 중앙값 {stats['median_ms']:.2f}ms (임포트 {stats['import_ms']:.2f}ms, {runs}회)")
+    return results
+
+
+def latency_percentiles(samples_ms: List[float]) -> Dict[str, float]:
+    """지연 시간 표본(ms)의 평균, p50/p95/p99, IQR (회귀 판정의 잡음 기준)"""
+    cuts = statistics.quantiles(samples_ms, n=100)
+    return {
+        'mean_ms': round(statistics.mean(samples_ms), 4),
+        'p50_ms': round(cuts[49], 4),
+        'iqr_ms': round(cuts[74] - cuts[24], 4),
+        'p95_ms': round(cuts[94], 4),
+        'p99_ms': round(cuts[98], 4),
+    }
+
+
+def late_game_save_data() -> Dict[str, Any]:
+    """후반부 플레이어 규모의 v2 세이브 데이터"""
+    from systems.save_system.schema import SAVE_FORMAT_VERSION
+    
+    return {
+        "version": SAVE_FORMAT_VERSION,
+        "name": "벤치마크",
+        "job": "무사",
+        "stats": {"level": 60, "exp": 1234567, "hp": 800, "max_hp": 800, "mp": 300, "max_mp": 300,
+                  "base_attack": 120, "defence": 80, "speed": 40, "gold": 99999},
+        "inventory": {
+            "items": {f"아이템_{i}": i for i in range(100)},
+            "weapons": [f"무기_{i}" for i in range(30)],
+            "max_capacity": 200,
+        },
+        "equipped_weapon": {"weapon_id": "무기_0", "durability": 50, "enhancement": 9},
+        "quests": {
+            "active": {f"quest_{i:03d}": {"progress": {"kill": i}} for i in range(200, 210)},
+            "completed": [f"quest_{i:03d}" for i in range(200)],
+        },
+        "location": {"current": "한양"},
+        "status_effects": {"poison": 2},
+        "region": {"current_region": "한양"},
+    }
+
+
+def benchmark_save_codecs(iterations: int = 200):
+    """세이브 코덱별 크기와 인코딩/디코딩 시간 (왕복 검증 포함)"""
+    from systems.save_system.schema import decode_save, encode_save, msgpack
+    
+    player_data = late_game_save_data()
+    codecs = {
+        "코덱_json_들여쓰기": ("json", False),
+        "코덱_json_압축": ("json", True),
+        "코덱_zlib": ("zlib", False),
+    }
+    if msgpack is not None:
+        codecs["코덱_msgpack"] = ("msgpack", False)
+    else:
+        print("⚠️ msgpack이 없어 msgpack 코덱은 건너뜁니다.")
+    
+    results = {}
+    for label, (codec, compact) in codecs.items():
+        encode_samples, decode_samples = [], []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            payload = encode_save(player_data, codec, compact)
+            encode_samples.append((time.perf_counter() - start) * 1000)
+            
+            start = time.perf_counter()
+            decoded = decode_save(payload)
+            decode_samples.append((time.perf_counter() - start) * 1000)
+        
+        if decoded != player_data:
+            print(f"❌ {label}: 왕복 결과가 원본과 다릅니다.")
+        
+        results[label] = {
+            'size_bytes': len(payload),
+            'encode_p50_ms': latency_percentiles(encode_samples)['p50_ms'],
+            'decode_p50_ms': latency_percentiles(decode_samples)['p50_ms'],
+        }
+        stats = results[label]
+        print(f"✅ {label}: {stats['size_bytes']}B / 인코딩 {stats['encode_p50_ms']:.3f}ms"
+              f" / 디코딩 {stats['decode_p50_ms']:.3f}ms")
+    
+    return results
+
+
+def benchmark_save_latency(iterations: int = 200):
+    """세이브 지연 시간 테스트 (원자적 쓰기, 압축 JSON, 백그라운드 저장, SQLite)"""
+    from systems.save_system.core import SaveSystem
+    from systems.save_system.sqlite_store import SQLiteSaveSystem
+    
+    player_data = late_game_save_data()
+    
+    modes = {
+        "세이브_동기_들여쓰기": {"compact": False, "background": False},
+        "세이브_동기_압축": {"compact": True, "background": False},
+        "세이브_백그라운드_압축": {"compact": True, "background": True},
+        "세이브_SQLite_매번커밋": {"sqlite": {}},
+        "세이브_SQLite_일괄커밋": {"sqlite": {"batch_size": 32}},
+    }
+    
+    results = {}
+    for label, options in modes.items():
+        with tempfile.TemporaryDirectory() as save_dir:
+            if "sqlite" in options:
+                save_system = SQLiteSaveSystem(os.path.join(save_dir, "saves.db"), **options["sqlite"])
+            else:
+                save_system = SaveSystem(save_dir, **options)
+            samples = []
+            for i in range(iterations):
+                player_data["stats"]["exp"] += i
+                start = time.perf_counter()
+                save_system.save_game(1 + i % 3, player_data)
+                samples.append((time.perf_counter() - start) * 1000)
+            save_system.close()
+        
+        results[label] = latency_percentiles(samples)
+        stats = results[label]
+        print(f"✅ {label}: p50 {stats['p50_ms']:.3f}ms / p95 {stats['p95_ms']:.3f}ms / p99 {stats['p99_ms']:.3f}ms")
+    
+    return results
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="전란 그리고 요괴 - 성능 벤치마크")
+    parser.add_argument("--repeats", type=int, default=7, help="시간 측정 반복 횟수 (기본 7)")
+    parser.add_argument("--warmup", type=int, default=None, help="측정 전 워밍업 호출 횟수 (기본: 반복 횟수의 10%%)")
+    parser.add_argument("--no-memory", action="store_true", help="메모리 측정 패스 생략")
+    parser.add_argument("--output", default="performance_results.json", help="결과 JSON 파일")
+    parser.add_argument("--startup-budget", type=float, default=None,
+                        help="게임 시작 시간 절대 예산 ms (초과 시 종료 코드 1, 기본: 기준선 비교만)")
+    parser.add_argument("--scenarios", action="store_true",
+                        help="시나리오 벤치마크(benchmark_scenarios.py)도 실행해 결과에 포함")
+    parser.add_argument("--scenario-scale", type=float, default=1.0, help="시나리오 측정 횟수 배율")
+    parser.add_argument("--baseline", help="비교할 기준선 결과 JSON (회귀 시 종료 코드 1)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="회귀로 판정할 기준선 대비 느려짐 비율 (기본 0.10)")
+    parser.add_argument("--track", action="append", metavar="NAME",
+                        help="회귀를 확인할 벤치마크 이름 (여러 번 지정 가능, 기본: numpy 등 비교용을 뺀 공통 항목 전체)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """메인 벤치마크 실행 (회귀가 있으면 1 반환)"""
+    args = parse_args(argv)
+    options = {"repeats": args.repeats, "warmup": args.warmup, "measure_memory": not args.no_memory}
+    
     print("🚀 전란 그리고 요괴 - 성능 벤치마크")
     print("=" * 50)
     
     try:
         # 데이터 로딩 벤치마크
         print("\n1️⃣ 데이터 로딩 성능 테스트")
-        data_benchmark = benchmark_data_loading()
+        data_benchmark = benchmark_data_loading(**options)
         
         # 인벤토리 벤치마크
         print("\n2️⃣ 인벤토리 연산 성능 테스트")
-        inventory_benchmark = benchmark_inventory_operations()
+        inventory_benchmark = benchmark_inventory_operations(**options)
+        
+        # 임포트 시간 벤치마크
+        print("\n3️⃣ 임포트 시간 비교 (-X importtime)")
+        import_results = benchmark_import_time()
+        
+        # 세이브 지연 시간 벤치마크
+        print("\n4️⃣ 세이브 지연 시간 (게임 스레드 기준)")
+        save_results = benchmark_save_latency()
+        
+        # 세이브 코덱 벤치마크
+        print("\n5️⃣ 세이브 코덱 크기 및 왕복 시간")
+        codec_results = benchmark_save_codecs()
+        
+        # 시작 시간 벤치마크
+        print("\n6️⃣ 게임 시작 시간 (콜드 스타트)")
+        startup_results = benchmark_startup()
+        
+        # 시나리오 벤치마크 (선택)
+        scenario_results = {}
+        if args.scenarios:
+            from benchmark_scenarios import print_scenario_table, run_scenarios
+            
+            print("\n7️⃣ 시나리오 벤치마크 (실제 게임 시스템)")
+            scenario_results = run_scenarios(scale=args.scenario_scale, **options)
+            print_scenario_table(scenario_results)
         
         # 통합 리포트
         print("\n📊 **통합 성능 리포트**")
@@ -178,18 +568,45 @@ def main():
         inventory_benchmark.generate_report()
         
         # 결과 저장
-        all_results = {**data_benchmark.results, **inventory_benchmark.results}
-        with open("performance_results.json", 'w', encoding='utf-8') as f:
-            json.dump(all_results, f, indent=2, ensure_ascii=False)
+        all_results = {**data_benchmark.results, **inventory_benchmark.results, **import_results, **save_results, **codec_results,
+                       **startup_results, **scenario_results}
+        write_results(args.output, all_results)
         
         print("\n✅ 벤치마크 완료!")
-        print("📁 결과 파일: performance_results.json")
+        print(f"📁 결과 파일: {args.output}")
         
     except Exception as e:
         print(f"❌ 벤치마크 오류: {e}")
         import traceback
         traceback.print_exc()
+        return 1
+    
+    # 시작 시간 예산 검사 (지정한 경우만, 기본 검사는 아래 기준선 비교)
+    failed = False
+    startup_ms = all_results["시작_시간_전체"]['median_ms']
+    if args.startup_budget is not None and startup_ms > args.startup_budget:
+        print(f"\n❌ 게임 시작 시간 {startup_ms:.2f}ms가 예산 {args.startup_budget:g}ms를 넘었습니다."
+              " (python main_optimized.py --profile-startup 으로 원인 확인)")
+        failed = True
+    
+    # 회귀 검사
+    if args.baseline:
+        try:
+            baseline = load_results(args.baseline)
+        except (OSError, ValueError) as e:
+            print(f"❌ 기준선을 읽을 수 없습니다: {e}")
+            return 1
+        
+        regressions = check_regressions(all_results, baseline, args.threshold, args.track)
+        if regressions:
+            print(f"\n❌ 성능 회귀 {len(regressions)}건 (임계값 {args.threshold:.0%}):")
+            for line in regressions:
+                print(f"   - {line}")
+            return 1
+        print(f"\n✅ 기준선 대비 회귀 없음 (임계값 {args.threshold:.0%})")
+    
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+전란 그리고 요괴 - 시나리오 벤치마크
+실제 게임 시스템(전투, 스폰, 이동, 상점, 세이브)을 화면 출력 없이 구동해
+시나리오별 처리량(ops/sec), 호출당 남는 메모리 블록, 최대 메모리를 측정
+"""
+
+import argparse
+import builtins
+import os
+import random
+import sys
+import tempfile
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from benchmark import PerformanceBenchmark, write_results
+
+# 시나리오 = (이름, 준비 함수 → 한 번의 동작 함수, 측정 횟수)
+Scenario = Tuple[str, Callable[[], Callable[[], Any]], int]
+
+# 스폰 시나리오의 지역별 호출 횟수
+SPAWNS_PER_REGION = 10_000
+
+
+@contextmanager
+def headless(answer: str = "1") -> Iterator[None]:
+    """
+    화면 출력을 버리고 모든 입력에 answer로 답합니다.
+
+    전투 메뉴에서 "1"은 기본 공격, 대상 선택에서는 첫 번째 적입니다.
+    """
+    original_input = builtins.input
+    original_stdout = sys.stdout
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        builtins.input = lambda prompt="": answer
+        sys.stdout = devnull
+        try:
+            yield
+        finally:
+            builtins.input = original_input
+            sys.stdout = original_stdout
+
+
+def _new_player():
+    from characters.player import Player
+
+    player = Player("벤치마크", "무사")
+    player.gain_exp(5000)  # 중반부 레벨 (3마리 전투에서도 대체로 승리)
+    return player
+
+
+def setup_battle() -> Callable[[], Any]:
+    """1~3마리 스폰 몬스터와의 전투 한 판 (기본 공격만 사용)"""
+    from systems.battle import start_battle
+    from systems.monsters_optimized import get_random_monsters
+
+    player = _new_player()
+    counts = [1, 2, 3]
+    state = {"turn": 0}
+
+    def battle():
+        # 매 판 같은 상태에서 시작
+        player.current_hp = player.max_hp
+        player.mp = player.max_mp
+        player.status_effects.clear()
+        count = counts[state["turn"] % len(counts)]
+        state["turn"] += 1
+        enemies = get_random_monsters("한양", force_count=count)
+        return start_battle(player, enemies)
+
+    return battle
+
+
+def setup_spawn(region: str) -> Callable[[], Any]:
+    """지역 조우 스폰 한 번 (스폰 수와 몬스터 선택, Enemy 생성 포함)"""
+    from systems.monsters_optimized import get_random_monsters
+
+    return lambda: get_random_monsters(region)
+
+
+def _route_through_all_regions(start: str) -> List[str]:
+    """start에서 갈 수 있는 모든 지역을 최단 경로로 차례로 들르고 돌아오는 경로"""
+    from systems.region import region_manager, regions
+
+    def shortest_path(source: str, target: str) -> List[str]:
+        previous = {source: None}
+        queue = deque([source])
+        while queue:
+            region = queue.popleft()
+            if region == target:
+                break
+            region_manager.current_region = region
+            for neighbor in region_manager.get_available_destinations():
+                if neighbor not in previous:
+                    previous[neighbor] = region
+                    queue.append(neighbor)
+        if target not in previous:
+            return []
+        path = [target]
+        while previous[path[-1]] is not None:
+            path.append(previous[path[-1]])
+        return path[::-1][1:]
+
+    route: List[str] = []
+    current = start
+    for target in list(regions) + [start]:
+        if target == current:
+            continue
+        path = shortest_path(current, target)
+        if path:
+            route.extend(path)
+            current = target
+    region_manager.current_region = start
+    return route
+
+
+def setup_travel() -> Callable[[], Any]:
+    """모든 지역을 도는 경로 한 바퀴 (이동 검사, 지역 정보, 이동 퀘스트 갱신)"""
+    from systems.quest_system import update_travel_quest
+    from systems.region import region_manager
+
+    player = _new_player()
+    start = region_manager.current_region
+    route = _route_through_all_regions(start)
+
+    def walk():
+        for destination in route:
+            moved, _ = region_manager.travel_to(destination)
+            if moved:
+                player.current_location = destination
+                region_manager.get_current_region_data()
+                update_travel_quest(player, destination)
+        return len(route)
+
+    return walk
+
+
+def setup_shop() -> Callable[[], Any]:
+    """상점 구매 한 번 (가격 조회, 원자적 재고 차감, 인벤토리 추가, 품절 시 재입고)"""
+    from systems.item import basic_items
+    from systems.shop_system import ShopSystem
+
+    shop_system = ShopSystem(stock_db=":memory:")
+    shop, item_name = next(
+        (shop, name) for shop in shop_system.shops.values()
+        for name in shop.items if name in basic_items
+    )
+    player = _new_player()
+
+    def purchase():
+        if not shop.has_item_in_stock(item_name):
+            shop_system.advance_time(shop.restock_interval)
+        shop.get_item_price(item_name)
+        if shop.buy_item(player, item_name):
+            player.inventory.remove_item(item_name, 1)  # 인벤토리 용량 유지
+
+    return purchase
+
+
+def setup_save_round_trip() -> Callable[[], Any]:
+    """세이브/로드 왕복 한 번 (직렬화, 원자적 쓰기, 읽기, 플레이어 복원)"""
+    from systems.save_system import SaveSystem, build_save_data, restore_player
+
+    save_dir = tempfile.TemporaryDirectory(prefix="jeonran_bench_")
+    save_system = SaveSystem(save_dir.name, compact=True)
+    player = _new_player()
+
+    def round_trip():
+        save_system.save_game(1, build_save_data(player))
+        return restore_player(save_system.load_game(1))
+
+    round_trip.save_dir = save_dir  # 동작 함수가 사라질 때 임시 디렉터리도 정리
+    return round_trip
+
+
+def default_scenarios(scale: float = 1.0) -> List[Scenario]:
+    """기본 시나리오 목록 (scale로 측정 횟수 조절)"""
+    from systems.monsters_optimized import optimized_monster_spawner
+
+    def count(n: int) -> int:
+        return max(1, int(n * scale))
+
+    optimized_monster_spawner._initialize()
+    scenarios: List[Scenario] = [
+        ("시나리오_전투_1-3마리", setup_battle, count(200)),
+    ]
+    for region in optimized_monster_spawner._region_cache:
+        scenarios.append((f"시나리오_스폰_{region}", lambda region=region: setup_spawn(region),
+                          count(SPAWNS_PER_REGION)))
+    scenarios += [
+        ("시나리오_지역_순회", setup_travel, count(200)),
+        ("시나리오_상점_구매", setup_shop, count(2000)),
+        ("시나리오_세이브_왕복", setup_save_round_trip, count(200)),
+    ]
+    return scenarios
+
+
+def run_scenarios(scenarios: Optional[List[Scenario]] = None, scale: float = 1.0,
+                  **options) -> Dict[str, Dict[str, Any]]:
+    """
+    시나리오를 차례로 실행하고 결과를 반환합니다.
+
+    options는 PerformanceBenchmark 설정(repeats, warmup, measure_memory)입니다.
+    """
+    random.seed(0)  # 스폰/전투 결과를 실행마다 같게
+    benchmark = PerformanceBenchmark(**options)
+
+    for name, setup, iterations in scenarios or default_scenarios(scale):
+        print(f"🔍 시나리오 실행 중: {name} ({iterations}회)")
+        try:
+            with headless():
+                operation = setup()
+                benchmark.run_test(name, operation, iterations)
+        except Exception as e:
+            print(f"❌ {name} 실패: {e}")
+            continue
+
+        result = benchmark.results[name]
+        result['ops_per_sec'] = round(1000 / result['median_ms'], 1) if result['median_ms'] > 0 else None
+        print(f"✅ {result['ops_per_sec']} ops/sec (중앙값 {result['median_ms']:.4f}ms, IQR {result['iqr_ms']:.4f}ms)")
+
+    return benchmark.results
+
+
+def print_scenario_table(results: Dict[str, Dict[str, Any]]):
+    """시나리오 결과 표"""
+    print(f"\n{'시나리오':<24} {'ops/sec':>12} {'중앙값(ms)':>12} {'p95(ms)':>10} {'잔류 블록/op':>12}"
+          f" {'잔류 B/op':>10} {'최대 메모리(MB)':>15}")
+    print("-" * 103)
+    for name, result in results.items():
+        ops = result.get('ops_per_sec')
+        print(f"{name:<24} {ops if ops is not None else '-':>12} {result['median_ms']:>12.4f} {result['p95_ms']:>10.4f}"
+              f" {result.get('retained_blocks_per_op', '-'):>12} {result.get('retained_bytes_per_op', '-'):>10}"
+              f" {result.get('memory_peak_mb', '-'):>15}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="전란 그리고 요괴 - 시나리오 벤치마크")
+    parser.add_argument("--scale", type=float, default=1.0, help="측정 횟수 배율 (빠른 확인은 0.1)")
+    parser.add_argument("--repeats", type=int, default=5, help="시간 측정 반복 횟수 (기본 5)")
+    parser.add_argument("--no-memory", action="store_true", help="메모리 측정 패스 생략")
+    parser.add_argument("--output", default="scenario_results.json", help="결과 JSON 파일")
+    args = parser.parse_args(argv)
+
+    print("🎮 전란 그리고 요괴 - 시나리오 벤치마크")
+    print("=" * 50)
+    results = run_scenarios(scale=args.scale, repeats=args.repeats, measure_memory=not args.no_memory)
+    print_scenario_table(results)
+
+    write_results(args.output, results)
+    print(f"\n📁 결과 파일: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
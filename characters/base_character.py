@@ -1,5 +1,10 @@
-from typing import Dict, List, Optional
-from systems.status_effect import StatusEffect, create_status_effect
+from typing import Callable, Dict, Iterable, Optional
+from systems.status_effect import STATUS_EFFECTS, resolve_status_effect
+from utility.metrics import counter, histogram
+
+# 피해 처리 계측
+DAMAGE_EVENTS = counter("damage_events_total", "피해 처리 횟수")
+DAMAGE_AMOUNT = histogram("damage_amount", "실제로 들어간 피해량 (방어력 적용 후)")
 
 class BaseCharacter:
     def __init__(self, name, max_hp, attack, defence, speed):
@@ -9,77 +14,97 @@ class BaseCharacter:
         self.attack = attack
         self.defence = defence
         self.speed = speed
-        self.status_effects: Dict[str, StatusEffect] = {}
+        self.status_effects: Dict[str, int] = {}  # 상태이상 종류 → 남은 턴
+        self._turn_can_act: Optional[bool] = None  # 이번 턴 행동 가능 여부 (턴 밖에서는 None)
 
     def is_alive(self):
         return self.current_hp > 0
     
     def can_act(self):
-        """행동 가능 여부 확인"""
+        """
+        행동 가능 여부 확인
+
+        begin_turn_phase 이후로는 그 턴에 한 번 정한 결과를 end_turn까지
+        그대로 돌려줍니다. (마비 판정을 턴마다 한 번만 굴림)
+        """
+        if self._turn_can_act is not None:
+            return self._turn_can_act
+        return self._roll_can_act()
+
+    def _roll_can_act(self) -> bool:
         # 모든 상태이상에 대해 행동 가능 여부 체크
-        for effect in self.status_effects.values():
-            if not effect.can_act():
+        for effect_id in self.status_effects:
+            if not STATUS_EFFECTS[effect_id].can_act():
                 return False
         return True
+
+    def reset_turn_state(self):
+        """턴 중에 정해 둔 행동 가능 여부를 버립니다. (전투가 턴 중간에 끝날 때)"""
+        self._turn_can_act = None
     
     def take_damage(self, amount):
         """데미지를 받고 상태이상 처리"""
         reduced = max(1, amount - self.defence)
         self.current_hp = max(0, self.current_hp - reduced)
+        DAMAGE_EVENTS.inc()
+        DAMAGE_AMOUNT.observe(reduced)
         print(f"{self.name}이(가) {reduced}의 피해를 입었다! (남은 HP:{self.current_hp})")
         
         # 피격 시 상태이상 처리 (예: 수면 해제)
         to_remove = []
-        for effect_name, effect in self.status_effects.items():
+        for effect_id in self.status_effects:
+            effect = STATUS_EFFECTS[effect_id]
             if effect.on_hit(self):
-                to_remove.append(effect_name)
-                print(f"{self.name}의 {effect_name} 상태가 해제되었다!")
+                to_remove.append(effect_id)
+                print(f"{self.name}의 {effect.name} 상태가 해제되었다!")
         
-        for effect_name in to_remove:
-            del self.status_effects[effect_name]
+        for effect_id in to_remove:
+            del self.status_effects[effect_id]
+        if to_remove and self._turn_can_act is False:
+            # 깨어났으면 남은 상태이상으로 이번 턴 행동 여부를 다시 정함
+            self._turn_can_act = self._roll_can_act()
 
-    def apply_status(self, effect_type: str) -> bool:
-        """상태이상 적용"""
-        effect = create_status_effect(effect_type)
+    def apply_status(self, effect_type: str, duration: Optional[int] = None) -> bool:
+        """
+        상태이상 적용 (공유 정의를 쓰므로 남은 턴만 기록)
+
+        Args:
+            effect_type: 상태이상 종류 ("random"이면 무작위)
+            duration: 지속 턴 수 (없으면 상태이상 기본값)
+        """
+        effect = resolve_status_effect(effect_type)
         if not effect:
             return False
-            
-        if effect_type in self.status_effects:
+        
+        turns = effect.duration if duration is None else duration
+        if effect.id in self.status_effects:
             # 이미 있는 상태이상이면 지속시간만 초기화
-            self.status_effects[effect_type].extend_duration()
-            print(f"{self.name}의 {effect_type} 상태가 연장되었다!")
+            self.status_effects[effect.id] = turns
+            print(f"{self.name}의 {effect.name} 상태가 연장되었다!")
         else:
             # 새로운 상태이상 추가
-            self.status_effects[effect_type] = effect
-            print(f"{self.name}에게 {effect.get_info()} 상태가 적용되었다!")
+            self.status_effects[effect.id] = turns
+            print(f"{self.name}에게 {effect.get_info(turns)} 상태가 적용되었다!")
+        if self._turn_can_act:
+            # 턴 중에 걸린 상태이상은 이번 턴 행동 여부에 바로 반영
+            self._turn_can_act = effect.can_act()
         return True
 
     def end_turn(self):
-        """턴 종료 시 상태이상 처리"""
-        to_remove = []
-        
-        # 모든 상태이상 효과 적용
-        for effect_name, effect in self.status_effects.items():
-            # 상태이상 효과 적용
-            message = effect.apply_effect(self)
-            if message:
-                print(message)
-            
-            # 지속시간 감소
-            if effect.decrease_duration():
-                to_remove.append(effect_name)
-        
-        # 종료된 상태이상 제거
-        for effect_name in to_remove:
-            print(f"{self.name}의 {effect_name} 상태가 해제되었다!")
-            del self.status_effects[effect_name]
+        """턴 종료 시 상태이상 처리 (혼자서 end_turn_phase를 거침)"""
+        end_turn_phase((self,))
+
+    def on_turn_end(self):
+        """상태이상 처리가 끝난 뒤 호출되는 턴 종료 훅 (자원 회복 등)"""
+        pass
 
     def get_status_effects_info(self) -> str:
         """현재 상태이상 정보 반환"""
         if not self.status_effects:
             return "상태이상 없음"
         
-        return "\n".join(effect.get_description() for effect in self.status_effects.values())
+        return "\n".join(STATUS_EFFECTS[effect_id].get_description(remaining)
+                         for effect_id, remaining in self.status_effects.items())
 
     def attack_target(self, target):
         """대상 공격"""
@@ -88,4 +113,60 @@ class BaseCharacter:
             return
             
         print(f"{self.name}이(가) {target.name}을(를) 공격했다!")
-        target.take_damage(self.attack)
\ No newline at end of file
+        target.take_damage(self.attack)
+
+
+def begin_turn_phase(combatants: Iterable[BaseCharacter]):
+    """
+    턴을 시작하며 전투원마다 이번 턴 행동 가능 여부를 한 번 정해 둡니다.
+
+    정해 둔 값은 end_turn_phase(또는 reset_turn_state)까지 can_act()가
+    그대로 돌려주므로, 같은 턴 안의 여러 검사가 서로 다른 판정을 내지 않습니다.
+    """
+    for combatant in combatants:
+        combatant._turn_can_act = combatant._roll_can_act()
+
+
+def end_turn_phase(combatants: Iterable[BaseCharacter],
+                   on_defeat: Optional[Callable[[BaseCharacter], None]] = None):
+    """
+    여러 전투원의 턴 종료 처리를 한 번에 합니다.
+
+    모든 전투원의 상태이상 효과를 전투원 순서대로 먼저 적용한 뒤, 전투원마다
+    남은 턴을 줄이고 끝난 상태이상을 지웁니다. 그 뒤 전투원마다 on_turn_end()를
+    호출하고 이번 턴에 정해 둔 행동 가능 여부를 버립니다.
+
+    on_defeat가 있으면 상태이상 피해로 쓰러진 전투원을, 끝난 상태이상을 지우기
+    전에 알려 줍니다. (처치 시점의 상태이상이 남아 있도록)
+    """
+    combatants = list(combatants)
+    alive_before = [combatant.is_alive() for combatant in combatants]
+
+    # 모든 상태이상 효과 적용 (전투원 순서대로)
+    for combatant in combatants:
+        for effect_id in combatant.status_effects:
+            message = STATUS_EFFECTS[effect_id].apply_effect(combatant)
+            if message:
+                print(message)
+
+    if on_defeat:
+        for combatant, was_alive in zip(combatants, alive_before):
+            if was_alive and not combatant.is_alive():
+                on_defeat(combatant)
+
+    # 남은 턴 반영, 종료된 상태이상 제거
+    for combatant in combatants:
+        status_effects = combatant.status_effects
+        to_remove = []
+        for effect_id, turns in status_effects.items():
+            if turns > 1:
+                status_effects[effect_id] = turns - 1
+            else:
+                to_remove.append(effect_id)
+        for effect_id in to_remove:
+            print(f"{combatant.name}의 {STATUS_EFFECTS[effect_id].name} 상태가 해제되었다!")
+            del status_effects[effect_id]
+
+    for combatant in combatants:
+        combatant._turn_can_act = None
+        combatant.on_turn_end()
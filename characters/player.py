@@ -4,9 +4,20 @@ from skills.mage_skills import mage_skills
 from skills.rogue_skills import rogue_skills
 from systems.inventory import Inventory
 from systems.item import basic_items
-from systems.weapon_system import WeaponSystem, Weapon
-from systems.quest_system import Quest, quest_system
-from typing import Optional, Dict, List, Any
+from systems.weapon_system import WeaponSystem, Weapon, WeaponInstance, get_weapon_system
+from systems.quest_system import Quest, QuestTracker, quest_system, update_collect_quest
+from systems.experience import exp_system
+from systems.status_effect import STATUS_EFFECTS
+from typing import Optional, Dict, List, Any, Iterable, Set
+
+# 세이브 섹션 (자동 저장은 바뀐 섹션만 저널에 기록)
+SAVE_SECTIONS = ("stats", "inventory", "equipped_weapon", "quests", "location", "status_effects")
+
+# 마지막 저장 시점의 값과 비교해 바뀌었는지 판단하는 섹션.
+# 전투 중 매번 대입되는 HP/MP 등에 대입마다 표시하는 비용을 붙이지 않기 위해
+# 자동 저장 때 한 번 비교합니다. 나머지 섹션(인벤토리, 퀘스트)은 변경 시점에
+# mark_dirty()로 표시됩니다.
+COMPARED_SECTIONS = ("stats", "equipped_weapon", "location", "status_effects")
 
 class Player(BaseCharacter):
     # --- Static attribute declarations for type checkers ---
@@ -19,6 +30,7 @@ class Player(BaseCharacter):
     inventory: 'Inventory'
     weapon_system: 'WeaponSystem'
     equipped_weapon: Optional['Weapon']
+    equipped_weapon_state: Optional['WeaponInstance']
     active_quests: Dict[str, Dict[str, Any]]
     completed_quests: List[str]
 
@@ -55,7 +67,7 @@ class Player(BaseCharacter):
         super().__init__(name, max_hp, attack, defence, speed)
 
         self.level = 1
-        self.exp = 0
+        self.exp = 0  # 총 누적 경험치 (ExperienceSystem 곡선 기준)
         self.mp = max_mp  # 초기 MP는 최대 MP로 설정
         self.max_mp = max_mp  # 최대 MP 속성 추가
         self.current_location = "한양"  # 기본 시작 위치
@@ -74,14 +86,133 @@ class Player(BaseCharacter):
         # 인벤토리 초기화
         self.inventory = Inventory()
         
-        # 무기 시스템 초기화
-        self.weapon_system = WeaponSystem()
-        self.equipped_weapon = None  # 현재 장착한 무기
+        # 무기 시스템 (공유 레지스트리)
+        self.weapon_system = get_weapon_system()
+        self.equipped_weapon = None  # 현재 장착한 무기 (공유 Weapon)
+        self.equipped_weapon_state = None  # 장착 무기의 내구도/강화 상태
         self.base_attack = attack    # 기본 공격력 저장 (무기 없을 때)
 
         # 퀘스트 관련 초기화
         self.active_quests = {}
         self.completed_quests = []
+        self.quest_tracker = QuestTracker(self)
+        self.inventory.add_change_listener(self._on_inventory_change)
+
+        # 새 캐릭터는 모든 섹션이 저장되지 않은 상태
+        self._dirty: Set[str] = set(SAVE_SECTIONS)
+        self._saved_sections: Dict[str, Any] = {}  # COMPARED_SECTIONS의 마지막 저장 상태
+
+    def mark_dirty(self, section: str):
+        """내용이 바뀐 섹션을 표시합니다. (인벤토리, 퀘스트 진행도 등)"""
+        self._dirty.add(section)
+
+    def dirty_sections(self) -> Set[str]:
+        """
+        마지막 저장 이후 바뀐 세이브 섹션을 반환합니다.
+
+        COMPARED_SECTIONS는 마지막 저장 시점의 상태와 비교하고, 나머지는
+        mark_dirty()로 표시된 섹션입니다.
+        """
+        dirty = set(self._dirty)
+        for section in COMPARED_SECTIONS:
+            if section not in dirty and self._section_state(section) != self._saved_sections.get(section):
+                dirty.add(section)
+        return dirty
+
+    def clear_dirty(self):
+        """현재 상태가 저장되었음을 표시합니다."""
+        self._dirty.clear()
+        self._saved_sections = {section: self._section_state(section) for section in COMPARED_SECTIONS}
+
+    def _on_inventory_change(self, event: str, name: str, quantity: int):
+        """인벤토리 변경을 표시하고 전리품·줍기로 얻은 아이템을 수집 퀘스트 진행도에 반영합니다."""
+        self._dirty.add("inventory")
+        if event == "collect_item":
+            update_collect_quest(self, name, quantity)
+
+    def _section_state(self, section: str) -> Any:
+        """세이브 섹션 하나의 상태를 반환합니다."""
+        if section == "stats":
+            return {
+                "level": self.level,
+                "exp": self.exp,
+                "hp": self.current_hp,
+                "max_hp": self.max_hp,
+                "mp": self.mp,
+                "max_mp": self.max_mp,
+                "base_attack": self.base_attack,
+                "defence": self.defence,
+                "speed": self.speed,
+                "gold": self.gold,
+            }
+        if section == "inventory":
+            return self.inventory.to_state()
+        if section == "equipped_weapon":
+            return self.equipped_weapon_state.to_state() if self.equipped_weapon_state else None
+        if section == "quests":
+            return self.quest_tracker.to_state()
+        if section == "location":
+            return {"current": self.current_location}
+        if section == "status_effects":
+            # 상태이상은 종류별 남은 턴 (효과 정의는 공유 테이블)
+            return dict(self.status_effects)
+        raise KeyError(section)
+
+    def to_state(self, sections: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        저장용 상태 딕셔너리를 반환합니다.
+        
+        JSON/msgpack으로 그대로 직렬화할 수 있는 값만 담으며, 섹션 구성은
+        세이브 스키마 v2(stats, inventory, equipped_weapon, quests, location,
+        status_effects)를 따릅니다. sections를 주면 해당 섹션만 담습니다.
+        """
+        if sections is not None:
+            return {section: self._section_state(section) for section in sections}
+        
+        state: Dict[str, Any] = {"name": self.name, "job": self.job}
+        for section in SAVE_SECTIONS:
+            state[section] = self._section_state(section)
+        return state
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "Player":
+        """to_state()로 만든 상태에서 플레이어를 복원합니다."""
+        player = cls(state["name"], state["job"])
+        
+        stats = state.get("stats", {})
+        player.level = stats.get("level", player.level)
+        player.exp = stats.get("exp", player.exp)
+        player.max_hp = stats.get("max_hp", player.max_hp)
+        player.current_hp = stats.get("hp", player.max_hp)
+        player.max_mp = stats.get("max_mp", player.max_mp)
+        player.mp = stats.get("mp", player.max_mp)
+        player.base_attack = stats.get("base_attack", player.base_attack)
+        player.defence = stats.get("defence", player.defence)
+        player.speed = stats.get("speed", player.speed)
+        player.gold = stats.get("gold", player.gold)
+        
+        player.inventory = Inventory.from_state(state.get("inventory", {}))
+        player.inventory.add_change_listener(player._on_inventory_change)
+        
+        weapon_state = state.get("equipped_weapon")
+        if weapon_state:
+            instance = WeaponInstance.from_state(weapon_state)
+            if instance.weapon is not None:
+                player.equipped_weapon = instance.weapon
+                player.equipped_weapon_state = instance
+            else:
+                print(f"⚠️ 저장된 무기를 찾을 수 없습니다: {instance.weapon_id}")
+        player._update_attack()
+        
+        player.quest_tracker.load_state(state.get("quests", {}))
+        player.current_location = state.get("location", {}).get("current", player.current_location)
+        
+        for effect_id, remaining in state.get("status_effects", {}).items():
+            if effect_id in STATUS_EFFECTS:
+                player.status_effects[effect_id] = remaining
+        
+        player.clear_dirty()
+        return player
     
     # 속성 별칭 제공 (type checker용)
     @property
@@ -110,10 +241,7 @@ class Player(BaseCharacter):
 
     def show_exp_progress(self):
         """경험치 진행 상황을 간단히 출력합니다."""
-        progress = int((self.exp / (self.level * 100)) * 20)
-        bar = "■" * progress + "□" * (20 - progress)
-        pct = (self.exp / (self.level * 100)) * 100
-        print(f"EXP [{bar}] {pct:.1f}%")
+        print(f"EXP {exp_system.get_exp_progress_bar(self.exp)}")
     
     def give_starting_items(self):
         """시작 아이템 지급"""
@@ -121,48 +249,49 @@ class Player(BaseCharacter):
         self.inventory.add_item("소형 약초", 3)
         self.inventory.add_item("마력 물약", 2)
     
-    def end_turn(self):
-        # 부모 클래스의 상태이상 처리
-        super().end_turn()
-        
-        # 레벨에 따른 최대 MP 업데이트
-        self.max_mp = 30 + 5 * (self.level - 1)
+    def on_turn_end(self):
+        """턴 종료 시 마력 회복"""
         old_mp = self.mp
         self.mp = min(self.mp + 2, self.max_mp)
         if self.mp > old_mp:
             print(f"{self.name}의 마력이 {self.mp - old_mp}만큼 회복되었다 (MP: {self.mp}/{self.max_mp})")
     
     def gain_exp(self, amount):
-        """경험치 획득 및 레벨업 처리"""
-        # 지역별 경험치 보너스 적용 (향후 구현)
-        self.exp += amount
+        """경험치 획득 및 레벨업 처리
+        
+        ExperienceSystem의 150레벨 곡선을 사용합니다. 한 번에 여러 레벨이
+        오르더라도 레벨 계산과 스탯 보너스 적용은 한 번에 처리됩니다.
+        
+        Returns:
+            dict: ExperienceSystem.add_experience 결과
+        """
+        result = exp_system.add_experience(self.exp, amount)
+        self.exp = result["new_total_exp"]
         print(f"경험치 {amount} 획득! (총 경험치: {self.exp})")
         
-        # 레벨업 체크 (경험치 100마다 레벨업)
-        while self.exp >= self.level * 100:
-            self.exp -= self.level * 100
-            self.level += 1
-            
-            # 레벨업 보상
-            hp_increase = 10
-            attack_increase = 2
-            defence_increase = 1
-            mp_increase = 5
-            
-            self.max_hp += hp_increase
-            self.current_hp += hp_increase  # 레벨업 시 HP도 회복
-            self.attack += attack_increase
-            self.defence += defence_increase
-            
-            print(f"\n🎉 레벨업! {self.level-1} → {self.level}")
-            print(f"HP +{hp_increase} (최대 HP: {self.max_hp})")
-            print(f"공격력 +{attack_increase} (현재: {self.attack})")
-            print(f"방어력 +{defence_increase} (현재: {self.defence})")
-            print(f"최대 MP +{mp_increase} (현재: 30 + {mp_increase * (self.level-1)})")
-            
-            # MP 최대치도 증가
-            self.max_mp = 30 + mp_increase * (self.level - 1)
-            self.mp = min(self.mp + mp_increase, self.max_mp)
+        if not result["leveled_up"]:
+            return result
+        
+        old_level = self.level
+        self.level = result["new_level"]
+        
+        # 레벨업 보상 (여러 레벨분을 한 번에 적용)
+        bonuses = result["stat_bonuses"]
+        self.max_hp += bonuses["hp"]
+        self.current_hp += bonuses["hp"]  # 레벨업 시 HP도 회복
+        self.base_attack += bonuses["attack"]
+        self.defence += bonuses["defense"]
+        self.max_mp += bonuses["mp"]
+        self.mp = min(self.mp + bonuses["mp"], self.max_mp)
+        self._update_attack()
+        self.quest_tracker.on_level_up(self.level)
+        
+        print(f"\n🎉 레벨업! {old_level} → {self.level}")
+        print(f"HP +{bonuses['hp']} (최대 HP: {self.max_hp})")
+        print(f"공격력 +{bonuses['attack']} (현재: {self.attack})")
+        print(f"방어력 +{bonuses['defense']} (현재: {self.defence})")
+        print(f"최대 MP +{bonuses['mp']} (현재: {self.max_mp})")
+        return result
     
     def use_item(self, item_name):
         """아이템 사용"""
@@ -180,10 +309,15 @@ class Player(BaseCharacter):
             return True
         return False
     
-    def equip_weapon(self, weapon: Weapon) -> bool:
-        """무기를 장착합니다."""
+    def equip_weapon(self, weapon: Weapon, state: Optional[WeaponInstance] = None) -> bool:
+        """무기를 장착합니다. state가 없으면 새 소유 상태를 만듭니다."""
+        # 다른 무기의 소유 상태를 붙이면 공격력이 엉뚱한 무기 기준으로 계산됨
+        if state is not None and state.weapon_id != weapon.id:
+            print(f"❌ {weapon.name}의 상태가 아닙니다. (상태의 무기: {state.weapon_id})")
+            return False
+        
         # 직업 제한 확인
-        if not weapon.can_be_used_by(self.job):
+        if weapon.attack_for(self.job) is None:
             print(f"❌ {self.job}은(는) {weapon.name}을(를) 사용할 수 없습니다.")
             return False
         
@@ -194,6 +328,7 @@ class Player(BaseCharacter):
             print(f"⚔️ {weapon.name}을(를) 장착했습니다!")
         
         self.equipped_weapon = weapon
+        self.equipped_weapon_state = state or WeaponInstance(weapon.id)
         self._update_attack()
         return True
     
@@ -205,19 +340,18 @@ class Player(BaseCharacter):
         
         print(f"🔄 {self.equipped_weapon.name}을(를) 해제했습니다.")
         self.equipped_weapon = None
+        self.equipped_weapon_state = None
         self._update_attack()
         return True
     
     def _update_attack(self):
         """무기에 따른 공격력을 업데이트합니다."""
-        if self.equipped_weapon:
-            try:
-                weapon_attack = self.equipped_weapon.get_effective_attack(self.job)
-                self.attack = self.base_attack + weapon_attack
-            except ValueError as e:
-                print(f"⚠️ 무기 장착 오류: {e}")
-                self.attack = self.base_attack
+        weapon_attack = self.equipped_weapon_state.attack_for(self.job) if self.equipped_weapon_state else None
+        if weapon_attack is not None:
+            self.attack = self.base_attack + weapon_attack
         else:
+            if self.equipped_weapon:
+                print(f"⚠️ 무기 장착 오류: {self.job}은(는) {self.equipped_weapon.name}을(를) 사용할 수 없습니다.")
             self.attack = self.base_attack
     
     def get_weapon_info(self) -> str:
@@ -226,23 +360,22 @@ class Player(BaseCharacter):
             return "❌ 장착된 무기가 없습니다."
         
         weapon = self.equipped_weapon
-        try:
-            effective_attack = weapon.get_effective_attack(self.job)
-            info = f"⚔️ **장착 중**: {weapon.name}\n"
-            info += f"   🏷️ 타입: {weapon.type}\n"
-            info += f"   ⚡ 기본 공격력: {weapon.attack}\n"
-            
-            if effective_attack != weapon.attack:
-                info += f"   📊 효과적 공격력: {effective_attack} ({self.job} 보정)\n"
-            
-            if weapon.special_effect:
-                info += f"   ✨ 특수 효과: {weapon.special_effect}\n"
-            
-            info += f"   💰 가치: {weapon.price}전"
-            return info
-            
-        except ValueError as e:
-            return f"❌ 무기 오류: {e}"
+        effective_attack = weapon.attack_for(self.job)
+        if effective_attack is None:
+            return f"❌ 무기 오류: {self.job}은(는) {weapon.name}을(를) 사용할 수 없습니다."
+        
+        info = f"⚔️ **장착 중**: {weapon.name}\n"
+        info += f"   🏷️ 타입: {weapon.type}\n"
+        info += f"   ⚡ 기본 공격력: {weapon.attack}\n"
+        
+        if effective_attack != weapon.attack:
+            info += f"   📊 효과적 공격력: {effective_attack} ({self.job} 보정)\n"
+        
+        if weapon.special_effect:
+            info += f"   ✨ 특수 효과: {weapon.special_effect}\n"
+        
+        info += f"   💰 가치: {weapon.price}전"
+        return info
     
     def show_equipment_status(self):
         """장비 상태를 표시합니다."""
@@ -280,7 +413,7 @@ class Player(BaseCharacter):
             return False
         
         # 직업 제한 확인
-        if not weapon.can_be_used_by(self.job):
+        if weapon.attack_for(self.job) is None:
             print(f"❌ {self.job}은(는) {weapon.name}을(를) 사용할 수 없습니다.")
             return False
         
@@ -290,19 +423,7 @@ class Player(BaseCharacter):
 
     def accept_quest(self, quest_id: str) -> bool:
         """퀘스트를 수락합니다."""
-        if quest_id in self.active_quests or quest_id in self.completed_quests:
-            print("이미 수락했거나 완료한 퀘스트입니다.")
-            return False
-        
-        quest = quest_system.get_quest(quest_id)
-        if not quest:
-            print("존재하지 않는 퀘스트입니다.")
-            return False
-            
-        self.active_quests[quest_id] = {"progress": {}} # 진행상황 초기화
-        print(f"\n[퀘스트 수락] {quest.title}")
-        print(quest.get_details())
-        return True
+        return quest_system.accept_quest(self, quest_id)
 
     def show_quest_log(self):
         """퀘스트 로그를 표시합니다."""
@@ -310,15 +431,9 @@ class Player(BaseCharacter):
         print("📖 퀘스트 로그")
         print("="*50)
 
-        if not self.active_quests:
-            print("\n진행 중인 퀘스트가 없습니다.")
-        else:
+        if self.active_quests:
             print("\n--- 진행 중인 퀘스트 ---")
-            for quest_id in self.active_quests:
-                quest = quest_system.get_quest(quest_id)
-                if quest:
-                    print(f"\n{quest.get_summary()}")
-                    # 여기에 상세 진행상황을 표시할 수 있습니다.
+        quest_system.display_active_quests(self)
         
         if not self.completed_quests:
             print("\n완료한 퀘스트가 없습니다.")
@@ -0,0 +1,27 @@
+"""
+전란 그리고 요괴 - 조선시대 RPG
+파일: config.py
+설명: 실행 중에 만들어지는 파일(세이브, 재고 DB 등)의 위치 설정
+"""
+import os
+from pathlib import Path
+
+# 세이브 디렉터리를 바꾸는 환경 변수 (없으면 프로젝트 루트)
+SAVE_DIR_ENV = "JEONRAN_SAVE_DIR"
+SAVE_DIR = Path(os.environ.get(SAVE_DIR_ENV) or Path(__file__).resolve().parent)
+
+
+def runtime_path(filename: str) -> str:
+    """
+    세이브 디렉터리 안의 실행 파일 경로 (게임을 어디서 실행하든 같은 위치)
+
+    임포트 시점에 기본값으로 쓰이므로 경로만 만들고 디스크는 건드리지 않습니다.
+    디렉터리는 파일을 여는 쪽에서 ensure_parent_dir()로 만듭니다.
+    """
+    return str(SAVE_DIR / filename)
+
+
+def ensure_parent_dir(path: str) -> None:
+    """파일을 열기 전에 상위 디렉터리를 만듭니다. (SQLite ":memory:"는 제외)"""
+    if path != ":memory:":
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
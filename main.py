@@ -3,6 +3,9 @@ from characters.enemy import Enemy
 from systems.battle import start_battle
 from systems.monsters import monster_spawner
 from systems.region import region_manager
+from systems.experience import exp_system
+from systems.shop_system import advance_shop_time
+from systems.quest_system import initialize_quests, update_travel_quest
 
 def display_game_menu():
     """메인 게임 메뉴 출력"""
@@ -27,7 +30,7 @@ def rest_at_location(player):
     if current_region["features"].get("거점") or current_region["features"].get("여관"):
         # 안전한 지역에서 완전 회복
         player.current_hp = player.max_hp
-        max_mp = 30 + 5 * (player.level - 1)
+        max_mp = player.max_mp
         player.mp = max_mp
         print(f"\n{current_region['name']}에서 푹 쉬었습니다.")
         print("체력과 마력이 완전히 회복되었습니다!")
@@ -42,7 +45,7 @@ def rest_at_location(player):
         heal_amount = max(10, player.max_hp // 4)
         player.current_hp = min(player.current_hp + heal_amount, player.max_hp)
         mp_recovery = 5
-        max_mp = 30 + 5 * (player.level - 1)
+        max_mp = player.max_mp
         player.mp = min(player.mp + mp_recovery, max_mp)
         
         print(f"\n{current_region['name']}에서 잠시 쉬었습니다.")
@@ -132,6 +135,8 @@ def travel_menu(player):
             print(f"\n{message}")
             
             if success:
+                player.current_location = destination
+                update_travel_quest(player, destination)
                 print(f"\n=== {destination} ===")
                 print(region_manager.get_region_info())
         else:
@@ -215,17 +220,17 @@ def weapon_equip_menu(player):
 
 def show_player_status(player):
     """플레이어 상태 출력"""
-    max_mp = 30 + 5 * (player.level - 1)
+    _, exp_in_level, exp_remaining, _ = exp_system.get_progress_to_next_level(player.exp)
     print(f"\n=== {player.name} ({player.job}) ===")
     print(f"레벨: {player.level}")
-    print(f"경험치: {player.exp}/{player.level * 100}")
+    print(f"경험치: {exp_in_level}/{exp_in_level + exp_remaining}")
     print(f"체력: {player.current_hp}/{player.max_hp}")
-    print(f"마력: {player.mp}/{max_mp}")
+    print(f"마력: {player.mp}/{player.max_mp}")
     print(f"공격력: {player.attack} | 방어력: {player.defence} | 속도: {player.speed}")
     
     # 장착 무기 정보
     if player.equipped_weapon:
-        print(f"장착 무기: {player.equipped_weapon.name} (공격력: {player.equipped_weapon.get_effective_attack(player.job)})")
+        print(f"장착 무기: {player.equipped_weapon.name} (공격력: {player.equipped_weapon.attack_for(player.job)})")
     else:
         print("장착 무기: 없음")
     
@@ -259,6 +264,7 @@ def main_game_loop(player):
     while True:
         display_game_menu()
         choice = input("\n선택> ")
+        advance_shop_time()
         
         if choice == "1":  # 지역 탐험
             if not explore_region(player):
@@ -269,7 +275,7 @@ def main_game_loop(player):
             travel_menu(player)
         
         elif choice == "3":  # 사람들과 대화
-            region_manager.interact_with_npcs()
+            region_manager.interact_with_npcs(player)
         
         elif choice == "4":  # 장비 관리 🆕
             equipment_menu(player)
@@ -308,6 +314,8 @@ def main():
     print("조선시대 양란 직후, 요괴와 원혼이 들끓는 혼란한 시대...")
     print("당신은 이 혼란을 수습할 영웅이 될 수 있을까요?\n")
     
+    initialize_quests()
+    
     name = input("당신의 이름을 알려주시오> ")
 
     print("\n직업을 선택하시오")
@@ -10,7 +10,12 @@ from systems.battle import start_battle
 from systems.data_manager import initialize_data
 from systems.monsters_optimized import get_random_monsters
 from systems.region import region_manager
+from systems.shop_system import advance_shop_time
+from systems.quest_system import initialize_quests
+from utility import metrics
+from utility.sampling_profiler import get_sampling_profiler, install_signal_toggle, toggle_profiling
 from typing import Optional, Dict, Any
+import sys
 import time
 
 
@@ -39,6 +44,7 @@ class GameStateManager:
         
         # 데이터 초기화 (한 번만 실행)
         initialize_data()
+        initialize_quests()
         
         # 메인 메뉴
         self.show_main_menu()
@@ -131,6 +137,9 @@ class GameStateManager:
                 self.performance_stats['menu_loads'] += 1
                 self.last_action_time = time.time()
                 
+                # 행동 한 번 = 게임 시간 1틱 (상점 재입고 등)
+                advance_shop_time()
+                
                 if choice == "1":
                     if self.explore_region_optimized():
                         self.performance_stats['battles_fought'] += 1
@@ -240,6 +249,9 @@ class GameStateManager:
                 print(f"\n🌟 {current_region}의 특별한 기운으로 경험치가 {int((exp_bonus-1)*100)}% 추가!")
             
             self.player.gain_exp(final_exp)
+            
+            from systems.save_system import autosave
+            autosave(self.player)
             return True
         elif battle_result == "player_escaped":
             print("\n도망에 성공했습니다!")
@@ -265,6 +277,11 @@ class GameStateManager:
         # 캐시 통계
         print(f"메뉴 캐시 크기: {len(self._menu_cache)}")
         print(f"지역 캐시 크기: {len(self._region_cache)}")
+        
+        # 핫 패스 계측 (설정에서 켰을 때만 수집)
+        if metrics.metrics_enabled():
+            print("\n📈 계측 지표")
+            print(metrics.render_text())
     
     def clear_caches(self):
         """캐시 초기화"""
@@ -275,9 +292,8 @@ class GameStateManager:
     def load_game(self) -> bool:
         """게임 불러오기"""
         try:
-            from systems.save_system import SaveSystem
-            save_system = SaveSystem()
-            loaded_player = save_system.load_game()
+            from systems.save_system import SaveSystemWrapper
+            loaded_player = SaveSystemWrapper().load_game()
             if loaded_player:
                 self.player = loaded_player
                 print("게임을 성공적으로 불러왔습니다!")
@@ -296,7 +312,11 @@ class GameStateManager:
             print("=" * 30)
             print("1. 캐시 초기화")
             print("2. 성능 통계 초기화")
-            print("3. 돌아가기")
+            print(f"3. 계측 {'끄기' if metrics.metrics_enabled() else '켜기'}")
+            print("4. 계측 지표 파일로 내보내기 (Prometheus 형식)")
+            profiler = get_sampling_profiler()
+            print(f"5. 샘플링 프로파일러 {'중지 (결과 저장)' if profiler.running else '시작'}")
+            print("6. 돌아가기")
             
             choice = input("\n선택> ").strip()
             
@@ -309,8 +329,25 @@ class GameStateManager:
                     'regions_visited': 0,
                     'total_playtime': 0.0
                 }
+                metrics.registry.reset()
                 print("🔄 성능 통계가 초기화되었습니다.")
             elif choice == "3":
+                if metrics.metrics_enabled():
+                    metrics.disable_metrics()
+                    print("⏸️ 계측을 껐습니다.")
+                else:
+                    metrics.enable_metrics()
+                    print("▶️ 계측을 켰습니다.")
+            elif choice == "4":
+                path = input("파일 경로 (기본 metrics.prom)> ").strip() or "metrics.prom"
+                try:
+                    metrics.write_prometheus(path)
+                    print(f"✅ 지표를 저장했습니다: {path}")
+                except OSError as e:
+                    print(f"❌ 지표 저장 실패: {e}")
+            elif choice == "5":
+                toggle_profiling()
+            elif choice == "6":
                 break
             else:
                 print("올바른 번호를 입력해주세요.")
@@ -438,9 +475,8 @@ class GameStateManager:
             
             if choice == "1":
                 try:
-                    from systems.save_system import SaveSystem
-                    save_system = SaveSystem()
-                    if save_system.save_game(self.player):
+                    from systems.save_system import SaveSystemWrapper
+                    if SaveSystemWrapper().save_game(self.player):
                         print("게임이 저장되었습니다. 안녕히 가세요!")
                         exit()
                     else:
@@ -483,7 +519,24 @@ class GameStateManager:
 
 
 def main():
-    """최적화된 메인 함수"""
+    """
+    최적화된 메인 함수
+    
+    `--profile-startup`을 주면 게임 대신 시작 시간 프로파일을 출력합니다.
+    (나머지 인자는 utility.startup_profiler로 전달, 예: --top 20, --json)
+    
+    JEONRAN_METRICS=1이면 계측을 켜고 시작하며, JEONRAN_METRICS_FILE을
+    주면 그 경로에 Prometheus 형식 지표를 주기적으로 씁니다.
+    실행 중에 SIGUSR2를 보내면 샘플링 프로파일러가 켜지고 꺼집니다.
+    """
+    if "--profile-startup" in sys.argv[1:]:
+        from utility.startup_profiler import main as profile_startup_main
+        
+        args = [arg for arg in sys.argv[1:] if arg != "--profile-startup"]
+        sys.exit(profile_startup_main(args))
+    
+    metrics.start_prometheus_writer()
+    install_signal_toggle()
     game_manager = GameStateManager()
     game_manager.start_game()
 
@@ -1,25 +1,60 @@
 from skills.base_skill import Skill
+from characters.base_character import begin_turn_phase, end_turn_phase
+from systems.quest_system import update_kill_quest
+from systems.status_effect import STATUS_EFFECTS
+from utility.metrics import SECONDS_BUCKETS, counter, histogram
 import random
 
+# 전투 계측
+BATTLE_TURNS = counter("battle_turns_total", "진행된 전투 턴 수")
+BATTLE_RESULTS = counter("battle_results_total", "전투 결과별 횟수", ("result",))
+ENEMY_PHASE_SECONDS = histogram("battle_enemy_phase_seconds", "적 턴 처리 시간", SECONDS_BUCKETS)
+
+
+def record_defeated_enemies(player, enemies, defeated):
+    """새로 쓰러진 적을 퀘스트 진행도에 반영합니다. (defeated: 이미 반영한 적 집합)"""
+    for enemy in enemies:
+        if not enemy.is_alive() and id(enemy) not in defeated:
+            defeated.add(id(enemy))
+            statuses = [STATUS_EFFECTS[effect_id].name for effect_id in enemy.status_effects]
+            update_kill_quest(player, enemy.name, statuses)
+
 def start_battle(player, enemies):
     """전투 시스템 - 1-3마리 몬스터와의 전투 지원"""
     # 단일 몬스터를 리스트로 변환 (기존 호환성)
     if not isinstance(enemies, list):
         enemies = [enemies]
     
+    try:
+        result = _run_battle(player, enemies)
+    finally:
+        # 턴 중간에 끝나도 (도주, 예외) 정해 둔 행동 가능 여부가 다음 전투로 넘어가지 않도록
+        for combatant in (player, *enemies):
+            combatant.reset_turn_state()
+    BATTLE_RESULTS.labels(result).inc()
+    return result
+
+def _run_battle(player, enemies):
     print("\n--- 전투 시작 ---")
     if len(enemies) == 1:
         print(f"{enemies[0].name}이(가) 나타났다")
     else:
         print(f"{len(enemies)}마리의 요괴와 전투가 시작되었다!")
 
+    defeated = set()
+
+    def record_tick_defeat(combatant):
+        if combatant is not player:
+            record_defeated_enemies(player, [combatant], defeated)
+
     while player.is_alive() and any(enemy.is_alive() for enemy in enemies):
+        BATTLE_TURNS.inc()
         print("\n[플레이어 턴]")
-        max_mp = 30 + 5 * (player.level - 1)
-        print(f"{player.name} (HP: {player.current_hp}/{player.max_hp}, MP:{player.mp}/{max_mp})")
+        print(f"{player.name} (HP: {player.current_hp}/{player.max_hp}, MP:{player.mp}/{player.max_mp})")
         
         # 살아있는 적들만 표시
         alive_enemies = [enemy for enemy in enemies if enemy.is_alive()]
+        begin_turn_phase([player, *alive_enemies])
         print("적 상태:")
         for i, enemy in enumerate(alive_enemies, 1):
             print(f"  {i}. {enemy.display_name} (HP: {enemy.current_hp}/{enemy.max_hp})")
@@ -37,6 +72,7 @@ def start_battle(player, enemies):
                 return "player_escaped"
         
         # 죽은 적들 확인
+        record_defeated_enemies(player, enemies, defeated)
         alive_enemies = [enemy for enemy in enemies if enemy.is_alive()]
         if not alive_enemies:
             print(f"모든 요괴를 쓰러뜨렸다!")
@@ -44,25 +80,26 @@ def start_battle(player, enemies):
 
         print("\n[적 턴]")
         # 살아있는 적들의 행동
-        for enemy in alive_enemies:
-            if not enemy.can_act():
-                if "freeze" in enemy.status_effects:
-                    print(f"{enemy.display_name}은(는) 빙결 상태로 행동할 수 없다!")
-                elif "stun" in enemy.status_effects:
-                    print(f"{enemy.display_name}은(는) 기절 상태로 행동할 수 없다!")
-            else:
-                print(f"\n{enemy.display_name}의 턴:")
-                enemy.choose_action(player)
-                
-                # 플레이어가 죽었는지 확인
-                if not player.is_alive():
-                    print("\n당신은 패배하였습니다...")
-                    return "player_defeat"
-
-        # 턴 종료 처리
-        player.end_turn()
-        for enemy in alive_enemies:
-            enemy.end_turn()
+        with ENEMY_PHASE_SECONDS.time():
+            for enemy in alive_enemies:
+                if not enemy.can_act():
+                    if "freeze" in enemy.status_effects:
+                        print(f"{enemy.display_name}은(는) 빙결 상태로 행동할 수 없다!")
+                    elif "stun" in enemy.status_effects:
+                        print(f"{enemy.display_name}은(는) 기절 상태로 행동할 수 없다!")
+                else:
+                    print(f"\n{enemy.display_name}의 턴:")
+                    enemy.choose_action(player)
+
+                    # 플레이어가 죽었는지 확인
+                    if not player.is_alive():
+                        print("\n당신은 패배하였습니다...")
+                        return "player_defeat"
+
+        # 턴 종료 처리 (모든 전투원의 상태이상을 한 번에)
+        # 상태이상 피해로 쓰러진 적은 그 상태이상이 풀리기 전에 퀘스트에 반영
+        end_turn_phase([player, *alive_enemies], on_defeat=record_tick_defeat)
+        record_defeated_enemies(player, enemies, defeated)
 
     # 전투 루프가 끝났을 때의 최종 결과
     if not player.is_alive():
@@ -7,6 +7,12 @@ import json
 import os
 from typing import Dict, Any, Optional
 import time
+from utility.metrics import SECONDS_BUCKETS, counter, histogram
+
+# 데이터 로딩 계측
+DATA_LOAD_SECONDS = histogram("data_load_seconds", "데이터 파일별 JSON 로딩 시간", SECONDS_BUCKETS, ("file",))
+DATA_CACHE_HITS = counter("data_cache_hits_total", "수정되지 않아 캐시로 응답한 로딩 요청 수")
+DATA_LOAD_ERRORS = counter("data_load_errors_total", "데이터 파일 로딩 실패 수")
 
 
 class DataManager:
@@ -58,11 +64,13 @@ class DataManager:
             if (key in self._cache and 
                 key in self._last_modified and 
                 self._last_modified[key] >= mod_time):
+                DATA_CACHE_HITS.inc()
                 return self._cache[key]
             
             # 파일 로딩
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with DATA_LOAD_SECONDS.labels(key).time():
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             
             # 캐시 업데이트
             self._cache[key] = data
@@ -71,6 +79,7 @@ class DataManager:
             return data
             
         except Exception as e:
+            DATA_LOAD_ERRORS.inc()
             print(f"❌ 파일 로딩 오류 ({filepath}): {e}")
             return None
     
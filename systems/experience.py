@@ -1,4 +1,7 @@
 import math
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable, List
 
 
 class ExperienceSystem:
@@ -25,32 +28,32 @@ class ExperienceSystem:
         
         # 레벨별 누적 경험치 캐시 (자주 사용되므로 미리 계산)
         self._total_exp_cache = {}
+        self._total_exp_table: List[int] = []  # 인덱스 = 레벨 - 1, 이진 탐색용
+        self._total_exp_array = None           # NumPy 배치 API용 (지연 생성)
         self._precompute_total_exp()
     
     def _precompute_total_exp(self):
-        """레벨별 총 누적 경험치를 미리 계산하여 캐시에 저장 (벡터화된 계산)"""
-        # 더 효율적인 벡터화된 계산
-        import numpy as np
+        """레벨별 총 누적 경험치를 미리 계산하여 캐시에 저장
         
-        # 1~49 레벨 계산
-        levels_1_49 = np.arange(2, 51)
-        exp_1_49 = self.BASE_EXP * (self.GROWTH1 ** (levels_1_49 - 2))
-        
-        # 50~99 레벨 계산
-        levels_50_99 = np.arange(50, 100)
-        exp_50_99 = self.exp_49 * (self.GROWTH2 ** (levels_50_99 - 50))
+        150개 값뿐이므로 순수 Python으로 계산합니다. 모듈 임포트 시점에
+        실행되므로 NumPy를 불러오지 않습니다.
+        """
+        # 1~49 레벨 구간
+        increments = [0.0]
+        increments += [self.BASE_EXP * (self.GROWTH1 ** (level - 2)) for level in range(2, 51)]
         
-        # 100~150 레벨 계산
-        levels_100_150 = np.arange(100, self.MAX_LEVEL + 1)
-        exp_100_150 = self.exp_99 + self.K * np.log(levels_100_150 - 99)
+        # 50~99 레벨 구간
+        increments += [self.exp_49 * (self.GROWTH2 ** (level - 50)) for level in range(50, 100)]
         
-        # 누적 합계 계산
-        all_exp = np.concatenate([[0], exp_1_49, exp_50_99, exp_100_150])
-        cumulative_exp = np.cumsum(all_exp)
+        # 100~150 레벨 구간
+        increments += [self.exp_99 + self.K * math.log(level - 99)
+                       for level in range(100, self.MAX_LEVEL + 1)]
         
-        # 캐시에 저장
+        # 누적 합계 계산 후 캐시에 저장
+        cumulative_exp = list(accumulate(increments))
         for level in range(1, self.MAX_LEVEL + 1):
             self._total_exp_cache[level] = int(cumulative_exp[level - 1]) if level > 1 else 0
+        self._total_exp_table = [self._total_exp_cache[level] for level in range(1, self.MAX_LEVEL + 1)]
     
     def exp_needed_for_level(self, level: int) -> int:
         """
@@ -102,21 +105,33 @@ class ExperienceSystem:
         if total_exp < 0:
             return 1
         
-        # 이진 탐색으로 효율적으로 레벨 찾기
-        left, right = 1, self.MAX_LEVEL
-        current_level = 1
+        # 누적 경험치 테이블에서 이진 탐색
+        return max(1, min(bisect_right(self._total_exp_table, total_exp), self.MAX_LEVEL))
+    
+    def get_levels_from_exp_batch(self, total_exps: Iterable[int]) -> List[int]:
+        """
+        여러 플레이어의 총 경험치로부터 레벨을 한 번에 계산 (벡터화)
+        
+        NumPy가 설치되어 있으면 벡터화된 탐색을 사용하고,
+        없으면 get_level_from_exp로 하나씩 계산합니다.
         
-        while left <= right:
-            mid = (left + right) // 2
-            required_exp = self.total_exp_for_level(mid)
+        Args:
+            total_exps: 총 누적 경험치 목록
             
-            if total_exp >= required_exp:
-                current_level = mid
-                left = mid + 1
-            else:
-                right = mid - 1
+        Returns:
+            list: 각 경험치에 해당하는 레벨 목록
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return [self.get_level_from_exp(total_exp) for total_exp in total_exps]
+        
+        if self._total_exp_array is None:
+            self._total_exp_array = np.asarray(self._total_exp_table, dtype=np.int64)
         
-        return current_level
+        exps = np.asarray(list(total_exps), dtype=np.int64)
+        levels = np.searchsorted(self._total_exp_array, exps, side="right")
+        return np.clip(levels, 1, self.MAX_LEVEL).tolist()
     
     def get_progress_to_next_level(self, total_exp: int) -> tuple:
         """
@@ -1,11 +1,59 @@
+# 수집 퀘스트 진행도로 세는 획득 경로 (구매, 퀘스트 보상, 시작 아이템은 세지 않음)
+COLLECT_SOURCES = ("loot", "pickup")
+
+
 class Inventory:
     def __init__(self):
         self.items = {}      # {아이템_이름: 개수}
         self.weapons = []    # [무기_ID_목록] - 무기는 개별 관리
         self.max_capacity = 30  # 최대 30칸
+        self._change_listeners = []  # callback(이벤트, 이름, 수량)
+
+    def to_state(self):
+        """저장용 상태 딕셔너리 반환"""
+        return {
+            "items": dict(self.items),
+            "weapons": list(self.weapons),
+            "max_capacity": self.max_capacity,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """to_state()로 만든 상태에서 인벤토리 복원 (리스너는 복원하지 않음)"""
+        inventory = cls()
+        inventory.items = dict(state.get("items", {}))
+        inventory.weapons = list(state.get("weapons", []))
+        inventory.max_capacity = state.get("max_capacity", inventory.max_capacity)
+        return inventory
+
+    def add_change_listener(self, callback):
+        """
+        인벤토리 변경 리스너 추가
+        
+        callback(event, name, quantity) 형태로 호출되며 event는
+        "add_item", "collect_item", "remove_item", "add_weapon", "remove_weapon"
+        중 하나입니다. "collect_item"은 COLLECT_SOURCES 경로로 얻은 아이템에만
+        "add_item" 다음에 전달됩니다.
+        """
+        self._change_listeners.append(callback)
+
+    def remove_change_listener(self, callback):
+        """인벤토리 변경 리스너 제거"""
+        if callback in self._change_listeners:
+            self._change_listeners.remove(callback)
+
+    def _notify_change(self, event, name, quantity):
+        """변경 이벤트 전달 (리스너의 예외는 호출한 쪽으로 전파)"""
+        for callback in self._change_listeners:
+            callback(event, name, quantity)
+
+    def add_item(self, item_name, quantity=1, source=None):
+        """
+        아이템 추가
 
-    def add_item(self, item_name, quantity=1):
-        """아이템 추가"""
+        source는 획득 경로입니다. 전리품("loot")이나 줍기("pickup")로 얻었을 때만
+        지정하며, 구매·보상·시작 아이템은 지정하지 않습니다.
+        """
         if not self.can_add_item(quantity):
             print(f"❌ 인벤토리 공간이 부족합니다. (필요: {quantity}칸, 여유: {self.get_available_capacity()}칸)")
             return False
@@ -15,6 +63,9 @@ class Inventory:
         else:
             self.items[item_name] = quantity
         print(f"{item_name} {quantity}개를 획득했습니다!")
+        self._notify_change("add_item", item_name, quantity)
+        if source in COLLECT_SOURCES:
+            self._notify_change("collect_item", item_name, quantity)
         return True
 
     def remove_item(self, item_name, quantity=1):
@@ -28,6 +79,7 @@ class Inventory:
         self.items[item_name] -= quantity
         if self.items[item_name] == 0:
             del self.items[item_name]
+        self._notify_change("remove_item", item_name, quantity)
         return True
 
     def has_item(self, item_name, quantity=1):
@@ -81,12 +133,14 @@ class Inventory:
         
         self.weapons.append(weapon_id)
         print(f"⚔️ 무기를 인벤토리에 추가했습니다!")
+        self._notify_change("add_weapon", weapon_id, 1)
         return True
     
     def remove_weapon(self, weapon_id):
         """무기를 인벤토리에서 제거"""
         if weapon_id in self.weapons:
             self.weapons.remove(weapon_id)
+            self._notify_change("remove_weapon", weapon_id, 1)
             return True
         return False
     
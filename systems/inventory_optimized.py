@@ -3,6 +3,13 @@
 용량 계산 캐시, 배치 작업, 이벤트 시스템
 """
 from typing import Dict, List, Optional, Callable
+from utility.metrics import counter
+
+# 전체 인벤토리 합산 계측 (인스턴스별 수치는 get_performance_stats)
+CAPACITY_CACHE = counter("inventory_capacity_cache_total", "용량 캐시 조회 결과별 횟수", ("result",))
+CAPACITY_CACHE_HIT = CAPACITY_CACHE.child("hit")
+CAPACITY_CACHE_MISS = CAPACITY_CACHE.child("miss")
+INVENTORY_OPERATIONS = counter("inventory_operations_total", "인벤토리 추가/제거 작업 수")
 
 
 class OptimizedInventory:
@@ -35,9 +42,11 @@ class OptimizedInventory:
         """용량 캐시 업데이트"""
         if not self._cache_dirty:
             self._stats['cache_hits'] += 1
+            CAPACITY_CACHE_HIT.inc()
             return
         
         self._stats['cache_misses'] += 1
+        CAPACITY_CACHE_MISS.inc()
         item_slots = sum(self.items.values())
         weapon_slots = len(self.weapons)
         self._cached_used_capacity = item_slots + weapon_slots
@@ -63,6 +72,7 @@ class OptimizedInventory:
     def add_item(self, item_name: str, quantity: int = 1) -> bool:
         """아이템 추가 (최적화된 버전)"""
         self._stats['operations'] += 1
+        INVENTORY_OPERATIONS.inc()
         
         if self.get_available_capacity() < quantity:
             return False
@@ -92,6 +102,7 @@ class OptimizedInventory:
     def remove_item(self, item_name: str, quantity: int = 1) -> bool:
         """아이템 제거 (최적화된 버전)"""
         self._stats['operations'] += 1
+        INVENTORY_OPERATIONS.inc()
         
         if item_name not in self.items:
             return False
@@ -139,6 +150,7 @@ class OptimizedInventory:
     def add_weapon(self, weapon_id: str) -> bool:
         """무기 추가"""
         self._stats['operations'] += 1
+        INVENTORY_OPERATIONS.inc()
         
         if not self.can_add_weapon():
             return False
@@ -162,6 +174,7 @@ class OptimizedInventory:
     def remove_weapon(self, weapon_id: str) -> bool:
         """무기 제거"""
         self._stats['operations'] += 1
+        INVENTORY_OPERATIONS.inc()
         
         if weapon_id in self.weapons:
             self.weapons.remove(weapon_id)
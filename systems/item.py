@@ -30,7 +30,7 @@ class HealingItem(Item):
             return True
             
         elif self.heal_type == "mp":
-            max_mp = 30 + 5 * (user.level - 1)
+            max_mp = user.max_mp
             if user.mp >= max_mp:
                 print(f"{user.name}의 마력이 이미 가득합니다.")
                 return False
@@ -13,6 +13,11 @@ __all__ = [
 import random
 from typing import List, Dict, Optional, Tuple
 from systems.data_manager import get_data
+from utility.metrics import SECONDS_BUCKETS, counter, histogram
+
+# 스폰 계측
+SPAWNED_MONSTERS = counter("monsters_spawned_total", "지역별 스폰된 몬스터 수", ("region",))
+SPAWN_SECONDS = histogram("spawn_seconds", "조우 한 번의 스폰 시간", SECONDS_BUCKETS)
 
 
 class OptimizedMonsterSpawner:
@@ -63,21 +68,23 @@ class OptimizedMonsterSpawner:
         if region_name not in self._region_cache:
             return []
         
-        # 스폰 개수 결정
-        spawn_count = force_count or self._determine_spawn_count(region_name)
-        
-        # 몬스터 선택
-        selected_monsters = []
-        region_monsters = self._region_cache[region_name]
-        weights = [monster.get('spawn_chance', 50) for monster in region_monsters]
-        
-        for _ in range(spawn_count):
-            if region_monsters:
-                monster_data = random.choices(region_monsters, weights=weights, k=1)[0]
-                monster = self._create_monster_from_data(monster_data)
-                if monster:
-                    selected_monsters.append(monster)
-        
+        with SPAWN_SECONDS.time():
+            # 스폰 개수 결정
+            spawn_count = force_count or self._determine_spawn_count(region_name)
+
+            # 몬스터 선택
+            selected_monsters = []
+            region_monsters = self._region_cache[region_name]
+            weights = [monster.get('spawn_chance', 50) for monster in region_monsters]
+
+            for _ in range(spawn_count):
+                if region_monsters:
+                    monster_data = random.choices(region_monsters, weights=weights, k=1)[0]
+                    monster = self._create_monster_from_data(monster_data)
+                    if monster:
+                        selected_monsters.append(monster)
+
+        SPAWNED_MONSTERS.labels(region_name).inc(len(selected_monsters))
         return selected_monsters
     
     def _determine_spawn_count(self, region_name: str) -> int:
@@ -6,13 +6,15 @@
 
 __all__ = [
     "NPCSystem",
+    "get_npc_system",
     "handle_npc_interaction",
 ]
 
 import json
 import os
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from systems.quest_system import quest_system
+from utility.text_index import NgramIndex
 
 
 class NPC:
@@ -49,6 +51,13 @@ class NPCSystem:
     def __init__(self):
         self.npcs: Dict[str, NPC] = {}
         self.npcs_by_region: Dict[str, List[NPC]] = {}
+        
+        # 로드 시 구축하는 색인
+        self.npcs_by_name: Dict[str, List[NPC]] = {}
+        self.npcs_by_region_name: Dict[Tuple[str, str], NPC] = {}
+        self.shop_npcs: List[NPC] = []
+        self._search_index = NgramIndex()  # 이름 + 대사의 한글 음절 n-gram
+        
         self.load_npcs()
     
     def load_npcs(self):
@@ -73,6 +82,12 @@ class NPCSystem:
                     self.npcs_by_region[npc.region] = []
                 self.npcs_by_region[npc.region].append(npc)
                 
+                self.npcs_by_name.setdefault(npc.name, []).append(npc)
+                self.npcs_by_region_name.setdefault((npc.region, npc.name), npc)
+                if npc.has_shop():
+                    self.shop_npcs.append(npc)
+                self._search_index.add(npc.id, npc.name, npc.dialogue)
+                
             print(f"✅ {len(self.npcs)}명의 NPC를 로드했습니다.")
             
         except Exception as e:
@@ -88,17 +103,11 @@ class NPCSystem:
     
     def get_npc_by_name(self, name: str, region: Optional[str] = None) -> Optional[NPC]:
         """이름으로 NPC를 조회합니다. 지역을 지정하면 해당 지역에서만 검색합니다."""
-        search_npcs = []
-        
         if region:
-            search_npcs = self.get_npcs_in_region(region)
-        else:
-            search_npcs = list(self.npcs.values())
+            return self.npcs_by_region_name.get((region, name))
         
-        for npc in search_npcs:
-            if npc.name == name:
-                return npc
-        return None
+        npcs = self.npcs_by_name.get(name)
+        return npcs[0] if npcs else None
     
     def show_region_npcs(self, region_name: str) -> bool:
         """특정 지역의 NPC 목록을 표시합니다."""
@@ -160,7 +169,7 @@ class NPCSystem:
     
     def get_shop_npcs(self) -> List[NPC]:
         """상점을 운영하는 NPC 목록을 반환합니다."""
-        return [npc for npc in self.npcs.values() if npc.has_shop()]
+        return list(self.shop_npcs)
     
     def get_npc_count_by_region(self) -> Dict[str, int]:
         """지역별 NPC 수를 반환합니다."""
@@ -168,15 +177,7 @@ class NPCSystem:
     
     def search_npcs(self, keyword: str) -> List[NPC]:
         """키워드로 NPC를 검색합니다 (이름 또는 대사에서)."""
-        results = []
-        keyword_lower = keyword.lower()
-        
-        for npc in self.npcs.values():
-            if (keyword_lower in npc.name.lower() or 
-                keyword_lower in npc.dialogue.lower()):
-                results.append(npc)
-        
-        return results
+        return [self.npcs[npc_id] for npc_id in self._search_index.search(keyword)]
     
     def show_all_npcs(self):
         """모든 NPC 정보를 지역별로 표시합니다."""
@@ -202,6 +203,18 @@ class NPCSystem:
         print(f"📊 **총 {total_npcs}명** (상점 운영자: {shop_npcs}명)")
 
 
+# 공유 NPC 시스템 (첫 사용 시 한 번만 로드)
+_npc_system: Optional[NPCSystem] = None
+
+
+def get_npc_system() -> NPCSystem:
+    """NPC 시스템 인스턴스 반환"""
+    global _npc_system
+    if _npc_system is None:
+        _npc_system = NPCSystem()
+    return _npc_system
+
+
 def test_npc_system():
     """NPC 시스템 테스트 함수"""
     print("🧪 NPC 시스템 테스트 시작")
@@ -246,7 +259,7 @@ def test_npc_system():
 def handle_npc_interaction(player):
     """현재 지역의 NPC와 상호작용하는 간단한 래퍼 함수."""
     from systems.region import region_manager
-    npc_system = NPCSystem()
+    npc_system = get_npc_system()
     
     # NPC 선택 UI 개선
     npcs_in_region = npc_system.get_npcs_in_region(region_manager.current_region)
@@ -273,10 +286,7 @@ def handle_npc_interaction(player):
     print(npc_system.interact_with_npc(selected_npc))
 
     # 퀘스트 처리
-    available_quests = [
-        q for q in quest_system.get_quests_for_giver(selected_npc.name)
-        if q.id not in player.active_quests and q.id not in player.completed_quests
-    ]
+    available_quests = quest_system.get_available_quests(player, selected_npc)
 
     if available_quests:
         print("\n--- 의뢰 가능 목록 ---")
@@ -0,0 +1,124 @@
+"""
+전란 그리고 요괴 - 조선시대 RPG
+파일: systems/pricing.py
+설명: 상점 가격 엔진 (기본 가격 × 지역 할인 × 수요/공급) 및 가격표 캐시
+"""
+
+__all__ = [
+    "TICKS_PER_DAY",
+    "PricingEngine",
+]
+
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+
+from systems.data_manager import get_data
+from systems.region import regions
+from systems.shop_stock import ShopStockStore
+
+if TYPE_CHECKING:
+    from systems.shop_system import Shop
+
+# 가격표가 유지되는 기간 (게임 틱)
+TICKS_PER_DAY = 24
+
+# 재고가 바닥났을 때의 최대 할증률 (재고 비율에 비례)
+SCARCITY_MARKUP = 0.5
+
+
+class PricingEngine:
+    """
+    상점 가격 엔진
+
+    가격 = 기본 가격(items.json) × 지역 할인 × 수요/공급 배율.
+    상점별 가격표를 (상점, 게임 일자) 단위로 캐시하고, 재고가 바뀌면
+    해당 상점의 가격표만 무효화하므로 목록 화면을 다시 그려도
+    가격을 다시 계산하지 않습니다.
+    """
+
+    def __init__(self, stock_store: ShopStockStore):
+        self.stock_store = stock_store
+        self._base_prices: Optional[Dict[str, int]] = None
+        self._item_types: Dict[str, str] = {}
+        self._tables: Dict[str, Tuple[int, Dict[str, int]]] = {}  # 상점 ID → (일자, 가격표)
+
+        stock_store.add_listener(self._on_stock_changed)
+
+    def _on_stock_changed(self, shop_id: str, item_name: str):
+        self._tables.pop(shop_id, None)
+
+    def invalidate(self, shop_id: Optional[str] = None):
+        """가격표 캐시를 비웁니다. shop_id가 없으면 전체를 비웁니다."""
+        if shop_id is None:
+            self._tables.clear()
+        else:
+            self._tables.pop(shop_id, None)
+
+    def current_day(self) -> int:
+        """재고 시계 기준 현재 게임 일자"""
+        return self.stock_store.current_tick // TICKS_PER_DAY
+
+    def _load_items(self):
+        """items.json의 기본 가격과 종류를 처음 한 번만 읽어 둡니다."""
+        if self._base_prices is not None:
+            return
+        item_data = get_data('items') or {}
+        self._base_prices = {name: data.get("price", 0) for name, data in item_data.items()}
+        self._item_types = {name: data.get("type", "") for name, data in item_data.items()}
+
+    def get_base_price(self, item_name: str) -> int:
+        """아이템의 기본 가격을 반환합니다."""
+        self._load_items()
+        return self._base_prices.get(item_name, 0)
+
+    def get_regional_modifier(self, region: str, item_name: str) -> float:
+        """
+        지역 특성의 할인 배율을 반환합니다.
+
+        약초_할인은 이름에 '약초'가 들어간 아이템, 치료비_할인은 회복 아이템에
+        적용되며, 둘 다 해당하면 더 큰 할인 하나만 적용합니다.
+        """
+        self._load_items()
+        features = regions.get(region, {}).get("features", {})
+        modifier = 1.0
+
+        if "약초" in item_name and "약초_할인" in features:
+            modifier = min(modifier, features["약초_할인"])
+        if self._item_types.get(item_name) == "healing" and "치료비_할인" in features:
+            modifier = min(modifier, features["치료비_할인"])
+
+        return modifier
+
+    def _build_table(self, shop: "Shop") -> Dict[str, int]:
+        stock_by_item = self.stock_store.get_shop_stock(shop.id)
+        table = {}
+
+        for item_name, max_stock in shop.items.items():
+            base = self.get_base_price(item_name)
+            if base <= 0:
+                table[item_name] = 0
+                continue
+
+            # 재고가 적을수록 비싸짐
+            stock = stock_by_item.get(item_name, 0)
+            supply = stock / max_stock if max_stock > 0 else 0.0
+            demand = 1.0 + SCARCITY_MARKUP * (1.0 - supply)
+
+            price = base * self.get_regional_modifier(shop.region, item_name) * demand
+            table[item_name] = max(1, round(price))
+
+        return table
+
+    def get_price_table(self, shop: "Shop") -> Dict[str, int]:
+        """상점의 아이템별 현재 가격표를 반환합니다."""
+        day = self.current_day()
+        cached = self._tables.get(shop.id)
+        if cached is not None and cached[0] == day:
+            return cached[1]
+
+        table = self._build_table(shop)
+        self._tables[shop.id] = (day, table)
+        return table
+
+    def get_price(self, shop: "Shop", item_name: str) -> int:
+        """상점에서의 아이템 가격을 반환합니다."""
+        return self.get_price_table(shop).get(item_name, 0)
@@ -4,11 +4,25 @@
 설명: 퀘스트 관리 시스템
 """
 
-import json
-import os
-from typing import List, Dict, Optional, Any
+import heapq
+from typing import List, Dict, Optional, Any, Iterable, NamedTuple, Set, Tuple
+from systems.data_manager import get_data
+
+__all__ = ["Quest", "QuestObjective", "QuestSystem", "QuestTracker"]
+
+
+class QuestObjective(NamedTuple):
+    """
+    퀘스트 목표 하나
+
+    event는 "kill" / "kill_status" / "collect" / "travel" 중 하나이고,
+    keys 중 어느 하나라도 일치하는 이벤트가 진행도를 올립니다.
+    """
+    label: str              # 진행도 저장 키 (예: "kill:도깨비불")
+    event: str
+    keys: Tuple[str, ...]
+    count: int
 
-__all__ = ["Quest", "QuestSystem"]
 
 class Quest:
     """개별 퀘스트 클래스"""
@@ -16,11 +30,79 @@ class Quest:
         self.id: str = quest_data.get("id", "")
         self.title: str = quest_data.get("title", "알 수 없는 의뢰")
         self.giver: str = quest_data.get("giver", "익명")
+        # 구형 스키마 퀘스트는 의뢰인이 없어 해당 지역의 NPC 누구나 전달합니다.
+        self.has_giver: bool = "giver" in quest_data
         self.region: str = quest_data.get("region", "")
         self.description: str = quest_data.get("description", "...")
-        self.condition: Dict[str, Any] = quest_data.get("condition", {})
-        self.reward: Dict[str, Any] = quest_data.get("reward", {})
+        self.condition: Dict[str, Any] = quest_data.get("condition") or self._legacy_condition(quest_data)
+        self.reward: Dict[str, Any] = quest_data.get("reward") or self._legacy_reward(quest_data)
+        self.requirements: Dict[str, Any] = quest_data.get("requirements", {})
+        self.min_level: int = self.requirements.get("min_level", 1)
+        self.prerequisites: Tuple[str, ...] = tuple(self.requirements.get("completed_quests", []))
         self.tags: List[str] = quest_data.get("tags", [])
+        self.objectives: List[QuestObjective] = []
+
+    @staticmethod
+    def _legacy_condition(quest_data: Dict[str, Any]) -> Dict[str, Any]:
+        """구형 스키마(type + objectives)를 condition 형식으로 변환"""
+        objectives = quest_data.get("objectives", {})
+        return {
+            "type": quest_data.get("type"),
+            "target": objectives.get("target", ""),
+            "count": objectives.get("count", 1),
+        }
+
+    @staticmethod
+    def _legacy_reward(quest_data: Dict[str, Any]) -> Dict[str, Any]:
+        """구형 스키마(rewards.items = {이름: 개수})를 reward 형식으로 변환"""
+        rewards = dict(quest_data.get("rewards", {}))
+        items = rewards.get("items")
+        if isinstance(items, dict):
+            rewards["items"] = [{"name": name, "count": count} for name, count in items.items()]
+        return rewards
+
+    def compile_objectives(self, monster_groups: Dict[str, List[Dict[str, Any]]]):
+        """
+        조건을 이벤트 키 단위 목표로 변환합니다.
+
+        Args:
+            monster_groups: 요괴 분류("minion", "midboss") → 요괴 데이터 목록.
+                target_type 조건을 요괴 이름 목록으로 풀 때 사용합니다.
+        """
+        cond = self.condition
+        cond_type = cond.get("type")
+        count = cond.get("count", 1)
+        objectives = []
+
+        if cond_type == "kill":
+            target = cond.get("target")
+            if target:
+                objectives.append(QuestObjective(f"kill:{target}", "kill", (target,), count))
+            else:
+                target_type = cond.get("target_type", "")
+                location = cond.get("details", {}).get("location")
+                names = []
+                for monster in monster_groups.get(target_type, []):
+                    regions = monster.get("region", [])
+                    if isinstance(regions, str):
+                        regions = [regions]
+                    if location is None or location in regions:
+                        names.append(monster["name"])
+                objectives.append(QuestObjective(f"kill:{target_type}", "kill", tuple(names), count))
+        elif cond_type == "kill_list":
+            for target in cond.get("targets", []):
+                objectives.append(QuestObjective(f"kill:{target}", "kill", (target,), count))
+        elif cond_type == "kill_with_status":
+            status = cond.get("status", "")
+            objectives.append(QuestObjective(f"kill_status:{status}", "kill_status", (status,), count))
+        elif cond_type == "collect":
+            item_name = cond.get("item_name") or cond.get("target", "")
+            objectives.append(QuestObjective(f"collect:{item_name}", "collect", (item_name,), count))
+        elif cond_type == "travel":
+            region = cond.get("target", "")
+            objectives.append(QuestObjective(f"travel:{region}", "travel", (region,), count))
+
+        self.objectives = objectives
 
     def get_summary(self) -> str:
         """퀘스트 요약 정보 반환"""
@@ -38,17 +120,28 @@ class Quest:
         ]
         return "\n".join(details)
 
+    def get_progress_lines(self, progress: Dict[str, int]) -> List[str]:
+        """목표별 진행도 문자열 목록 반환"""
+        return [
+            f"  - {objective.label.split(':', 1)[1]}: {progress.get(objective.label, 0)}/{objective.count}"
+            for objective in self.objectives
+        ]
+
     def _get_condition_str(self) -> str:
         """조건을 설명하는 문자열 반환"""
         cond_type = self.condition.get("type")
         if cond_type == "kill":
-            return f"{self.condition.get('target_type', '요괴')} {self.condition.get('count', 0)}마리 처치"
+            target = self.condition.get("target") or self.condition.get("target_type", "요괴")
+            return f"{target} {self.condition.get('count', 0)}마리 처치"
         elif cond_type == "collect":
-            return f"{self.condition.get('item_name', '')} {self.condition.get('count', 0)}개 수집"
+            item_name = self.condition.get("item_name") or self.condition.get("target", "")
+            return f"{item_name} {self.condition.get('count', 0)}개 수집"
         elif cond_type == "kill_with_status":
             return f"{self.condition.get('status')} 상태의 적 {self.condition.get('count', 0)}마리 처치"
         elif cond_type == "kill_list":
             return f"지정된 요괴 ({', '.join(self.condition.get('targets', []))}) 각각 처치"
+        elif cond_type == "travel":
+            return f"{self.condition.get('target', '')}까지 이동"
         return "알 수 없는 조건"
 
     def _get_reward_str(self) -> str:
@@ -63,85 +156,402 @@ class Quest:
             parts.append(", ".join(item_names))
         return ", ".join(parts) if parts else "보상 없음"
 
+    @property
+    def offer_key(self) -> Tuple[str, str]:
+        """퀘스트를 전달하는 쪽: ("giver", NPC 이름) 또는 ("region", 지역)"""
+        return ("giver", self.giver) if self.has_giver else ("region", self.region)
+
+
+class QuestTracker:
+    """
+    플레이어별 퀘스트 진행 추적기
+
+    진행 중인 퀘스트의 목표를 (이벤트, 키) 단위로 색인해 두므로,
+    요괴 한 마리를 처치해도 그 요괴를 목표로 하는 퀘스트만 갱신합니다.
+    진행도 자체는 player.active_quests[퀘스트ID]["progress"]에 저장됩니다.
+    """
+
+    def __init__(self, player):
+        self.player = player
+        self._index: Dict[Tuple[str, str], List[Tuple[str, QuestObjective]]] = {}
+        self._tracked_keys: Dict[str, List[Tuple[str, str]]] = {}  # 퀘스트 ID → 등록한 색인 키
+        
+        # 수락 가능 퀘스트 색인 (첫 조회 시 구축 후 증분 갱신)
+        self.unlocked: Set[str] = set()
+        self._available: Dict[Tuple[str, str], Dict[str, Quest]] = {}  # 전달자 → {ID: 퀘스트}
+        self._missing_prereqs: Dict[str, int] = {}
+        self._waiting_level: List[Tuple[int, str]] = []  # 선행 완료, 레벨 부족 (min_level 힙)
+        self._availability_ready = False
+
+    def track(self, quest: Quest):
+        """퀘스트 목표를 색인에 등록합니다."""
+        keys = self._tracked_keys.setdefault(quest.id, [])
+        for objective in quest.objectives:
+            for key in objective.keys:
+                event_key = (objective.event, key)
+                self._index.setdefault(event_key, []).append((quest.id, objective))
+                keys.append(event_key)
+
+    def untrack(self, quest_id: str):
+        """퀘스트 목표를 색인에서 제거합니다. (이 퀘스트가 등록한 키만 확인)"""
+        for event_key in self._tracked_keys.pop(quest_id, ()):
+            bucket = self._index.get(event_key)
+            if bucket is None:
+                continue  # 같은 키를 목표 두 개가 등록한 경우
+            entries = [entry for entry in bucket if entry[0] != quest_id]
+            if entries:
+                self._index[event_key] = entries
+            else:
+                del self._index[event_key]
+
+    def rebuild(self):
+        """player.active_quests로부터 색인을 다시 만듭니다. (불러오기 후)"""
+        self._index.clear()
+        self._tracked_keys.clear()
+        for quest_id in self.player.active_quests:
+            quest = quest_system.get_quest(quest_id)
+            if quest:
+                self.track(quest)
+
+    def to_state(self) -> Dict[str, Any]:
+        """저장용 퀘스트 상태 (진행 중 퀘스트의 진행도와 완료 목록)"""
+        return {
+            "active": {quest_id: {"progress": dict(state.get("progress", {}))}
+                       for quest_id, state in self.player.active_quests.items()},
+            "completed": list(self.player.completed_quests),
+        }
+
+    def load_state(self, state: Dict[str, Any]):
+        """저장된 퀘스트 상태를 플레이어에 적용하고 색인을 다시 만듭니다."""
+        self.player.active_quests = {quest_id: {"progress": dict(quest_state.get("progress", {}))}
+                                     for quest_id, quest_state in state.get("active", {}).items()}
+        self.player.completed_quests = list(state.get("completed", []))
+        self.player.mark_dirty("quests")
+        self.rebuild()
+        self._availability_ready = False  # 다음 조회 때 새 기록으로 재구축
+
+    def refresh_availability(self):
+        """플레이어의 레벨과 완료 기록으로 수락 가능 색인을 처음부터 만듭니다."""
+        self.unlocked.clear()
+        self._available.clear()
+        self._missing_prereqs.clear()
+        self._waiting_level.clear()
+        self._availability_ready = True
+        
+        quest_system.initialize()
+        completed = set(self.player.completed_quests)
+        for quest in quest_system.quests.values():
+            if quest.id in quest_system.blocked:
+                continue
+            missing = sum(1 for prereq in quest.prerequisites if prereq not in completed)
+            self._missing_prereqs[quest.id] = missing
+            if missing == 0:
+                self._prerequisites_met(quest)
+
+    def _ensure_availability(self):
+        if not self._availability_ready:
+            self.refresh_availability()
+
+    def _prerequisites_met(self, quest: Quest):
+        if self.player.level >= quest.min_level:
+            self._unlock(quest)
+        else:
+            heapq.heappush(self._waiting_level, (quest.min_level, quest.id))
+
+    def _unlock(self, quest: Quest):
+        self.unlocked.add(quest.id)
+        if quest.id not in self.player.active_quests and quest.id not in self.player.completed_quests:
+            self._available.setdefault(quest.offer_key, {})[quest.id] = quest
+
+    def _withdraw(self, quest: Quest):
+        offered = self._available.get(quest.offer_key)
+        if offered:
+            offered.pop(quest.id, None)
+
+    def on_accept(self, quest: Quest):
+        """퀘스트 수락 시 목표를 추적하고 수락 가능 목록에서 뺍니다."""
+        self.player.mark_dirty("quests")
+        self.track(quest)
+        if self._availability_ready:
+            self._withdraw(quest)
+
+    def on_complete(self, quest: Quest):
+        """퀘스트 완료 시 이 퀘스트를 선행 조건으로 하는 퀘스트를 갱신합니다."""
+        self.player.mark_dirty("quests")
+        self.untrack(quest.id)
+        if not self._availability_ready:
+            return
+        self._withdraw(quest)
+        for dependent_id in quest_system.dependents.get(quest.id, ()):
+            if dependent_id not in self._missing_prereqs:
+                continue
+            self._missing_prereqs[dependent_id] -= 1
+            if self._missing_prereqs[dependent_id] == 0:
+                self._prerequisites_met(quest_system.quests[dependent_id])
+
+    def on_level_up(self, level: int):
+        """레벨업 시 레벨 조건만 남아 있던 퀘스트를 해금합니다."""
+        if not self._availability_ready:
+            return
+        while self._waiting_level and self._waiting_level[0][0] <= level:
+            _, quest_id = heapq.heappop(self._waiting_level)
+            self._unlock(quest_system.quests[quest_id])
+
+    def get_available_quests(self, npc_name: str, region: str) -> List[Quest]:
+        """NPC가 지금 전달할 수 있는 퀘스트 목록 (의뢰인 지정 + 지역 의뢰)"""
+        self._ensure_availability()
+        return (list(self._available.get(("giver", npc_name), {}).values())
+                + list(self._available.get(("region", region), {}).values()))
+
+    def get_available_in_region(self, region: str) -> List[Quest]:
+        """지역에서 수락 가능한 모든 퀘스트 목록"""
+        self._ensure_availability()
+        return [quest for offered in self._available.values()
+                for quest in offered.values() if quest.region == region]
+
+    def is_complete(self, quest_id: str) -> bool:
+        """퀘스트의 모든 목표를 달성했는지 확인합니다."""
+        quest = quest_system.get_quest(quest_id)
+        progress = self.player.active_quests.get(quest_id, {}).get("progress", {})
+        return quest is not None and all(
+            progress.get(objective.label, 0) >= objective.count for objective in quest.objectives
+        )
+
+    def notify(self, event: str, keys: Iterable[str], amount: int = 1) -> List[str]:
+        """
+        게임 이벤트를 반영하고 완료된 퀘스트를 처리합니다.
+
+        Returns:
+            이번 이벤트로 완료된 퀘스트 ID 목록
+        """
+        touched: Set[Tuple[str, str]] = set()
+        for key in keys:
+            for quest_id, objective in self._index.get((event, key), ()):
+                if (quest_id, objective.label) in touched:
+                    continue
+                touched.add((quest_id, objective.label))
+
+                progress = self.player.active_quests[quest_id]["progress"]
+                current = progress.get(objective.label, 0)
+                if current < objective.count:
+                    progress[objective.label] = min(current + amount, objective.count)
+                    self.player.mark_dirty("quests")
+
+        completed = [quest_id for quest_id in dict.fromkeys(q for q, _ in touched)
+                     if self.is_complete(quest_id)]
+        for quest_id in completed:
+            quest_system.complete_quest(self.player, quest_id)
+        return completed
+
 
 class QuestSystem:
     """퀘스트 관리 시스템"""
     def __init__(self):
         self.quests: Dict[str, Quest] = {}
         self.quests_by_giver: Dict[str, List[Quest]] = {}
-        self._load_quests()
+        
+        # 선행 퀘스트 그래프: 퀘스트 ID → 이 퀘스트를 선행으로 요구하는 퀘스트 ID 목록
+        self.dependents: Dict[str, List[str]] = {}
+        self.blocked: Set[str] = set()  # 순환/없는 선행 퀘스트로 해금될 수 없는 퀘스트
+        self._initialized = False
 
-    def _load_quests(self):
-        """quests.json에서 퀘스트 데이터를 로드합니다."""
-        quest_file = os.path.join("data", "quests.json")
-        if not os.path.exists(quest_file):
-            print("⚠️ quests.json 파일이 없습니다.")
+    def initialize(self, refresh: bool = False):
+        """
+        DataManager의 quests 데이터로 퀘스트 레지스트리를 구축합니다.
+        
+        모듈 임포트 시에는 파일을 읽지 않으며, 게임 시작 시 명시적으로
+        호출하거나 처음 조회할 때 한 번만 실행됩니다.
+        """
+        if self._initialized and not refresh:
+            return
+        
+        self.quests.clear()
+        self.quests_by_giver.clear()
+        self._initialized = True
+        
+        quest_data_list = get_data('quests', refresh)
+        if not quest_data_list:
+            print("⚠️ 퀘스트 데이터가 없습니다.")
             return
         
         try:
-            with open(quest_file, 'r', encoding='utf-8') as file:
-                quest_data_list = json.load(file)
+            monster_groups = {
+                "minion": get_data('minions') or [],
+                "midboss": get_data('midbosses') or [],
+            }
             
             for quest_data in quest_data_list:
                 quest = Quest(quest_data)
+                quest.compile_objectives(monster_groups)
                 self.quests[quest.id] = quest
                 
                 if quest.giver not in self.quests_by_giver:
                     self.quests_by_giver[quest.giver] = []
                 self.quests_by_giver[quest.giver].append(quest)
                 
+            self._build_prerequisite_graph()
             print(f"✅ {len(self.quests)}개의 퀘스트를 로드했습니다.")
         except Exception as e:
             print(f"❌ 퀘스트 데이터 로드 실패: {e}")
 
+    def _build_prerequisite_graph(self):
+        """선행 퀘스트 DAG를 만들고 순환 여부를 검사합니다. (Kahn 알고리즘)"""
+        self.dependents = {quest_id: [] for quest_id in self.quests}
+        self.blocked = set()
+        indegree = {quest_id: 0 for quest_id in self.quests}
+        
+        for quest in self.quests.values():
+            for prereq in quest.prerequisites:
+                if prereq not in self.quests:
+                    print(f"⚠️ {quest.id}의 선행 퀘스트 {prereq}이(가) 없습니다.")
+                    self.blocked.add(quest.id)
+                    continue
+                self.dependents[prereq].append(quest.id)
+                indegree[quest.id] += 1
+        
+        queue = [quest_id for quest_id, degree in indegree.items() if degree == 0]
+        visited = 0
+        while queue:
+            quest_id = queue.pop()
+            visited += 1
+            for dependent_id in self.dependents[quest_id]:
+                indegree[dependent_id] -= 1
+                if indegree[dependent_id] == 0:
+                    queue.append(dependent_id)
+        
+        if visited < len(self.quests):
+            cycle = sorted(quest_id for quest_id, degree in indegree.items() if degree > 0)
+            print(f"⚠️ 선행 퀘스트 순환으로 해금할 수 없는 퀘스트: {', '.join(cycle)}")
+            self.blocked.update(cycle)
+
     def get_quest(self, quest_id: str) -> Optional[Quest]:
         """퀘스트 ID로 퀘스트를 조회합니다."""
+        self.initialize()
         return self.quests.get(quest_id)
 
     def get_quests_for_giver(self, giver_name: str) -> List[Quest]:
         """특정 NPC가 제공하는 퀘스트 목록을 반환합니다."""
+        self.initialize()
         return self.quests_by_giver.get(giver_name, [])
 
-# 전역 퀘스트 시스템 인스턴스
+    def accept_quest(self, player, quest_id: str) -> bool:
+        """퀘스트를 수락하고 목표를 추적하기 시작합니다."""
+        if quest_id in player.active_quests or quest_id in player.completed_quests:
+            print("이미 수락했거나 완료한 퀘스트입니다.")
+            return False
+        
+        quest = self.get_quest(quest_id)
+        if not quest:
+            print("존재하지 않는 퀘스트입니다.")
+            return False
+        
+        player.active_quests[quest_id] = {
+            "progress": {objective.label: 0 for objective in quest.objectives}
+        }
+        player.quest_tracker.on_accept(quest)
+        print(f"\n[퀘스트 수락] {quest.title}")
+        print(quest.get_details())
+        return True
+
+    def complete_quest(self, player, quest_id: str) -> Optional[Dict[str, Any]]:
+        """퀘스트를 완료 처리하고 보상을 지급합니다."""
+        quest = self.get_quest(quest_id)
+        if not quest or quest_id not in player.active_quests:
+            return None
+        
+        del player.active_quests[quest_id]
+        player.completed_quests.append(quest_id)
+        player.quest_tracker.on_complete(quest)
+        
+        print(f"\n🎉 [퀘스트 완료] {quest.title}")
+        print(f"   보상: {quest._get_reward_str()}")
+        
+        reward = quest.reward
+        if reward.get("gold"):
+            player.gold += reward["gold"]
+        for item in reward.get("items", []):
+            player.inventory.add_item(item["name"], item.get("count", 1))
+        if reward.get("exp"):
+            player.gain_exp(reward["exp"])
+        
+        return reward
+
+    def get_available_quests(self, player, npc) -> List[Quest]:
+        """NPC가 플레이어에게 제안할 수 있는 퀘스트 목록을 반환합니다."""
+        return player.quest_tracker.get_available_quests(npc.name, npc.region)
+
+    def display_available_quests(self, player, region: str):
+        """지역에서 수락 가능한 퀘스트를 표시합니다."""
+        quests = player.quest_tracker.get_available_in_region(region)
+        if not quests:
+            print("\n수락 가능한 퀘스트가 없습니다.")
+            return
+        
+        for quest in quests:
+            print(f"\n{quest.get_summary()}")
+
+    def display_active_quests(self, player):
+        """진행 중인 퀘스트와 목표별 진행도를 표시합니다."""
+        if not player.active_quests:
+            print("\n진행 중인 퀘스트가 없습니다.")
+            return
+        
+        for quest_id, state in player.active_quests.items():
+            quest = self.get_quest(quest_id)
+            if quest:
+                print(f"\n{quest.get_summary()}")
+                for line in quest.get_progress_lines(state.get("progress", {})):
+                    print(line)
+
+# 전역 퀘스트 시스템 인스턴스 (데이터는 initialize_quests() 또는 첫 조회 시 로드)
 quest_system = QuestSystem()
 
 
 def get_quest_system():
     """퀘스트 시스템 인스턴스 반환"""
+    quest_system.initialize()
     return quest_system
 
 
+def initialize_quests():
+    """편의 함수: 퀘스트 데이터 초기화 (게임 시작 시 호출)"""
+    quest_system.initialize()
+
+
 # 편의 함수들
-def accept_quest(quest_id: str) -> bool:
+def accept_quest(player, quest_id: str) -> bool:
     """퀘스트 수락"""
-    return quest_system.accept_quest(quest_id)
+    return quest_system.accept_quest(player, quest_id)
 
 
-def complete_quest(quest_id: str) -> Optional[Dict]:
+def complete_quest(player, quest_id: str) -> Optional[Dict]:
     """퀘스트 완료"""
-    return quest_system.complete_quest(quest_id)
+    return quest_system.complete_quest(player, quest_id)
 
 
-def update_kill_quest(monster_name: str) -> List[str]:
-    """몬스터 처치 퀘스트 업데이트"""
-    return quest_system.update_kill_progress(monster_name)
+def update_kill_quest(player, monster_name: str, statuses: Iterable[str] = ()) -> List[str]:
+    """몬스터 처치 퀘스트 업데이트 (statuses: 처치 시점 적의 상태이상 이름)"""
+    completed = player.quest_tracker.notify("kill", (monster_name,))
+    if statuses:
+        completed += player.quest_tracker.notify("kill_status", statuses)
+    return completed
 
 
-def update_collect_quest(item_name: str, amount: int = 1) -> List[str]:
+def update_collect_quest(player, item_name: str, amount: int = 1) -> List[str]:
     """수집 퀘스트 업데이트"""
-    return quest_system.update_collect_progress(item_name, amount)
+    return player.quest_tracker.notify("collect", (item_name,), amount)
 
 
-def update_travel_quest(region_name: str) -> List[str]:
+def update_travel_quest(player, region_name: str) -> List[str]:
     """이동 퀘스트 업데이트"""
-    return quest_system.update_travel_progress(region_name)
+    return player.quest_tracker.notify("travel", (region_name,))
 
 
-def show_available_quests(player_level: int, player_region: str):
+def show_available_quests(player, player_region: str):
     """수락 가능한 퀘스트 표시"""
-    quest_system.display_available_quests(player_level, player_region)
+    quest_system.display_available_quests(player, player_region)
 
 
-def show_active_quests():
+def show_active_quests(player):
     """진행 중인 퀘스트 표시"""
-    quest_system.display_active_quests() 
\ No newline at end of file
+    quest_system.display_active_quests(player)
@@ -10,6 +10,7 @@ __all__ = [
 ]
 
 from typing import Optional
+from systems.quest_system import update_travel_quest
 
 # 지역 정보 딕셔너리
 regions = {
@@ -139,6 +140,16 @@ class RegionManager:
     def __init__(self):
         self.current_region = "한양"  # 기본 시작 지역
 
+    def to_state(self):
+        """저장용 상태 딕셔너리 반환"""
+        return {"current_region": self.current_region}
+
+    def load_state(self, state):
+        """저장된 상태 적용 (알 수 없는 지역이면 무시)"""
+        region = state.get("current_region")
+        if region in regions:
+            self.current_region = region
+
     def get_current_region_data(self):
         """현재 지역 정보 반환"""
         return regions[self.current_region]
@@ -242,11 +253,11 @@ class RegionManager:
                 print(f"   위험도: {region_data['features']['위험도']}")
             print()
 
-    def interact_with_npcs(self):
+    def interact_with_npcs(self, player=None):
         """현재 지역의 NPC들과 상호작용할 수 있는 메뉴를 제공합니다."""
-        from systems.npc_system import NPCSystem
+        from systems.npc_system import get_npc_system
         
-        npc_system = NPCSystem()
+        npc_system = get_npc_system()
         npcs = npc_system.get_npcs_in_region(self.current_region)
         
         if not npcs:
@@ -278,7 +289,13 @@ class RegionManager:
                     if selected_npc.has_shop():
                         shop_choice = input("\n상점을 이용하시겠습니까? (y/n): ").strip().lower()
                         if shop_choice == 'y':
-                            print("🚧 상점 시스템은 아직 구현되지 않았습니다.")
+                            from systems.shop_system import get_shop_system
+                            shop_system = get_shop_system()
+                            shop = shop_system.get_shop_for_npc(selected_npc)
+                            if shop is None or player is None:
+                                print("⚠️ 지금은 상점을 이용할 수 없습니다.")
+                            else:
+                                shop_system.visit_shop(player, shop.id)
                     
                     input("\n계속하려면 Enter를 누르세요...")
                 else:
@@ -316,6 +333,9 @@ def handle_region_travel(player):
                 dest_name = destinations[idx]
                 success, msg = region_manager.travel_to(dest_name)
                 print(msg)
+                if success:
+                    player.current_location = dest_name
+                    update_travel_quest(player, dest_name)
                 return success
             else:
                 print("올바른 번호를 입력해주세요.")
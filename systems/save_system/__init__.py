@@ -1,6 +1,13 @@
 from .constants import *
 from .exceptions import SaveSystemError, InvalidSlotError, SaveFileError, UserCancelError
 from .models import SaveSlotInfo
+from .schema import SAVE_FORMAT_VERSION, SAVE_CODECS, migrate
+from .core import SaveSystem
+from .sqlite_store import SQLiteSaveSystem
+from .legacy import (
+    get_save_slots, show_save_slots_legacy, save_game, load_game, delete_save, autosave,
+    build_save_data, restore_player, SaveSystemWrapper,
+)
 
 __all__ = [
     'SaveSystemError',
@@ -8,6 +15,20 @@ __all__ = [
     'SaveFileError',
     'UserCancelError',
     'SaveSlotInfo',
+    'SaveSystem',
+    'SQLiteSaveSystem',
+    'SaveSystemWrapper',
+    'SAVE_FORMAT_VERSION',
+    'SAVE_CODECS',
+    'migrate',
+    'get_save_slots',
+    'show_save_slots_legacy',
+    'save_game',
+    'load_game',
+    'delete_save',
+    'autosave',
+    'build_save_data',
+    'restore_player',
     'SAVE_SLOT_COUNT',
     'SAVE_FILE_TEMPLATE',
     'VALID_CONFIRMATION_INPUTS',
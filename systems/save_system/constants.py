@@ -1,9 +1,17 @@
 from pathlib import Path
 
+from config import SAVE_DIR, runtime_path
+
 # 세이브 시스템 기본 설정
 SAVE_SLOT_COUNT = 3
 SAVE_FILE_TEMPLATE = "save_data_{}.json"
-DEFAULT_SAVE_DIR = Path(".")
+SAVE_INDEX_FILE = "save_index.json"  # 슬롯 목록용 메타데이터 색인
+SAVE_JOURNAL_TEMPLATE = "save_data_{}.journal"  # 자동 저장 변경분 저널 (JSON Lines)
+JOURNAL_COMPACT_ENTRIES = 16  # 저널이 이만큼 쌓이면 스냅샷으로 합침
+JOURNAL_GENERATION_KEY = "journal_generation"  # 스냅샷과 저널 첫 줄의 세대 (같은 세대의 저널만 재적용)
+DEFAULT_SAVE_DIR = SAVE_DIR  # JEONRAN_SAVE_DIR 또는 프로젝트 루트
+DEFAULT_SAVE_DB = runtime_path("saves.db")  # SQLite 세이브 저장소 (SQLiteSaveSystem)
+DEFAULT_ACCOUNT = "local"     # 계정을 지정하지 않을 때의 기본 계정
 
 # UI 관련 상수
 VALID_CONFIRMATION_INPUTS = ['y', 'yes', '예', 'ㅇ']
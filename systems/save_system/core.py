@@ -1,24 +1,65 @@
 import json
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 
-from .constants import SAVE_SLOT_COUNT, SAVE_FILE_TEMPLATE
+from .constants import (
+    SAVE_SLOT_COUNT,
+    SAVE_FILE_TEMPLATE,
+    SAVE_INDEX_FILE,
+    SAVE_JOURNAL_TEMPLATE,
+    JOURNAL_COMPACT_ENTRIES,
+    JOURNAL_GENERATION_KEY,
+    DEFAULT_SAVE_DIR,
+)
 from .exceptions import InvalidSlotError, SaveFileError
 from .models import SaveSlotInfo
+from .schema import SAVE_FORMAT_VERSION, decode_save, encode_save, migrate, slot_metadata
+from .writer import BackgroundSaveWriter, atomic_write
+from utility.metrics import SECONDS_BUCKETS, counter, histogram
+
+# 세이브 I/O 계측 (op: "write"/"read" 스냅샷, "journal" 변경분 추가, "db_write"/"db_read" SQLite 저장소)
+SAVE_IO_SECONDS = histogram("save_io_seconds", "세이브 I/O 시간", SECONDS_BUCKETS, ("op",))
+SAVE_IO_BYTES = counter("save_io_bytes_total", "세이브 I/O 바이트 수", ("op",))
+SAVE_IO_ERRORS = counter("save_io_errors_total", "세이브 I/O 실패 수", ("op",))
 
 
 class SaveSystem:
     """게임 저장 및 불러오기 기능을 관리하는 핵심 클래스"""
 
-    def __init__(self, save_dir: str = "."):
+    def __init__(self, save_dir: Union[str, Path] = DEFAULT_SAVE_DIR, compact: bool = False, background: bool = False,
+                 codec: str = "json"):
+        """
+        Args:
+            save_dir: 세이브 파일 디렉터리
+            compact: 들여쓰기 없는 압축 JSON으로 저장 (codec="json"일 때)
+            codec: "json", "zlib"(zlib 압축 JSON), "msgpack"(선택 의존성).
+                읽을 때는 파일 앞의 매직 헤더로 형식을 판별합니다.
+            background: 백그라운드 스레드에서 저장 (같은 슬롯의 연속 저장은 병합)
+        """
         self.save_dir = Path(save_dir)
         self.save_dir.mkdir(parents=True, exist_ok=True)
+        self.compact = compact
+        self.codec = codec
+        self._writer: Optional[BackgroundSaveWriter] = BackgroundSaveWriter() if background else None
+        
+        # 슬롯 메타데이터 색인: "슬롯" → {name, level, location, mtime_ns, size}
+        self._index_path = self.save_dir / SAVE_INDEX_FILE
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._index_lock = threading.Lock()
+        self._journal_counts: Dict[int, int] = {}  # 슬롯 → 저널 항목 수
+        self._generations: Dict[int, Optional[str]] = {}  # 슬롯 → 현재 스냅샷의 세대
 
     def _get_save_file_path(self, slot: int) -> Path:
         """슬롯 번호에 해당하는 세이브 파일 경로를 반환합니다."""
         return self.save_dir / SAVE_FILE_TEMPLATE.format(slot)
 
+    def _get_journal_path(self, slot: int) -> Path:
+        """슬롯의 변경분 저널 경로를 반환합니다."""
+        return self.save_dir / SAVE_JOURNAL_TEMPLATE.format(slot)
+
     def _validate_slot_number(self, slot: int) -> None:
         """슬롯 번호의 유효성을 검사합니다."""
         if not 1 <= slot <= SAVE_SLOT_COUNT:
@@ -27,64 +68,228 @@ class SaveSystem:
     def _read_save_file(self, file_path: Path) -> Dict[str, Any]:
         """세이브 파일을 읽고 내용을 반환합니다."""
         try:
-            with file_path.open('r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            raise SaveFileError("파일이 손상되었습니다.")
+            with SAVE_IO_SECONDS.labels("read").time():
+                payload = file_path.read_bytes()
         except IOError as e:
+            SAVE_IO_ERRORS.labels("read").inc()
             raise SaveFileError(f"파일을 읽는 중 오류가 발생했습니다: {e}")
+        SAVE_IO_BYTES.labels("read").inc(len(payload))
+        return decode_save(payload)
+
+    def _serialize(self, data: Dict[str, Any]) -> bytes:
+        """세이브 데이터를 파일에 쓸 바이트열로 변환합니다."""
+        return encode_save(data, self.codec, self.compact)
 
     def _write_save_file(self, file_path: Path, data: Dict[str, Any]) -> None:
-        """데이터를 세이브 파일에 씁니다."""
+        """데이터를 세이브 파일에 원자적으로 씁니다."""
+        payload = self._serialize(data)
         try:
-            with file_path.open('w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except IOError as e:
+            with SAVE_IO_SECONDS.labels("write").time():
+                atomic_write(file_path, payload)
+        except OSError as e:
+            SAVE_IO_ERRORS.labels("write").inc()
             raise SaveFileError(f"저장 중 오류가 발생했습니다: {e}")
+        SAVE_IO_BYTES.labels("write").inc(len(payload))
 
-    def get_save_slots_info(self) -> Dict[int, Optional[SaveSlotInfo]]:
-        """모든 세이브 슬롯의 정보를 가져옵니다."""
-        slots = {}
-        for slot in range(1, SAVE_SLOT_COUNT + 1):
-            file_path = self._get_save_file_path(slot)
-            if not file_path.exists():
-                slots[slot] = None
+    def _read_journal(self, slot: int) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+        """
+        저널의 세대와 변경분을 기록 순서대로 읽습니다.
+
+        첫 줄은 저널을 시작한 스냅샷의 세대입니다. 추가 쓰기 도중 끊겨 잘린
+        마지막 줄은 건너뜁니다.
+        """
+        try:
+            with self._get_journal_path(slot).open('r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return None, []
+        except OSError as e:
+            raise SaveFileError(f"저널을 읽는 중 오류가 발생했습니다: {e}")
+        
+        generation = None
+        deltas = []
+        for number, line in enumerate(lines):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                print(f"⚠️ 슬롯 {slot} 저널의 손상된 항목을 건너뜁니다.")
                 continue
+            if number == 0 and isinstance(entry, dict) and entry.keys() == {JOURNAL_GENERATION_KEY}:
+                generation = entry[JOURNAL_GENERATION_KEY]
+            else:
+                deltas.append(entry)
+        return generation, deltas
+
+    def _remove_journal(self, slot: int) -> None:
+        try:
+            self._get_journal_path(slot).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            raise SaveFileError(f"저널 삭제 중 오류가 발생했습니다: {e}")
+        self._journal_counts[slot] = 0
+
+    def _snapshot_written(self, slot: int, generation: str) -> None:
+        """
+        새 세대의 스냅샷이 디스크에 기록된 뒤 이전 세대의 저널을 버립니다.
+
+        지우기 전에 종료되어 남은 저널은 첫 줄의 세대가 스냅샷과 달라
+        불러올 때 무시되고, 다음 변경분을 기록하기 전에 지워집니다.
+        """
+        self._generations[slot] = generation
+        self._journal_counts.pop(slot, None)  # 지우기에 실패하면 다음 기록 때 다시 확인
+        self._remove_journal(slot)
 
+    def _load_snapshot(self, slot: int) -> Dict[str, Any]:
+        """스냅샷을 읽어 세대를 기억하고 현재 스키마로 올립니다."""
+        data = self._read_save_file(self._get_save_file_path(slot))
+        self._generations[slot] = data.pop(JOURNAL_GENERATION_KEY, None)
+        return migrate(data)
+
+    def _load_slot_data(self, slot: int) -> Dict[str, Any]:
+        """스냅샷을 현재 스키마로 올리고 같은 세대의 저널 변경분을 차례로 덮어씁니다."""
+        data = self._load_snapshot(slot)
+        generation, deltas = self._read_journal(slot)
+        if generation == self._generations[slot]:
+            for delta in deltas:
+                data.update(delta)
+        return data
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """슬롯 색인을 읽습니다. (처음 한 번, 없거나 손상되면 빈 색인)"""
+        if self._index is None:
             try:
-                data = self._read_save_file(file_path)
-                mod_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                slots[slot] = SaveSlotInfo.from_dict(data, mod_time)
-            except SaveFileError:
-                # UI에서 처리할 수 있도록 None 대신 에러 표시가 가능한 객체나 딕셔너리를 사용할 수도 있습니다.
-                # 지금은 None으로 통일하고, get_save_slots에서처럼 처리하겠습니다.
-                # 혹은 SaveSlotInfo에 에러 상태를 추가할 수도 있습니다.
-                # 여기서는 간단하게 None 처리하고, UI 단에서 파일 존재 여부와 함께 고려합니다.
-                # 아니면, 에러 상태를 명시적으로 표현하는 것이 더 좋습니다.
-                # get_save_slots 함수는 이제 UI쪽에 가까우니 거기서 에러딕셔너리를 만들고
-                # 여기서는 순수하게 정보나 None만 반환하겠습니다.
-                slots[slot] = {"error": "파일 손상"} # get_save_slots와 호환성을 위해 유지
+                with self._index_path.open('r', encoding='utf-8') as f:
+                    self._index = json.load(f).get("slots", {})
+            except (OSError, ValueError, AttributeError):
+                self._index = {}
+        return self._index
+
+    def _write_index(self) -> None:
+        payload = json.dumps({"slots": self._index}, ensure_ascii=False, separators=(",", ":"))
+        try:
+            atomic_write(self._index_path, payload.encode('utf-8'))
+        except OSError as e:
+            # 색인은 다음 목록 조회 때 세이브 파일로부터 다시 만들 수 있습니다.
+            print(f"⚠️ 세이브 색인 저장 실패: {e}")
+
+    def _record_slot(self, slot: int, file_path: Path, metadata: Dict[str, Any]) -> None:
+        """저장된 파일의 stat과 메타데이터를 색인에 기록합니다."""
+        stat = file_path.stat()
+        with self._index_lock:
+            self._load_index()[str(slot)] = {
+                **metadata, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size
+            }
+            self._write_index()
+
+    def flush(self) -> None:
+        """백그라운드 저장이 모두 디스크에 기록될 때까지 기다립니다."""
+        if self._writer is None:
+            return
+        self._writer.flush()
+        errors = self._writer.pop_errors()
+        if errors:
+            failed = ", ".join(str(slot) for slot in sorted(errors))
+            raise SaveFileError(f"슬롯 {failed} 저장에 실패했습니다.")
+
+    def close(self) -> None:
+        """남은 백그라운드 저장을 마치고 작성기를 종료합니다."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def get_save_slots_info(self) -> Dict[int, Optional[SaveSlotInfo]]:
+        """
+        모든 세이브 슬롯의 정보를 가져옵니다.
+        
+        슬롯 색인만 읽고, 디렉터리를 한 번 훑어 얻은 stat(mtime, 크기)이
+        색인과 다른 슬롯만 세이브 파일을 열어 색인을 갱신합니다.
+        """
+        if self._writer is not None:
+            self._writer.flush()
+        
+        slot_files = {SAVE_FILE_TEMPLATE.format(slot): slot for slot in range(1, SAVE_SLOT_COUNT + 1)}
+        stats = {}
+        with os.scandir(self.save_dir) as entries:
+            for entry in entries:
+                slot = slot_files.get(entry.name)
+                if slot is not None and entry.is_file():
+                    stats[slot] = entry.stat()
+        
+        slots = {}
+        with self._index_lock:
+            index = self._load_index()
+            changed = False
+            
+            for slot in range(1, SAVE_SLOT_COUNT + 1):
+                stat = stats.get(slot)
+                if stat is None:
+                    changed |= index.pop(str(slot), None) is not None
+                    slots[slot] = None
+                    continue
+                
+                entry = index.get(str(slot))
+                if entry is None or entry.get("mtime_ns") != stat.st_mtime_ns or entry.get("size") != stat.st_size:
+                    try:
+                        data = self._load_slot_data(slot)
+                    except SaveFileError:
+                        changed |= index.pop(str(slot), None) is not None
+                        slots[slot] = {"error": "파일 손상"}  # UI에서 손상 슬롯으로 표시
+                        continue
+                    entry = {**slot_metadata(data), "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+                    index[str(slot)] = entry
+                    changed = True
+                
+                mod_time = datetime.fromtimestamp(entry["mtime_ns"] / 1e9)
+                slots[slot] = SaveSlotInfo.from_dict(entry, mod_time)
+            
+            if changed:
+                self._write_index()
         return slots
 
     def save_game(self, slot: int, player_data: Dict[str, Any]) -> None:
-        """게임 상태를 지정된 슬롯에 저장합니다."""
+        """
+        게임 상태를 지정된 슬롯에 저장합니다.
+        
+        백그라운드 모드에서는 호출 시점에 직렬화한 스냅샷을 작성기에 넘기고
+        바로 반환합니다.
+        """
         self._validate_slot_number(slot)
         file_path = self._get_save_file_path(slot)
-        self._write_save_file(file_path, player_data)
+        if "version" not in player_data:
+            player_data = {"version": SAVE_FORMAT_VERSION, **player_data}
+        metadata = slot_metadata(player_data)
+        generation = os.urandom(8).hex()
+        player_data = {**player_data, JOURNAL_GENERATION_KEY: generation}
+        
+        def on_written() -> None:
+            # 전체 스냅샷이 저널을 대체합니다. 스냅샷이 디스크에 기록된 뒤에
+            # 지우므로, 그 전에 종료되면 이전 스냅샷과 저널이 그대로 남습니다.
+            self._snapshot_written(slot, generation)
+            self._record_slot(slot, file_path, metadata)
+        
+        if self._writer is not None:
+            self._writer.submit(slot, file_path, self._serialize(player_data), on_written)
+        else:
+            self._write_save_file(file_path, player_data)
+            on_written()
 
     def load_game(self, slot: int) -> Dict[str, Any]:
-        """지정된 슬롯에서 게임 데이터를 로드합니다."""
+        """지정된 슬롯에서 게임 데이터를 로드합니다. (마이그레이션 후 저널 재적용)"""
         self._validate_slot_number(slot)
+        self.flush()
         file_path = self._get_save_file_path(slot)
         
         if not file_path.exists():
             raise SaveFileError("해당 슬롯에 저장된 데이터가 없습니다.")
         
-        return self._read_save_file(file_path)
+        return self._load_slot_data(slot)
 
     def delete_save(self, slot: int) -> None:
         """지정된 슬롯의 세이브 파일을 삭제합니다."""
         self._validate_slot_number(slot)
+        if self._writer is not None:
+            self._writer.flush()
         file_path = self._get_save_file_path(slot)
         
         if not file_path.exists():
@@ -95,4 +300,86 @@ class SaveSystem:
         try:
             file_path.unlink()
         except IOError as e:
-            raise SaveFileError(f"파일 삭제 중 오류가 발생했습니다: {e}") 
\ No newline at end of file
+            raise SaveFileError(f"파일 삭제 중 오류가 발생했습니다: {e}")
+        self._remove_journal(slot)
+        self._generations.pop(slot, None)
+        
+        with self._index_lock:
+            if self._load_index().pop(str(slot), None) is not None:
+                self._write_index()
+
+    def has_save(self, slot: int) -> bool:
+        """슬롯에 스냅샷이 있는지 확인합니다."""
+        self._validate_slot_number(slot)
+        if self._writer is not None:
+            self._writer.flush()
+        return self._get_save_file_path(slot).exists()
+
+    def save_delta(self, slot: int, sections: Dict[str, Any]) -> None:
+        """
+        바뀐 섹션만 슬롯의 저널에 한 줄로 추가합니다.
+
+        불러올 때 스냅샷 위에 기록 순서대로 덮어쓰며, 저널이
+        JOURNAL_COMPACT_ENTRIES개 쌓이면 스냅샷으로 합칩니다.
+        슬롯에 스냅샷이 없으면 SaveFileError가 발생합니다.
+        """
+        if not self.has_save(slot):
+            raise SaveFileError("변경분을 기록할 스냅샷이 없습니다.")
+        
+        try:
+            line = json.dumps(sections, ensure_ascii=False, separators=(",", ":")) + "\n"
+        except (TypeError, ValueError) as e:
+            raise SaveFileError(f"저장할 수 없는 데이터입니다: {e}")
+        
+        if slot not in self._generations:
+            self._load_snapshot(slot)
+        generation = self._generations[slot]
+        if slot not in self._journal_counts:
+            journal_generation, deltas = self._read_journal(slot)
+            if journal_generation == generation:
+                self._journal_counts[slot] = len(deltas)
+            else:
+                self._remove_journal(slot)  # 이전 스냅샷의 저널
+        
+        # 새 저널은 스냅샷의 세대로 시작 (남아 있던 손상된 줄은 덮어씀)
+        mode = 'a'
+        if self._journal_counts[slot] == 0:
+            mode = 'w'
+            line = json.dumps({JOURNAL_GENERATION_KEY: generation}) + "\n" + line
+        try:
+            with SAVE_IO_SECONDS.labels("journal").time():
+                with self._get_journal_path(slot).open(mode, encoding='utf-8') as f:
+                    f.write(line)
+                    f.flush()
+                    os.fsync(f.fileno())
+        except OSError as e:
+            SAVE_IO_ERRORS.labels("journal").inc()
+            raise SaveFileError(f"저널 기록 중 오류가 발생했습니다: {e}")
+        SAVE_IO_BYTES.labels("journal").inc(len(line.encode('utf-8')))
+        self._journal_counts[slot] += 1
+        
+        # 목록 표시용 메타데이터만 갱신 (스냅샷 stat은 그대로)
+        with self._index_lock:
+            entry = self._load_index().get(str(slot))
+            if entry is not None:
+                metadata = slot_metadata({**entry, **sections})
+                if any(entry.get(key) != value for key, value in metadata.items()):
+                    entry.update(metadata)
+                    self._write_index()
+        
+        if self._journal_counts[slot] >= JOURNAL_COMPACT_ENTRIES:
+            self.compact_journal(slot)
+
+    def compact_journal(self, slot: int) -> None:
+        """
+        저널을 스냅샷에 합치고 비웁니다.
+
+        합친 스냅샷을 새 세대로 원자적으로 쓴 뒤 저널을 지우므로, 그 사이에
+        종료되어 남은 저널은 세대가 달라 무시됩니다.
+        """
+        data = self._load_slot_data(slot)
+        generation = os.urandom(8).hex()
+        file_path = self._get_save_file_path(slot)
+        self._write_save_file(file_path, {**data, JOURNAL_GENERATION_KEY: generation})
+        self._snapshot_written(slot, generation)
+        self._record_slot(slot, file_path, slot_metadata(data))
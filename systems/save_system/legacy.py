@@ -0,0 +1,212 @@
+from typing import Any, Dict, Optional
+
+from .core import SaveSystem
+from .schema import SAVE_FORMAT_VERSION
+from .ui import show_save_slots, get_user_slot_choice, confirm_action
+from .exceptions import SaveSystemError, UserCancelError
+
+
+__all__ = [
+    "get_save_slots",
+    "show_save_slots_legacy", # 이름 변경
+    "save_game",
+    "load_game",
+    "delete_save",
+    "autosave",
+    "build_save_data",
+    "restore_player",
+    "SaveSystemWrapper", # 이름 변경
+]
+
+# 전역 SaveSystem 인스턴스 (첫 사용 시 생성: 임포트만으로 세이브 디렉터리를 만들지 않음)
+_save_system: Optional[SaveSystem] = None
+
+
+def _get_save_system() -> SaveSystem:
+    global _save_system
+    if _save_system is None:
+        _save_system = SaveSystem()
+    return _save_system
+
+# 이번 세션에서 마지막으로 저장/불러온 슬롯 (자동 저장 대상)
+_current_slot: Optional[int] = None
+
+
+def get_save_slots() -> Dict[int, Any]:
+    """
+    사용 가능한 세이브 슬롯 정보를 반환합니다. (레거시 호환용)
+    """
+    return _get_save_system().get_save_slots_info()
+
+
+def show_save_slots_legacy():
+    """
+    세이브 슬롯 목록을 표시합니다.
+    """
+    show_save_slots(_get_save_system())
+
+
+def build_save_data(player: Any) -> Dict[str, Any]:
+    """플레이어와 현재 지역을 현재 스키마 버전의 세이브 데이터로 만듭니다."""
+    from systems.region import region_manager
+
+    return {
+        "version": SAVE_FORMAT_VERSION,
+        **player.to_state(),
+        "region": region_manager.to_state(),
+    }
+
+
+def restore_player(data: Dict[str, Any]) -> Any:
+    """세이브 데이터에서 플레이어를 복원하고 현재 지역을 되돌립니다."""
+    from characters.player import Player
+    from systems.region import region_manager
+
+    player = Player.from_state(data)
+    region_manager.load_state(data.get("region", {}))
+    return player
+
+
+def autosave(player: Any) -> bool:
+    """
+    마지막으로 저장/불러온 슬롯에 바뀐 섹션만 자동 저장합니다.
+
+    슬롯에 스냅샷이 있으면 dirty 섹션만 저널에 추가하고, 없으면 전체를
+    저장합니다. 이번 세션에 슬롯을 정한 적이 없거나 바뀐 것이 없으면
+    아무것도 하지 않습니다.
+
+    Returns:
+        저장했으면 True
+    """
+    if _current_slot is None:
+        return False
+    sections = player.dirty_sections()
+    if not sections:
+        return False
+
+    save_system = _get_save_system()
+    try:
+        if save_system.has_save(_current_slot):
+            from systems.region import region_manager
+
+            delta = player.to_state(sections)
+            if "location" in sections:
+                delta["region"] = region_manager.to_state()
+            save_system.save_delta(_current_slot, delta)
+        else:
+            save_system.save_game(_current_slot, build_save_data(player))
+    except SaveSystemError as e:
+        print(f"⚠️ 자동 저장 실패: {e}")
+        return False
+
+    player.clear_dirty()
+    return True
+
+
+def save_game(player: Any) -> bool:
+    """
+    플레이어 데이터를 선택한 슬롯에 저장합니다.
+
+    Returns:
+        저장에 성공하면 True
+    """
+    global _current_slot
+    slots_info = show_save_slots(_get_save_system())
+    
+    try:
+        slot_num = get_user_slot_choice("어느 슬롯에 저장하시겠습니까?")
+        
+        if slots_info.get(slot_num) is not None:
+            if not confirm_action(f"슬롯 {slot_num}에 이미 데이터가 있습니다. 덮어쓰시겠습니까?"):
+                print("저장을 취소했습니다.")
+                return False
+
+        _get_save_system().save_game(slot_num, build_save_data(player))
+        player.clear_dirty()
+        _current_slot = slot_num
+        print(f"💾 슬롯 {slot_num}에 게임이 저장되었습니다!")
+        return True
+
+    except (SaveSystemError, UserCancelError) as e:
+        print(f"❗ {e}")
+    except Exception as e:
+        print(f"❗ 예상치 못한 오류가 발생했습니다: {e}")
+    return False
+
+
+def load_game() -> Optional[Any]:
+    """
+    선택한 슬롯에서 게임을 불러와 복원된 플레이어를 반환합니다.
+    """
+    global _current_slot
+    slots_info = show_save_slots(_get_save_system())
+    available_slots = [
+        s for s, info in slots_info.items() if info is not None
+    ]
+
+    if not available_slots:
+        print("\n❗ 저장된 파일이 없습니다.")
+        return None
+
+    try:
+        slot_num = get_user_slot_choice("불러올 슬롯 번호를 입력하세요", available_slots)
+        player = restore_player(_get_save_system().load_game(slot_num))
+        _current_slot = slot_num
+        print(f"📂 슬롯 {slot_num}에서 게임 데이터를 불러왔습니다.")
+        return player
+    except (SaveSystemError, UserCancelError) as e:
+        print(f"❗ {e}")
+        return None
+    except Exception as e:
+        print(f"❗ 예상치 못한 오류가 발생했습니다: {e}")
+        return None
+
+
+def delete_save():
+    """
+    선택한 슬롯의 세이브 파일을 삭제합니다.
+    """
+    global _current_slot
+    slots_info = show_save_slots(_get_save_system())
+    available_slots = [
+        s for s, info in slots_info.items() if info is not None
+    ]
+
+    if not available_slots:
+        print("\n❗ 삭제할 세이브 파일이 없습니다.")
+        return
+
+    try:
+        slot_num = get_user_slot_choice("삭제할 슬롯 번호를 입력하세요", available_slots)
+
+        slot_info = slots_info[slot_num]
+        if isinstance(slot_info, dict) and "error" in slot_info:
+             print(f"\n삭제할 데이터: [ 파일 손상 ]")
+        else:
+            print(f"\n삭제할 데이터: {slot_info}")
+
+        if not confirm_action("정말로 삭제하시겠습니까?"):
+            print("삭제를 취소했습니다.")
+            return
+
+        _get_save_system().delete_save(slot_num)
+        if slot_num == _current_slot:
+            _current_slot = None
+        print(f"🗑️ 슬롯 {slot_num}의 세이브 데이터가 삭제되었습니다.")
+
+    except (SaveSystemError, UserCancelError) as e:
+        print(f"❗ {e}")
+    except Exception as e:
+        print(f"❗ 예상치 못한 오류가 발생했습니다: {e}")
+
+
+class SaveSystemWrapper:
+    """래퍼 클래스 - 새로운 SaveSystem 모듈을 사용하도록 업데이트되었습니다."""
+    def save_game(self, player: Any) -> bool:
+        return save_game(player)
+
+    def load_game(self) -> Optional[Any]:
+        return load_game()
+
+    def autosave(self, player: Any) -> bool:
+        return autosave(player) 
\ No newline at end of file
@@ -0,0 +1,129 @@
+import json
+import zlib
+from typing import Any, Callable, Dict
+
+from .constants import DEFAULT_PLAYER_LEVEL, DEFAULT_PLAYER_LOCATION, DEFAULT_PLAYER_NAME
+from .exceptions import SaveFileError
+
+try:
+    import msgpack
+except ImportError:  # 선택 의존성: 없으면 JSON 계열 코덱만 사용
+    msgpack = None
+
+# 현재 세이브 스키마 버전
+SAVE_FORMAT_VERSION = 2
+
+# 코덱별 매직 헤더 (일반 JSON은 헤더 없이 '{'로 시작)
+ZLIB_MAGIC = b"JRZ1"
+MSGPACK_MAGIC = b"JRM1"
+
+SAVE_CODECS = ("json", "zlib", "msgpack")
+
+
+# --- 마이그레이션 ---
+
+def _migrate_v1_to_v2(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    v1(평면 구조) → v2(섹션 구조)
+
+    v1의 exp는 현재 레벨 안에서의 경험치였으므로 누적 경험치로 바꿉니다.
+    """
+    from systems.experience import exp_system
+
+    level = data.get("level", DEFAULT_PLAYER_LEVEL)
+    inventory = data.get("inventory")
+    if not isinstance(inventory, dict):
+        inventory = {}
+    elif "items" not in inventory:
+        inventory = {"items": inventory}  # v1은 아이템 딕셔너리만 저장
+    stats = {
+        "level": level,
+        "exp": exp_system.total_exp_for_level(level) + data.get("exp", 0),
+        "hp": data.get("hp"),
+        "mp": data.get("mp"),
+    }
+    return {
+        "version": 2,
+        "name": data.get("name"),
+        "job": data.get("job"),
+        "stats": {key: value for key, value in stats.items() if value is not None},
+        "inventory": inventory,
+        "equipped_weapon": None,
+        "quests": {"active": {}, "completed": []},
+        "location": {"current": data.get("location", DEFAULT_PLAYER_LOCATION)},
+        "status_effects": {},
+    }
+
+
+# 버전 → 다음 버전으로 올리는 함수
+MIGRATIONS: Dict[int, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    1: _migrate_v1_to_v2,
+}
+
+
+def migrate(data: Dict[str, Any]) -> Dict[str, Any]:
+    """세이브 데이터를 현재 스키마 버전까지 차례로 올립니다. (버전이 없으면 v1)"""
+    version = data.get("version", 1)
+    while version < SAVE_FORMAT_VERSION:
+        if version not in MIGRATIONS:
+            raise SaveFileError(f"지원하지 않는 세이브 버전입니다: v{version}")
+        data = MIGRATIONS[version](data)
+        version = data["version"]
+
+    if version > SAVE_FORMAT_VERSION:
+        raise SaveFileError(f"더 새로운 버전의 세이브입니다: v{version}")
+    return data
+
+
+def slot_metadata(data: Dict[str, Any]) -> Dict[str, Any]:
+    """슬롯 목록에 표시할 필드만 추출합니다. (v1 평면 구조와 v2 섹션 구조 모두 지원)"""
+    stats = data.get("stats", data)
+    location = data.get("location", DEFAULT_PLAYER_LOCATION)
+    if isinstance(location, dict):
+        location = location.get("current", DEFAULT_PLAYER_LOCATION)
+    return {
+        "name": data.get("name", DEFAULT_PLAYER_NAME),
+        "level": stats.get("level", DEFAULT_PLAYER_LEVEL),
+        "location": location,
+    }
+
+
+# --- 코덱 ---
+
+def encode_save(data: Dict[str, Any], codec: str = "json", compact: bool = False) -> bytes:
+    """세이브 데이터를 바이트열로 인코딩합니다."""
+    try:
+        if codec == "msgpack":
+            if msgpack is None:
+                raise SaveFileError("msgpack이 설치되어 있지 않습니다.")
+            return MSGPACK_MAGIC + msgpack.packb(data, use_bin_type=True)
+
+        if codec == "zlib":
+            text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+            return ZLIB_MAGIC + zlib.compress(text.encode('utf-8'))
+
+        if codec != "json":
+            raise SaveFileError(f"알 수 없는 세이브 형식입니다: {codec}")
+        if compact:
+            text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        else:
+            text = json.dumps(data, ensure_ascii=False, indent=2)
+        return text.encode('utf-8')
+    except (TypeError, ValueError) as e:
+        raise SaveFileError(f"저장할 수 없는 데이터입니다: {e}")
+
+
+def decode_save(payload: bytes) -> Dict[str, Any]:
+    """매직 헤더로 형식을 판별해 세이브 데이터를 디코딩합니다."""
+    try:
+        if payload.startswith(ZLIB_MAGIC):
+            return json.loads(zlib.decompress(payload[len(ZLIB_MAGIC):]).decode('utf-8'))
+        if payload.startswith(MSGPACK_MAGIC):
+            if msgpack is None:
+                raise SaveFileError("msgpack 세이브를 읽으려면 msgpack이 필요합니다.")
+            return msgpack.unpackb(payload[len(MSGPACK_MAGIC):], raw=False)
+        return json.loads(payload.decode('utf-8'))
+    except SaveFileError:
+        raise
+    except Exception:
+        raise SaveFileError("파일이 손상되었습니다.")
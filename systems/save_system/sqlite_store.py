@@ -0,0 +1,264 @@
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config import ensure_parent_dir
+
+from .constants import SAVE_SLOT_COUNT, SAVE_TIME_FORMAT, DEFAULT_SAVE_DB, DEFAULT_ACCOUNT
+from .core import SAVE_IO_BYTES, SAVE_IO_ERRORS, SAVE_IO_SECONDS
+from .exceptions import InvalidSlotError, SaveFileError
+from .models import SaveSlotInfo
+from .schema import SAVE_FORMAT_VERSION, decode_save, encode_save, migrate, slot_metadata
+
+# 계정·슬롯당 한 행. 목록 조회에 쓰는 메타데이터는 별도 열로 두고 색인합니다.
+_CREATE_TABLE = (
+    "CREATE TABLE IF NOT EXISTS saves ("
+    " account TEXT NOT NULL,"
+    " slot INTEGER NOT NULL,"
+    " name TEXT NOT NULL,"
+    " level INTEGER NOT NULL,"
+    " location TEXT NOT NULL,"
+    " saved_at REAL NOT NULL,"
+    " version INTEGER NOT NULL,"
+    " payload BLOB NOT NULL,"
+    " PRIMARY KEY (account, slot))"
+)
+_CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_saves_name ON saves (name)",
+    "CREATE INDEX IF NOT EXISTS idx_saves_saved_at ON saves (saved_at)",
+)
+
+# 같은 SQL 문자열은 연결의 문장 캐시에서 준비된(prepared) 문장으로 재사용됩니다.
+_UPSERT = (
+    "INSERT INTO saves (account, slot, name, level, location, saved_at, version, payload)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    " ON CONFLICT (account, slot) DO UPDATE SET"
+    " name = excluded.name, level = excluded.level, location = excluded.location,"
+    " saved_at = excluded.saved_at, version = excluded.version, payload = excluded.payload"
+)
+_SELECT_SLOTS = "SELECT slot, name, level, location, saved_at FROM saves WHERE account = ?"
+_SELECT_PAYLOAD = "SELECT payload FROM saves WHERE account = ? AND slot = ?"
+_SELECT_EXISTS = "SELECT 1 FROM saves WHERE account = ? AND slot = ?"
+_DELETE = "DELETE FROM saves WHERE account = ? AND slot = ?"
+
+
+class SQLiteSaveSystem:
+    """
+    SQLite 세이브 저장소 (SaveSystem과 같은 API)
+
+    여러 계정의 세이브를 WAL 모드의 DB 한 파일에 (계정, 슬롯)당 한 행으로
+    저장합니다. 슬롯 목록은 색인된 메타데이터 열만 조회하므로 디렉터리
+    탐색이나 파일별 열기/파싱이 없습니다.
+
+    기본으로는 저장할 때마다 커밋합니다. batch_size를 키우면 저장을 열린
+    트랜잭션에 쌓았다가 batch_size건이 되거나 첫 저장 후 flush_interval초가
+    지나면 한 번에 커밋합니다. (쌓여 있는 동안은 다른 연결이 쓸 수 없음)
+    save_delta는 저널 대신 행의 섹션을 제자리에서 갱신하므로
+    compact_journal은 할 일이 없습니다.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_SAVE_DB, account: str = DEFAULT_ACCOUNT,
+                 codec: str = "zlib", slot_count: int = SAVE_SLOT_COUNT, batch_size: int = 1,
+                 flush_interval: float = 1.0):
+        """
+        Args:
+            db_path: SQLite DB 파일 경로
+            account: 계정을 지정하지 않은 호출에 쓸 기본 계정
+            codec: 세이브 본문 코덱 ("json", "zlib", "msgpack")
+            slot_count: 계정당 슬롯 수
+            batch_size: 이 건수만큼 저장이 쌓이면 커밋 (기본 1: 매번 커밋)
+            flush_interval: 일괄 커밋 시 첫 저장 후 이 시간(초)이 지나면 커밋
+        """
+        self.db_path = db_path
+        self.account = account
+        self.codec = codec
+        self.slot_count = slot_count
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._pending = 0  # 커밋되지 않은 저장 건수
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+        try:
+            ensure_parent_dir(db_path)
+            self._conn = sqlite3.connect(db_path, timeout=5.0, check_same_thread=False,
+                                         isolation_level=None, cached_statements=64)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_CREATE_TABLE)
+            for statement in _CREATE_INDEXES:
+                self._conn.execute(statement)
+        except (OSError, sqlite3.Error) as e:
+            raise SaveFileError(f"세이브 DB를 열 수 없습니다: {e}")
+
+    def _validate_slot_number(self, slot: int) -> None:
+        """슬롯 번호의 유효성을 검사합니다."""
+        if not 1 <= slot <= self.slot_count:
+            raise InvalidSlotError(f"유효하지 않은 슬롯 번호입니다. (1-{self.slot_count})")
+
+    def _row(self, account: str, slot: int, player_data: Dict[str, Any], saved_at: float) -> Tuple:
+        """저장할 한 행(메타데이터 열 + 직렬화된 본문)을 만듭니다."""
+        self._validate_slot_number(slot)
+        if "version" not in player_data:
+            player_data = {"version": SAVE_FORMAT_VERSION, **player_data}
+        metadata = slot_metadata(player_data)
+        return (account, slot, str(metadata["name"]), int(metadata["level"]), str(metadata["location"]),
+                saved_at, player_data["version"], encode_save(player_data, self.codec, compact=True))
+
+    def _begin(self) -> None:
+        if not self._conn.in_transaction:
+            self._conn.execute("BEGIN")
+
+    def _cancel_flush_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _commit(self) -> None:
+        """쌓인 저장을 커밋합니다. (잠금을 잡은 상태에서 호출)"""
+        self._cancel_flush_timer()
+        if self._conn.in_transaction:
+            try:
+                self._conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                self._rollback()
+                raise SaveFileError(f"세이브 DB 커밋에 실패했습니다: {e}")
+        self._pending = 0
+
+    def _rollback(self) -> int:
+        """
+        커밋되지 않은 저장을 모두 버립니다. (잠금을 잡은 상태에서 호출)
+
+        일부만 기록된 트랜잭션이 다음 커밋에 섞여 들어가지 않도록 실패한
+        쓰기 뒤에 호출합니다. 버린 저장 건수를 반환합니다.
+        """
+        self._cancel_flush_timer()
+        if self._conn.in_transaction:
+            try:
+                self._conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass  # 오류로 SQLite가 이미 트랜잭션을 되돌린 경우
+        discarded, self._pending = self._pending, 0
+        return discarded
+
+    def _write_rows_locked(self, rows: List[Tuple]) -> None:
+        """행을 기록하고 batch_size건마다 커밋합니다. (잠금을 잡은 상태에서 호출)"""
+        with SAVE_IO_SECONDS.labels("db_write").time():
+            try:
+                self._begin()
+                self._conn.executemany(_UPSERT, rows)
+            except sqlite3.Error as e:
+                SAVE_IO_ERRORS.labels("db_write").inc()
+                discarded = self._rollback()
+                suffix = f" (커밋되지 않은 저장 {discarded}건도 취소됨)" if discarded else ""
+                raise SaveFileError(f"저장 중 오류가 발생했습니다: {e}{suffix}")
+            self._pending += len(rows)
+            if self._pending >= self.batch_size:
+                self._commit()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        SAVE_IO_BYTES.labels("db_write").inc(sum(len(row[-1]) for row in rows))
+
+    def _write_rows(self, rows: List[Tuple]) -> None:
+        with self._lock:
+            self._write_rows_locked(rows)
+
+    def _timed_flush(self) -> None:
+        try:
+            self.flush()
+        except (SaveFileError, sqlite3.Error) as e:  # 그 사이 close()된 경우 포함
+            print(f"❌ 세이브 DB 자동 커밋 실패: {e}")
+
+    def flush(self) -> None:
+        """커밋되지 않은 저장을 모두 커밋합니다."""
+        with self._lock:
+            self._commit()
+
+    def close(self) -> None:
+        """남은 저장을 커밋하고 DB를 닫습니다."""
+        with self._lock:
+            self._commit()
+            self._conn.close()
+
+    def get_save_slots_info(self, account: Optional[str] = None) -> Dict[int, Optional[SaveSlotInfo]]:
+        """계정의 모든 슬롯 정보를 메타데이터 열만으로 가져옵니다."""
+        with self._lock:
+            rows = self._conn.execute(_SELECT_SLOTS, (account or self.account,)).fetchall()
+
+        slots: Dict[int, Optional[SaveSlotInfo]] = {slot: None for slot in range(1, self.slot_count + 1)}
+        for slot, name, level, location, saved_at in rows:
+            if slot in slots:
+                slots[slot] = SaveSlotInfo(name, level, location,
+                                           datetime.fromtimestamp(saved_at).strftime(SAVE_TIME_FORMAT))
+        return slots
+
+    def save_game(self, slot: int, player_data: Dict[str, Any], account: Optional[str] = None) -> None:
+        """게임 상태를 계정의 슬롯에 저장합니다. (batch_size건마다 커밋)"""
+        self._write_rows([self._row(account or self.account, slot, player_data, time.time())])
+
+    def save_many(self, entries: Iterable[Tuple[str, int, Dict[str, Any]]]) -> int:
+        """
+        여러 (계정, 슬롯, 데이터)를 한 트랜잭션으로 저장하고 바로 커밋합니다.
+
+        Returns:
+            저장한 건수
+        """
+        saved_at = time.time()
+        rows = [self._row(account, slot, data, saved_at) for account, slot, data in entries]
+        self._write_rows(rows)
+        self.flush()
+        return len(rows)
+
+    def has_save(self, slot: int, account: Optional[str] = None) -> bool:
+        """계정의 슬롯에 세이브가 있는지 확인합니다."""
+        self._validate_slot_number(slot)
+        with self._lock:
+            return self._conn.execute(_SELECT_EXISTS, (account or self.account, slot)).fetchone() is not None
+
+    def save_delta(self, slot: int, sections: Dict[str, Any], account: Optional[str] = None) -> None:
+        """
+        바뀐 섹션만 계정의 슬롯 세이브에 덮어씁니다. (SaveSystem.save_delta와 같은 의미)
+
+        파일 저장소처럼 저널을 쌓지 않고 행을 제자리에서 갱신합니다.
+        슬롯에 세이브가 없으면 SaveFileError가 발생합니다.
+        """
+        account = account or self.account
+        self._validate_slot_number(slot)
+        # 읽기부터 쓰기까지 잠금을 잡아 같은 슬롯의 변경분이 서로 덮어쓰지 않게 함
+        with self._lock:
+            row = self._conn.execute(_SELECT_PAYLOAD, (account, slot)).fetchone()
+            if row is None:
+                raise SaveFileError("변경분을 기록할 스냅샷이 없습니다.")
+            data = migrate(decode_save(bytes(row[0])))
+            data.update(sections)
+            self._write_rows_locked([self._row(account, slot, data, time.time())])
+
+    def compact_journal(self, slot: int, account: Optional[str] = None) -> None:
+        """SaveSystem 호환용: 변경분을 행에 바로 반영하므로 합칠 저널이 없습니다."""
+        self._validate_slot_number(slot)
+
+    def load_game(self, slot: int, account: Optional[str] = None) -> Dict[str, Any]:
+        """계정의 슬롯에서 게임 데이터를 로드합니다. (현재 스키마 버전으로 마이그레이션)"""
+        self._validate_slot_number(slot)
+        with self._lock, SAVE_IO_SECONDS.labels("db_read").time():
+            row = self._conn.execute(_SELECT_PAYLOAD, (account or self.account, slot)).fetchone()
+        if row is None:
+            raise SaveFileError("해당 슬롯에 저장된 데이터가 없습니다.")
+        SAVE_IO_BYTES.labels("db_read").inc(len(row[0]))
+        return migrate(decode_save(bytes(row[0])))
+
+    def delete_save(self, slot: int, account: Optional[str] = None) -> None:
+        """계정의 슬롯 세이브를 삭제합니다."""
+        self._validate_slot_number(slot)
+        with self._lock:
+            try:
+                self._begin()
+                self._conn.execute(_DELETE, (account or self.account, slot))
+            except sqlite3.Error as e:
+                self._rollback()
+                raise SaveFileError(f"삭제 중 오류가 발생했습니다: {e}")
+            self._commit()
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Optional
 
 from .constants import (
     UI_SEPARATOR,
@@ -10,13 +10,19 @@ from .exceptions import UserCancelError, InvalidSlotError
 from .models import SaveSlotInfo
 
 
-def show_save_slots(save_system: SaveSystem) -> None:
-    """세이브 슬롯 상태를 화면에 표시합니다."""
+def show_save_slots(save_system: SaveSystem, slots_info: Optional[Dict] = None) -> Dict:
+    """
+    세이브 슬롯 상태를 화면에 표시합니다.
+    
+    표시한 슬롯 정보를 반환하므로, 호출자는 이어지는 덮어쓰기 확인 등에
+    목록을 다시 조회하지 않고 재사용할 수 있습니다.
+    """
     print(f"\n{UI_SEPARATOR}")
     print("                💾 세이브 슬롯")
     print(f"{UI_SEPARATOR}")
 
-    slots_info = save_system.get_save_slots_info()
+    if slots_info is None:
+        slots_info = save_system.get_save_slots_info()
     for slot_num, slot_info in slots_info.items():
         if slot_info is None:
             print(f"슬롯 {slot_num}: [ 비어있음 ]")
@@ -26,6 +32,7 @@ def show_save_slots(save_system: SaveSystem) -> None:
             print(f"슬롯 {slot_num}: {slot_info}")
             print(f"        저장 시간: {slot_info.save_time}")
     print(f"{UI_SEPARATOR}")
+    return slots_info
 
 
 def get_user_slot_choice(
@@ -47,7 +54,7 @@ def get_user_slot_choice(
 
             slot_num = int(choice)
             if not (1 <= slot_num <= SAVE_SLOT_COUNT):
-                raise InvalidSlotError("슬롯 번호는 1에서 3 사이여야 합니다.")
+                raise InvalidSlotError(f"슬롯 번호는 1에서 {SAVE_SLOT_COUNT} 사이여야 합니다.")
             
             if available_slots and slot_num not in available_slots:
                 print("❗ 선택 가능한 슬롯 번호를 입력해주세요.")
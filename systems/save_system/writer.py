@@ -0,0 +1,126 @@
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from utility.file_mode import new_file_mode
+
+
+def _replacement_mode(file_path: Path) -> int:
+    """교체할 파일에 줄 권한: 기존 파일의 권한, 없으면 umask를 적용한 0666"""
+    try:
+        return os.stat(file_path).st_mode & 0o7777
+    except OSError:
+        return new_file_mode(str(file_path.parent))
+
+
+def atomic_write(file_path: Path, payload: bytes) -> None:
+    """
+    파일을 원자적으로 교체합니다.
+
+    같은 디렉터리의 임시 파일에 쓰고 fsync한 뒤 os.replace로 바꿔치기하므로,
+    쓰는 도중에 프로그램이 죽어도 기존 세이브 파일은 온전히 남습니다.
+    교체 전에 임시 파일 권한을 기존 파일의 권한(새 파일이면 new_file_mode)으로
+    맞춥니다.
+    """
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{file_path.name}.", suffix=".tmp", dir=str(file_path.parent))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_name, _replacement_mode(file_path))
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+    # 이름 변경 자체를 디스크에 반영 (POSIX에서만 지원)
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(str(file_path.parent), os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+
+class BackgroundSaveWriter:
+    """
+    세이브 파일을 백그라운드 스레드에서 쓰는 write-behind 작성기
+
+    같은 슬롯에 대한 저장 요청이 쓰기 전에 여러 번 들어오면 마지막
+    요청만 기록합니다. 게임 스레드는 직렬화만 하고 바로 돌아갑니다.
+    """
+
+    def __init__(self):
+        self._pending: Dict[int, Tuple[Path, bytes, Optional[Callable[[], None]]]] = {}
+        self._errors: Dict[int, Exception] = {}
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self.coalesced = 0  # 덮어쓰기로 생략된 저장 횟수
+        self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, slot: int, file_path: Path, payload: bytes,
+               on_written: Optional[Callable[[], None]] = None) -> None:
+        """슬롯 저장을 예약합니다. on_written은 기록 후 작성기 스레드에서 호출됩니다."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("세이브 작성기가 이미 종료되었습니다.")
+            if slot in self._pending:
+                self.coalesced += 1
+            self._pending[slot] = (file_path, payload, on_written)
+            self._errors.pop(slot, None)
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending and self._closed:
+                    return
+                slot = next(iter(self._pending))
+                file_path, payload, on_written = self._pending.pop(slot)
+                self._busy = True
+
+            try:
+                atomic_write(file_path, payload)
+                if on_written is not None:
+                    on_written()
+            except Exception as e:
+                print(f"❌ 슬롯 {slot} 백그라운드 저장 실패: {e}")
+                with self._cond:
+                    self._errors[slot] = e
+
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """예약된 저장이 모두 끝날 때까지 기다립니다. 시간 초과 시 False."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def pop_errors(self) -> Dict[int, Exception]:
+        """슬롯별 백그라운드 저장 오류를 꺼냅니다."""
+        with self._cond:
+            errors, self._errors = self._errors, {}
+            return errors
+
+    def close(self) -> None:
+        """남은 저장을 마치고 스레드를 종료합니다."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
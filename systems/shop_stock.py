@@ -0,0 +1,230 @@
+"""
+전란 그리고 요괴 - 조선시대 RPG
+파일: systems/shop_stock.py
+설명: 상점 재고 저장소 (SQLite 영속화, 원자적 차감) 및 타이머 휠 재입고 스케줄러
+"""
+
+__all__ = [
+    "DEFAULT_STOCK_DB",
+    "DEFAULT_RESTOCK_INTERVAL",
+    "RestockScheduler",
+    "ShopStockStore",
+]
+
+import sqlite3
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import ensure_parent_dir, runtime_path
+
+# 재고 DB 파일 (세이브 파일과 같은 디렉터리)
+DEFAULT_STOCK_DB = runtime_path("shop_stock.db")
+
+# shops.json에 restock_interval이 없을 때의 재입고 주기 (게임 틱)
+DEFAULT_RESTOCK_INTERVAL = 20
+
+StockKey = Tuple[str, str]  # (상점 ID, 아이템명)
+StockListener = Callable[[str, str], None]  # (상점 ID, 아이템명)
+
+
+class RestockScheduler:
+    """
+    해시 타이머 휠 기반 재입고 스케줄러
+
+    재고가 줄어든 (상점, 아이템)만 휠에 등록되므로, 틱마다 모든 상점을
+    훑지 않고 현재 슬롯 하나만 확인합니다. 휠 한 바퀴보다 긴 주기는
+    남은 바퀴 수(rounds)로 표현합니다.
+    """
+
+    def __init__(self, wheel_size: int = 64):
+        self.wheel_size = wheel_size
+        self.current_tick = 0
+        self._slots: List[List[List]] = [[] for _ in range(wheel_size)]  # [rounds, key]
+        self._scheduled: Dict[StockKey, int] = {}  # 키 → 만료 틱
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
+
+    def is_scheduled(self, key: StockKey) -> bool:
+        return key in self._scheduled
+
+    def schedule(self, key: StockKey, interval: int) -> bool:
+        """interval 틱 뒤에 key를 만료시킵니다. 이미 예약된 키는 무시합니다."""
+        if key in self._scheduled:
+            return False
+
+        interval = max(1, interval)
+        slot = (self.current_tick + interval) % self.wheel_size
+        rounds = (interval - 1) // self.wheel_size
+        self._slots[slot].append([rounds, key])
+        self._scheduled[key] = self.current_tick + interval
+        return True
+
+    def advance(self, ticks: int = 1) -> List[StockKey]:
+        """시간을 ticks만큼 진행하고 만료된 키 목록을 반환합니다."""
+        due: List[StockKey] = []
+
+        for _ in range(ticks):
+            self.current_tick += 1
+            slot = self._slots[self.current_tick % self.wheel_size]
+            if not slot:
+                continue
+
+            pending = []
+            for entry in slot:
+                if entry[0] == 0:
+                    del self._scheduled[entry[1]]
+                    due.append(entry[1])
+                else:
+                    entry[0] -= 1
+                    pending.append(entry)
+            slot[:] = pending
+
+        return due
+
+
+class ShopStockStore:
+    """
+    상점 재고 저장소
+
+    재고는 SQLite에 저장되어 재시작 후에도 유지됩니다. 차감은
+    `stock >= ?` 조건부 UPDATE 한 문장으로 처리하므로 같은 DB를 여러
+    세션이 공유해도 재고가 음수가 되지 않으며, 프로세스 안에서는
+    잠금으로 연결과 스케줄러를 보호합니다.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_STOCK_DB,
+                 scheduler: Optional[RestockScheduler] = None):
+        self.db_path = db_path
+        self.scheduler = scheduler or RestockScheduler()
+        self._lock = threading.Lock()
+        self._intervals: Dict[str, int] = {}
+        self._listeners: List[StockListener] = []
+
+        try:
+            ensure_parent_dir(db_path)
+            self._conn = sqlite3.connect(db_path, timeout=5.0, check_same_thread=False)
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️ 재고 DB를 열 수 없어 메모리에만 저장합니다: {e}")
+            self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS shop_stock ("
+                " shop_id TEXT NOT NULL,"
+                " item_name TEXT NOT NULL,"
+                " stock INTEGER NOT NULL,"
+                " max_stock INTEGER NOT NULL,"
+                " PRIMARY KEY (shop_id, item_name))"
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @property
+    def current_tick(self) -> int:
+        """재고 시계의 현재 게임 틱"""
+        return self.scheduler.current_tick
+
+    def add_listener(self, callback: StockListener):
+        """재고가 바뀔 때 호출할 콜백을 등록합니다."""
+        self._listeners.append(callback)
+
+    def _notify(self, shop_id: str, item_name: str):
+        for callback in self._listeners:
+            callback(shop_id, item_name)
+
+    def register_shop(self, shop_id: str, items: Dict[str, int],
+                      restock_interval: int = DEFAULT_RESTOCK_INTERVAL):
+        """
+        상점의 기본 재고를 등록합니다.
+
+        이미 저장된 재고는 유지하고 최대 재고만 갱신하며, 재고가 모자란
+        아이템은 재입고를 예약합니다.
+        """
+        with self._lock:
+            self._intervals[shop_id] = restock_interval
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO shop_stock (shop_id, item_name, stock, max_stock)"
+                    " VALUES (?, ?, ?, ?)"
+                    " ON CONFLICT (shop_id, item_name) DO UPDATE SET max_stock = excluded.max_stock",
+                    [(shop_id, name, count, count) for name, count in items.items()],
+                )
+            rows = self._conn.execute(
+                "SELECT item_name FROM shop_stock WHERE shop_id = ? AND stock < max_stock",
+                (shop_id,),
+            ).fetchall()
+            for (item_name,) in rows:
+                self.scheduler.schedule((shop_id, item_name), restock_interval)
+
+    def get_stock(self, shop_id: str, item_name: str) -> int:
+        """현재 재고 수량을 반환합니다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stock FROM shop_stock WHERE shop_id = ? AND item_name = ?",
+                (shop_id, item_name),
+            ).fetchone()
+        return row[0] if row else 0
+
+    def get_shop_stock(self, shop_id: str) -> Dict[str, int]:
+        """상점의 아이템별 재고를 반환합니다."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT item_name, stock FROM shop_stock WHERE shop_id = ?",
+                (shop_id,),
+            ).fetchall()
+        return dict(rows)
+
+    def take(self, shop_id: str, item_name: str, quantity: int = 1) -> bool:
+        """
+        재고를 원자적으로 차감합니다.
+
+        Returns:
+            재고가 충분해 차감했으면 True
+        """
+        with self._lock:
+            with self._conn:
+                cursor = self._conn.execute(
+                    "UPDATE shop_stock SET stock = stock - ?"
+                    " WHERE shop_id = ? AND item_name = ? AND stock >= ?",
+                    (quantity, shop_id, item_name, quantity),
+                )
+            if cursor.rowcount != 1:
+                return False
+
+            interval = self._intervals.get(shop_id, DEFAULT_RESTOCK_INTERVAL)
+            self.scheduler.schedule((shop_id, item_name), interval)
+
+        self._notify(shop_id, item_name)
+        return True
+
+    def restock(self, shop_id: str, item_name: str):
+        """아이템 재고를 최대치로 채웁니다."""
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE shop_stock SET stock = max_stock WHERE shop_id = ? AND item_name = ?",
+                    (shop_id, item_name),
+                )
+        self._notify(shop_id, item_name)
+
+    def advance_time(self, ticks: int = 1) -> List[StockKey]:
+        """
+        게임 시간을 진행하고 주기가 돌아온 아이템을 재입고합니다.
+
+        Returns:
+            재입고된 (상점 ID, 아이템명) 목록
+        """
+        with self._lock:
+            due = self.scheduler.advance(ticks)
+            if due:
+                with self._conn:
+                    self._conn.executemany(
+                        "UPDATE shop_stock SET stock = max_stock WHERE shop_id = ? AND item_name = ?",
+                        due,
+                    )
+        for shop_id, item_name in due:
+            self._notify(shop_id, item_name)
+        return due
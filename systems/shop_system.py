@@ -6,34 +6,53 @@
 
 import json
 import os
-from typing import Dict, List, Optional
-from systems.weapon_system import WeaponSystem
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+from systems.weapon_system import get_weapon_system
 from systems.item import basic_items
+from systems.shop_stock import DEFAULT_RESTOCK_INTERVAL, DEFAULT_STOCK_DB, ShopStockStore
+from systems.pricing import PricingEngine
+from utility.metrics import counter
+
+# 상점 거래 계측 (kind: "item"/"weapon", result: "ok" 또는 실패 사유)
+SHOP_TRANSACTIONS = counter("shop_transactions_total", "상점 구매 시도 결과별 횟수", ("kind", "result"))
+SHOP_SALES_VALUE = counter("shop_sales_value_total", "구매 성공 거래의 가격 합계 (전)", ("kind",))
+
+if TYPE_CHECKING:
+    from systems.npc_system import NPC
 
 
 class Shop:
     """상점 클래스"""
     
-    def __init__(self, shop_data: Dict):
+    def __init__(self, shop_data: Dict, stock_store: Optional[ShopStockStore] = None,
+                 pricing: Optional[PricingEngine] = None):
         self.id: str = shop_data.get("id", "")
         self.name: str = shop_data.get("name", "알 수 없는 상점")
         self.npc_name: str = shop_data.get("npc_name", "")
         self.region: str = shop_data.get("region", "")
-        self.items: Dict[str, int] = shop_data.get("items", {})  # 아이템명: 재고
+        self.items: Dict[str, int] = shop_data.get("items", {})  # 아이템명: 최대 재고
         self.weapons: List[str] = shop_data.get("weapons", [])   # 무기 ID 목록
+        self.restock_interval: int = shop_data.get("restock_interval", DEFAULT_RESTOCK_INTERVAL)
         
-        # 무기 시스템 참조
-        self.weapon_system = WeaponSystem()
+        # 공유 무기 시스템 참조
+        self.weapon_system = get_weapon_system()
+        
+        # 현재 재고는 저장소에서 관리 (없으면 메모리 전용 저장소)
+        self.stock_store = stock_store or ShopStockStore(":memory:")
+        self.stock_store.register_shop(self.id, self.items, self.restock_interval)
+        self.pricing = pricing or PricingEngine(self.stock_store)
+    
+    def get_stock(self, item_name: str) -> int:
+        """아이템의 현재 재고를 반환합니다."""
+        return self.stock_store.get_stock(self.id, item_name)
     
     def get_item_price(self, item_name: str) -> int:
-        """아이템 가격을 반환합니다."""
-        if item_name in basic_items:
-            return basic_items[item_name].price
-        return 0
+        """아이템 가격을 반환합니다. (지역 할인과 재고 수준 반영)"""
+        return self.pricing.get_price(self, item_name)
     
     def has_item_in_stock(self, item_name: str) -> bool:
         """아이템 재고가 있는지 확인합니다."""
-        return self.items.get(item_name, 0) > 0
+        return self.get_stock(item_name) > 0
     
     def has_weapon_in_stock(self, weapon_id: str) -> bool:
         """무기 재고가 있는지 확인합니다."""
@@ -55,12 +74,15 @@ class Shop:
         print("\n📦 **소비 아이템**")
         print("-" * 30)
         
-        for item_name, stock in self.items.items():
+        stock_by_item = self.stock_store.get_shop_stock(self.id)
+        prices = self.pricing.get_price_table(self)
+        for item_name in self.items:
+            stock = stock_by_item.get(item_name, 0)
             if item_name in basic_items:
                 item = basic_items[item_name]
                 stock_text = f"재고: {stock}개" if stock > 0 else "품절"
                 print(f"💊 {item_name}")
-                print(f"   💰 가격: {item.price}전")
+                print(f"   💰 가격: {prices.get(item_name, 0)}전")
                 print(f"   📦 {stock_text}")
                 print(f"   📝 {item.description}")
                 print()
@@ -78,7 +100,8 @@ class Shop:
             weapon = self.weapon_system.get_weapon(weapon_id)
             if weapon:
                 # 직업 제한 확인
-                usable = weapon.can_be_used_by(player_class) if player_class else True
+                effective_attack = weapon.attack_for(player_class) if player_class else None
+                usable = effective_attack is not None if player_class else True
                 restriction_text = "" if usable else " ❌ 사용 불가"
                 
                 print(f"{weapon.get_rarity_color()} {weapon.name}{restriction_text}")
@@ -86,13 +109,8 @@ class Shop:
                 print(f"   ⚔️ 공격력: {weapon.attack}")
                 
                 # 직업별 효과적 공격력 표시
-                if player_class and usable:
-                    try:
-                        effective_attack = weapon.get_effective_attack(player_class)
-                        if effective_attack != weapon.attack:
-                            print(f"   📊 {player_class} 효과적 공격력: {effective_attack}")
-                    except ValueError:
-                        pass
+                if effective_attack is not None and effective_attack != weapon.attack:
+                    print(f"   📊 {player_class} 효과적 공격력: {effective_attack}")
                 
                 print(f"   💰 가격: {weapon.price}전")
                 print(f"   📝 {weapon.description}")
@@ -106,11 +124,13 @@ class Shop:
         """아이템을 구매합니다."""
         # 재고 확인
         if not self.has_item_in_stock(item_name):
+            SHOP_TRANSACTIONS.labels("item", "out_of_stock").inc()
             print(f"❌ {item_name}의 재고가 없습니다.")
             return False
         
         # 아이템 존재 확인
         if item_name not in basic_items:
+            SHOP_TRANSACTIONS.labels("item", "not_sold").inc()
             print(f"❌ {item_name}은(는) 판매하지 않는 아이템입니다.")
             return False
         
@@ -123,16 +143,22 @@ class Shop:
         
         # 인벤토리 용량 확인
         if not player.inventory.can_add_item():
+            SHOP_TRANSACTIONS.labels("item", "inventory_full").inc()
             print("❌ 인벤토리가 가득 차서 아이템을 구매할 수 없습니다.")
             return False
         
-        # 구매 처리
+        # 구매 처리 (재고 차감이 성공한 경우에만 지급)
+        if not self.stock_store.take(self.id, item_name):
+            SHOP_TRANSACTIONS.labels("item", "out_of_stock").inc()
+            print(f"❌ {item_name}의 재고가 없습니다.")
+            return False
         player.inventory.add_item(item_name, 1)
-        self.items[item_name] -= 1
         
         # 금액 차감 (향후 구현)
         # player.money -= price
         
+        SHOP_TRANSACTIONS.labels("item", "ok").inc()
+        SHOP_SALES_VALUE.labels("item").inc(price)
         print(f"✅ {item_name}을(를) {price}전에 구매했습니다!")
         return True
     
@@ -140,16 +166,19 @@ class Shop:
         """무기를 구매합니다."""
         # 재고 확인
         if not self.has_weapon_in_stock(weapon_id):
+            SHOP_TRANSACTIONS.labels("weapon", "out_of_stock").inc()
             print(f"❌ 해당 무기의 재고가 없습니다.")
             return False
         
         weapon = self.weapon_system.get_weapon(weapon_id)
         if not weapon:
+            SHOP_TRANSACTIONS.labels("weapon", "not_sold").inc()
             print(f"❌ 무기를 찾을 수 없습니다: {weapon_id}")
             return False
         
         # 직업 제한 확인
-        if not weapon.can_be_used_by(player.job):
+        if weapon.attack_for(player.job) is None:
+            SHOP_TRANSACTIONS.labels("weapon", "job_restricted").inc()
             print(f"❌ {player.job}은(는) {weapon.name}을(를) 사용할 수 없습니다.")
             return False
         
@@ -160,10 +189,13 @@ class Shop:
         
         # 인벤토리 용량 확인
         if not player.inventory.can_add_item():
+            SHOP_TRANSACTIONS.labels("weapon", "inventory_full").inc()
             print("❌ 인벤토리가 가득 차서 무기를 구매할 수 없습니다.")
             return False
         
         # 구매 처리 (향후 인벤토리에 무기 추가 기능 구현)
+        SHOP_TRANSACTIONS.labels("weapon", "ok").inc()
+        SHOP_SALES_VALUE.labels("weapon").inc(weapon.price)
         print(f"✅ {weapon.name}을(를) {weapon.price}전에 구매했습니다!")
         
         # 바로 장착할지 묻기
@@ -177,8 +209,20 @@ class Shop:
 class ShopSystem:
     """상점 관리 시스템"""
     
-    def __init__(self):
+    def __init__(self, stock_db: str = DEFAULT_STOCK_DB):
         self.shops: Dict[str, Shop] = {}
+        self.stock_store = ShopStockStore(stock_db)
+        self.pricing = PricingEngine(self.stock_store)
+        
+        # 로드 시 구축하는 색인
+        self.shops_by_region: Dict[str, List[Shop]] = {}
+        self.shops_by_npc: Dict[str, Shop] = {}
+        
+        # shops.json + npcs.json + 지역을 묶은 시장 색인 (첫 조회 시 구축)
+        self.shops_by_npc_id: Dict[str, Shop] = {}
+        self.market_by_region: Dict[str, List[Tuple["NPC", Shop]]] = {}
+        self._market_linked = False
+        
         self.load_shops()
     
     def load_shops(self):
@@ -196,8 +240,12 @@ class ShopSystem:
             # 상점 객체 생성 및 저장
             for shop_id, shop_data in shop_data_dict.items():
                 shop_data['id'] = shop_id
-                shop = Shop(shop_data)
+                shop = Shop(shop_data, self.stock_store, self.pricing)
                 self.shops[shop_id] = shop
+                
+                # 지역/상인 색인
+                self.shops_by_region.setdefault(shop.region, []).append(shop)
+                self.shops_by_npc.setdefault(shop.npc_name, shop)
             
             print(f"✅ {len(self.shops)}개의 상점을 로드했습니다.")
             
@@ -210,28 +258,66 @@ class ShopSystem:
     
     def get_shop_by_npc(self, npc_name: str) -> Optional[Shop]:
         """NPC 이름으로 상점을 조회합니다."""
-        for shop in self.shops.values():
-            if shop.npc_name == npc_name:
-                return shop
-        return None
+        return self.shops_by_npc.get(npc_name)
     
     def get_shops_by_region(self, region: str) -> List[Shop]:
         """지역별 상점 목록을 반환합니다."""
-        return [shop for shop in self.shops.values() if shop.region == region]
+        return list(self.shops_by_region.get(region, ()))
+    
+    def link_npcs(self, npcs: Iterable["NPC"]):
+        """
+        NPC 목록과 상점을 연결하여 지역별 시장 색인을 구축합니다.
+        
+        shops.json의 npc_name을 기준으로 연결하고, 일치하는 상점이 없을 때만
+        npcs.json의 shop_id를 사용합니다. 두 파일의 shop_id가 서로 어긋나
+        있어도 지역과 상인 이름이 일치하는 상점이 선택됩니다.
+        """
+        self.shops_by_npc_id.clear()
+        self.market_by_region.clear()
+        
+        for npc in npcs:
+            shop = self.shops_by_npc.get(npc.name)
+            if shop is None and npc.shop_id:
+                shop = self.shops.get(npc.shop_id)
+            if shop is None:
+                continue
+            
+            self.shops_by_npc_id[npc.id] = shop
+            self.market_by_region.setdefault(shop.region, []).append((npc, shop))
+        
+        self._market_linked = True
+    
+    def _ensure_market(self):
+        """시장 색인이 없으면 NPC 데이터로 구축합니다."""
+        if not self._market_linked:
+            from systems.npc_system import get_npc_system
+            self.link_npcs(get_npc_system().npcs.values())
+    
+    def get_market(self, region: str) -> List[Tuple["NPC", Shop]]:
+        """지역 시장의 (상인 NPC, 상점) 목록을 반환합니다."""
+        self._ensure_market()
+        return list(self.market_by_region.get(region, ()))
+    
+    def get_current_market(self) -> List[Tuple["NPC", Shop]]:
+        """현재 지역(region_manager.current_region)의 시장을 반환합니다."""
+        from systems.region import region_manager
+        return self.get_market(region_manager.current_region)
+    
+    def get_shop_for_npc(self, npc: "NPC") -> Optional[Shop]:
+        """NPC가 운영하는 상점을 반환합니다."""
+        self._ensure_market()
+        return self.shops_by_npc_id.get(npc.id)
+    
+    def advance_time(self, ticks: int = 1):
+        """게임 시간을 진행하여 주기가 돌아온 상품을 재입고합니다."""
+        self.stock_store.advance_time(ticks)
     
     def show_all_shops(self):
         """모든 상점 목록을 표시합니다."""
         print("\n🏪 **전체 상점 목록**")
         print("=" * 50)
         
-        # 지역별로 그룹화
-        shops_by_region = {}
-        for shop in self.shops.values():
-            if shop.region not in shops_by_region:
-                shops_by_region[shop.region] = []
-            shops_by_region[shop.region].append(shop)
-        
-        for region, shops in shops_by_region.items():
+        for region, shops in self.shops_by_region.items():
             print(f"\n📍 **{region}**")
             print("-" * 20)
             for shop in shops:
@@ -295,6 +381,27 @@ class ShopSystem:
                 print("❌ 잘못된 선택입니다.")
 
 
+# 공유 상점 시스템 (첫 사용 시 한 번만 로드)
+_shop_system: Optional[ShopSystem] = None
+
+
+def get_shop_system() -> ShopSystem:
+    """상점 시스템 인스턴스 반환"""
+    global _shop_system
+    if _shop_system is None:
+        _shop_system = ShopSystem()
+    return _shop_system
+
+
+def advance_shop_time(ticks: int = 1):
+    """
+    게임 시간을 진행합니다. 상점 시스템이 아직 로드되지 않았다면
+    재입고할 재고도 없으므로 아무것도 하지 않습니다.
+    """
+    if _shop_system is not None:
+        _shop_system.advance_time(ticks)
+
+
 def test_shop_system():
     """상점 시스템 테스트 함수"""
     print("🧪 상점 시스템 테스트 시작")
@@ -1,130 +1,154 @@
 """
 전란 그리고 요괴 - 조선시대 RPG
 파일: systems/status_effect.py
-설명: 상태이상 시스템
+설명: 상태이상 시스템 (데이터 테이블 + 공유 효과 처리기)
 """
-from typing import Dict, Optional, Callable
+from typing import Callable, Dict, Optional
 import random
 
-__all__ = ["StatusEffect", "create_status_effect"]
+__all__ = [
+    "StatusEffect",
+    "STATUS_EFFECT_TABLE",
+    "STATUS_EFFECTS",
+    "RANDOM_STATUS",
+    "get_status_effect",
+    "resolve_status_effect",
+]
+
+# 상태이상 정의 테이블
+# tick: 턴 종료 시 효과, can_act: 행동 가능 판정, on_hit: 피격 시 해제 여부 (처리기 이름)
+STATUS_EFFECT_TABLE: Dict[str, Dict] = {
+    "poison": {
+        "name": "중독", "icon": "☠️", "duration": 3,
+        "description": "매 턴 최대 HP의 5%만큼 피해를 입습니다",
+        "tick": "hp_damage", "power": 0.05,
+    },
+    "burn": {
+        "name": "화상", "icon": "🔥", "duration": 3,
+        "description": "매 턴 최대 HP의 8%만큼 피해를 입습니다",
+        "tick": "hp_damage", "power": 0.08,
+    },
+    "paralysis": {
+        "name": "마비", "icon": "⚡", "duration": 2,
+        "description": "50% 확률로 행동이 불가능해집니다",
+        "can_act": "chance", "chance": 0.5,
+    },
+    "sleep": {
+        "name": "수면", "icon": "💤", "duration": 2,
+        "description": "행동이 불가능하며, 공격받으면 즉시 해제됩니다",
+        "tick": "message", "message": "{name}은(는) 깊이 잠들어 있다...",
+        "can_act": "never", "on_hit": "wake",
+    },
+    "freeze": {
+        "name": "빙결", "icon": "🧊", "duration": 2,
+        "description": "몸이 얼어붙어 행동이 불가능합니다",
+        "can_act": "never",
+    },
+    "stun": {
+        "name": "기절", "icon": "💫", "duration": 2,
+        "description": "정신을 잃어 행동이 불가능합니다",
+        "can_act": "never",
+    },
+}
+
+# 적용할 때 위 상태이상 중 하나를 무작위로 고르는 종류
+RANDOM_STATUS = "random"
+
+
+# --- 공유 효과 처리기 (상태 없음: 대상과 정의만 받음) ---
+
+def _tick_hp_damage(effect: "StatusEffect", target) -> str:
+    damage = max(1, int(target.max_hp * effect.power))
+    target.current_hp = max(0, target.current_hp - damage)
+    return f"{target.name}이(가) {effect.name}(으)로 {damage}의 피해를 입었다!"
+
+
+def _tick_message(effect: "StatusEffect", target) -> str:
+    return effect.message.format(name=target.name)
+
+
+def _can_act_never(effect: "StatusEffect") -> bool:
+    return False
+
+
+def _can_act_chance(effect: "StatusEffect") -> bool:
+    return random.random() > effect.chance
+
+
+def _on_hit_wake(effect: "StatusEffect", target) -> bool:
+    return True
+
+
+TICK_HANDLERS: Dict[str, Callable] = {"hp_damage": _tick_hp_damage, "message": _tick_message}
+CAN_ACT_HANDLERS: Dict[str, Callable] = {"never": _can_act_never, "chance": _can_act_chance}
+ON_HIT_HANDLERS: Dict[str, Callable] = {"wake": _on_hit_wake}
+
 
 class StatusEffect:
-    """상태이상 클래스"""
-    
-    def __init__(self, name: str, duration: int, effect_func: Callable, 
-                 description: str, icon: str, can_act_func: Optional[Callable] = None,
-                 on_hit_func: Optional[Callable] = None):
-        self.name = name
-        self.duration = duration
-        self.initial_duration = duration  # 초기 지속시간 저장
-        self.effect_func = effect_func  # 매 턴 적용되는 효과
-        self.description = description
-        self.icon = icon
-        self.can_act_func = can_act_func  # 행동 가능 여부 체크 함수
-        self.on_hit_func = on_hit_func  # 피격 시 효과 함수
-    
+    """
+    상태이상 정의 (종류마다 하나만 만들어 모든 캐릭터가 공유)
+
+    캐릭터는 종류 → 남은 턴만 들고 있으므로 상태이상을 걸 때 새 객체를
+    만들지 않습니다. 남은 턴이 필요한 표시는 인자로 받습니다.
+    """
+
+    __slots__ = ("id", "name", "icon", "duration", "description", "power", "chance", "message",
+                 "_tick", "_can_act", "_on_hit")
+
+    def __init__(self, effect_id: str, data: Dict):
+        self.id = effect_id
+        self.name = data["name"]
+        self.icon = data["icon"]
+        self.duration = data["duration"]  # 기본 지속시간
+        self.description = data["description"]
+        self.power = data.get("power", 0.0)
+        self.chance = data.get("chance", 0.0)
+        self.message = data.get("message", "")
+        self._tick = TICK_HANDLERS[data["tick"]] if "tick" in data else None
+        self._can_act = CAN_ACT_HANDLERS[data["can_act"]] if "can_act" in data else None
+        self._on_hit = ON_HIT_HANDLERS[data["on_hit"]] if "on_hit" in data else None
+
     def apply_effect(self, target) -> str:
-        """상태이상 효과 적용"""
-        if self.effect_func:
-            return self.effect_func(target)
+        """턴 종료 시 효과 적용"""
+        if self._tick:
+            return self._tick(self, target)
         return ""
-    
+
     def can_act(self) -> bool:
         """행동 가능 여부 확인"""
-        if self.can_act_func:
-            return self.can_act_func()
+        if self._can_act:
+            return self._can_act(self)
         return True
-    
+
     def on_hit(self, target) -> bool:
-        """피격 시 처리"""
-        if self.on_hit_func:
-            return self.on_hit_func(target)
+        """피격 시 처리, 해제 여부 반환"""
+        if self._on_hit:
+            return self._on_hit(self, target)
         return False
-    
-    def decrease_duration(self) -> bool:
-        """지속시간 감소, 종료 여부 반환"""
-        self.duration -= 1
-        return self.duration <= 0
-    
-    def extend_duration(self):
-        """지속시간 초기화 (같은 상태이상 중복 적용 시)"""
-        self.duration = self.initial_duration
-    
-    def get_info(self) -> str:
+
+    def get_info(self, remaining: int) -> str:
         """상태이상 정보 반환"""
-        return f"{self.icon} {self.name} ({self.duration}턴)"
-    
-    def get_description(self) -> str:
+        return f"{self.icon} {self.name} ({remaining}턴)"
+
+    def get_description(self, remaining: int) -> str:
         """상태이상 설명 반환"""
-        return f"{self.icon} {self.name}: {self.description} (남은 턴: {self.duration})"
-
-
-def create_poison_effect() -> StatusEffect:
-    """중독 상태이상 생성"""
-    def poison_effect(target) -> str:
-        damage = max(1, int(target.max_hp * 0.05))  # HP 5% 감소
-        target.current_hp = max(0, target.current_hp - damage)
-        return f"{target.name}이(가) 중독으로 {damage}의 피해를 입었다!"
-    
-    return StatusEffect(
-        name="중독",
-        duration=3,
-        effect_func=poison_effect,
-        description="매 턴 최대 HP의 5%만큼 피해를 입습니다",
-        icon="☠️"
-    )
-
-
-def create_paralysis_effect() -> StatusEffect:
-    """마비 상태이상 생성"""
-    def paralysis_can_act() -> bool:
-        return random.random() > 0.5  # 50% 확률로 행동 가능
-    
-    def paralysis_effect(target) -> str:
-        if not paralysis_can_act():
-            return f"{target.name}은(는) 마비로 인해 움직일 수 없다!"
-        return ""
-    
-    return StatusEffect(
-        name="마비",
-        duration=2,
-        effect_func=paralysis_effect,
-        can_act_func=paralysis_can_act,
-        description="50% 확률로 행동이 불가능해집니다",
-        icon="⚡"
-    )
-
-
-def create_sleep_effect() -> StatusEffect:
-    """수면 상태이상 생성"""
-    def sleep_can_act() -> bool:
-        return False  # 수면 중에는 항상 행동 불가
-    
-    def sleep_effect(target) -> str:
-        return f"{target.name}은(는) 깊이 잠들어 있다..."
-    
-    def sleep_on_hit(target) -> bool:
-        return True  # 공격 받으면 즉시 해제
-    
-    return StatusEffect(
-        name="수면",
-        duration=2,
-        effect_func=sleep_effect,
-        can_act_func=sleep_can_act,
-        on_hit_func=sleep_on_hit,
-        description="행동이 불가능하며, 공격받으면 즉시 해제됩니다",
-        icon="💤"
-    )
-
-
-def create_status_effect(effect_type: str) -> Optional[StatusEffect]:
-    """상태이상 생성 헬퍼 함수"""
-    creators = {
-        "poison": create_poison_effect,
-        "paralysis": create_paralysis_effect,
-        "sleep": create_sleep_effect
-    }
-    creator = creators.get(effect_type.lower())
-    if creator:
-        return creator()
-    return None
+        return f"{self.icon} {self.name}: {self.description} (남은 턴: {remaining})"
+
+
+# 종류 → 공유 정의
+STATUS_EFFECTS: Dict[str, StatusEffect] = {
+    effect_id: StatusEffect(effect_id, data) for effect_id, data in STATUS_EFFECT_TABLE.items()
+}
+_RANDOM_POOL = tuple(STATUS_EFFECTS.values())
+
+
+def get_status_effect(effect_id: str) -> Optional[StatusEffect]:
+    """종류에 해당하는 공유 상태이상 정의를 반환합니다."""
+    return STATUS_EFFECTS.get(effect_id.lower())
+
+
+def resolve_status_effect(effect_type: str) -> Optional[StatusEffect]:
+    """적용할 상태이상 정의를 고릅니다. ("random"이면 무작위로 하나)"""
+    if effect_type.lower() == RANDOM_STATUS:
+        return random.choice(_RANDOM_POOL)
+    return get_status_effect(effect_type)
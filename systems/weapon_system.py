@@ -6,17 +6,36 @@
 
 __all__ = [
     "Weapon",
+    "WeaponInstance",
     "WeaponSystem",
+    "get_weapon_system",
     "equipment_management_menu",
 ]
 
 import json
 import os
-from typing import List, Dict, Optional
+from bisect import bisect_left, bisect_right
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Tuple
+
+from utility.text_index import NgramIndex
+
+# 효과적 공격력 표를 미리 계산할 플레이어 직업 목록
+PLAYER_CLASSES = ("무사", "도사", "유랑객")
 
 
 class Weapon:
-    """무기 클래스"""
+    """
+    무기 클래스
+
+    모든 플레이어와 상점이 공유하는 불변(flyweight) 객체입니다.
+    내구도, 강화 수치 같은 소유자별 상태는 WeaponInstance에 따로 보관합니다.
+    """
+    
+    __slots__ = (
+        "id", "name", "type", "attack", "rarity", "description", "price",
+        "usable_classes", "special_effect", "effective_attacks", "_frozen",
+    )
     
     def __init__(self, weapon_data: Dict):
         self.id: str = weapon_data.get("id", "")
@@ -26,8 +45,25 @@ class Weapon:
         self.rarity: str = weapon_data.get("rarity", "일반")
         self.description: str = weapon_data.get("description", "")
         self.price: int = weapon_data.get("price", 0)
-        self.usable_classes: List[str] = weapon_data.get("usable_classes", [])
+        self.usable_classes: Tuple[str, ...] = tuple(weapon_data.get("usable_classes", []))
         self.special_effect: str = weapon_data.get("special_effect", "")
+        
+        # 직업별 효과적 공격력 표 (사용 불가 직업은 None, 생성 후 변경 불가)
+        classes = dict.fromkeys(PLAYER_CLASSES + self.usable_classes)
+        self.effective_attacks: Mapping[str, Optional[int]] = MappingProxyType({
+            player_class: self.get_effective_attack(player_class) if self.can_be_used_by(player_class) else None
+            for player_class in classes
+        })
+        self._frozen = True
+    
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"공유 무기 객체는 변경할 수 없습니다: {name}")
+        super().__setattr__(name, value)
+    
+    def attack_for(self, player_class: str) -> Optional[int]:
+        """직업별 효과적 공격력을 반환합니다. 사용할 수 없으면 None (예외 없음)."""
+        return self.effective_attacks.get(player_class)
     
     def get_effective_attack(self, player_class: str) -> int:
         """플레이어 직업에 따른 효과적인 공격력을 계산합니다."""
@@ -62,14 +98,13 @@ class Weapon:
         
         # 공격력 표시 (직업별 보정 적용)
         if player_class is not None:
-            try:
-                effective_attack = self.get_effective_attack(player_class)
-                if effective_attack != self.attack:
-                    info += f"   ⚔️ 공격력: {self.attack} → {effective_attack} ({player_class} 보정)\n"
-                else:
-                    info += f"   ⚔️ 공격력: {self.attack}\n"
-            except ValueError as e:
-                info += f"   ❌ {str(e)}\n"
+            effective_attack = self.attack_for(player_class)
+            if effective_attack is None:
+                info += f"   ❌ {player_class}은(는) {self.name}을(를) 사용할 수 없습니다.\n"
+            elif effective_attack != self.attack:
+                info += f"   ⚔️ 공격력: {self.attack} → {effective_attack} ({player_class} 보정)\n"
+            else:
+                info += f"   ⚔️ 공격력: {self.attack}\n"
         else:
             info += f"   ⚔️ 공격력: {self.attack}\n"
         
@@ -85,12 +120,59 @@ class Weapon:
         return info
 
 
+class WeaponInstance:
+    """소유자별 무기 상태 (내구도, 강화 수치). 무기 데이터는 공유 Weapon을 참조합니다."""
+    
+    __slots__ = ("weapon_id", "durability", "enhancement")
+    
+    MAX_DURABILITY = 100
+    
+    def __init__(self, weapon_id: str, durability: int = MAX_DURABILITY, enhancement: int = 0):
+        self.weapon_id = weapon_id
+        self.durability = durability
+        self.enhancement = enhancement
+    
+    @property
+    def weapon(self) -> Optional[Weapon]:
+        """공유 레지스트리에서 무기 데이터를 조회합니다."""
+        return get_weapon_system().get_weapon(self.weapon_id)
+    
+    def attack_for(self, player_class: str) -> Optional[int]:
+        """강화 수치를 반영한 직업별 공격력을 반환합니다. 사용할 수 없으면 None."""
+        weapon = self.weapon
+        base_attack = weapon.attack_for(player_class) if weapon else None
+        if base_attack is None:
+            return None
+        return base_attack + self.enhancement
+    
+    def to_state(self) -> Dict:
+        """저장용 상태 딕셔너리 반환"""
+        return {"weapon_id": self.weapon_id, "durability": self.durability, "enhancement": self.enhancement}
+    
+    @classmethod
+    def from_state(cls, state: Dict) -> "WeaponInstance":
+        """to_state()로 만든 상태에서 복원"""
+        return cls(state["weapon_id"], state.get("durability", cls.MAX_DURABILITY), state.get("enhancement", 0))
+
+
 class WeaponSystem:
     """무기 관리 시스템"""
     
     def __init__(self):
         self.weapons: Dict[str, Weapon] = {}
         self.weapons_by_type: Dict[str, List[Weapon]] = {}
+        
+        # 조회용 색인 (로드 시 한 번만 구축)
+        self.weapons_by_name: Dict[str, Weapon] = {}
+        self.weapons_by_class: Dict[str, List[Weapon]] = {}
+        self.weapons_by_rarity: Dict[str, List[Weapon]] = {}
+        self._weapons_by_price: List[Weapon] = []  # 가격 오름차순
+        self._prices: List[int] = []               # bisect용 가격 배열
+        self._search_index = NgramIndex()
+        
+        # (무기 ID, 직업) → 효과적 공격력 표 (사용 불가 시 None)
+        self.attack_table: Mapping[str, Mapping[str, Optional[int]]] = MappingProxyType({})
+        
         self.load_weapons()
     
     def load_weapons(self):
@@ -115,55 +197,59 @@ class WeaponSystem:
                     self.weapons_by_type[weapon.type] = []
                 self.weapons_by_type[weapon.type].append(weapon)
             
+            self._build_indexes()
             print(f"✅ {len(self.weapons)}개의 무기를 로드했습니다.")
             
         except Exception as e:
             print(f"❌ 무기 데이터 로드 실패: {e}")
     
+    def _build_indexes(self):
+        """이름, 직업, 희귀도, 가격, 검색어 색인을 구축합니다."""
+        for weapon in self.weapons.values():
+            self.weapons_by_name.setdefault(weapon.name, weapon)
+            self.weapons_by_rarity.setdefault(weapon.rarity, []).append(weapon)
+            
+            for player_class, effective_attack in weapon.effective_attacks.items():
+                if effective_attack is not None:
+                    self.weapons_by_class.setdefault(player_class, []).append(weapon)
+            
+            self._search_index.add(weapon.id, weapon.name, weapon.description, weapon.type)
+        
+        self._weapons_by_price = sorted(self.weapons.values(), key=lambda w: w.price)
+        self._prices = [weapon.price for weapon in self._weapons_by_price]
+        self.attack_table = MappingProxyType({
+            weapon_id: weapon.effective_attacks for weapon_id, weapon in self.weapons.items()
+        })
+    
     def get_weapon(self, weapon_id: str) -> Optional[Weapon]:
         """무기 ID로 무기를 조회합니다."""
         return self.weapons.get(weapon_id)
     
     def get_weapon_by_name(self, name: str) -> Optional[Weapon]:
         """무기 이름으로 무기를 조회합니다."""
-        for weapon in self.weapons.values():
-            if weapon.name == name:
-                return weapon
-        return None
+        return self.weapons_by_name.get(name)
     
     def get_weapons_by_type(self, weapon_type: str) -> List[Weapon]:
-        """특정 타입의 무기 목록을 반환합니다."""
-        return self.weapons_by_type.get(weapon_type, [])
+        """특정 타입의 무기 목록을 반환합니다. (색인의 복사본)"""
+        return list(self.weapons_by_type.get(weapon_type, ()))
     
     def get_usable_weapons(self, player_class: str) -> List[Weapon]:
-        """특정 직업이 사용할 수 있는 무기 목록을 반환합니다."""
-        usable_weapons = []
-        for weapon in self.weapons.values():
-            if weapon.can_be_used_by(player_class):
-                usable_weapons.append(weapon)
-        return usable_weapons
+        """특정 직업이 사용할 수 있는 무기 목록을 반환합니다. (색인의 복사본)"""
+        return list(self.weapons_by_class.get(player_class, ()))
     
     def get_weapons_by_rarity(self, rarity: str) -> List[Weapon]:
-        """특정 희귀도의 무기 목록을 반환합니다."""
-        return [weapon for weapon in self.weapons.values() if weapon.rarity == rarity]
+        """특정 희귀도의 무기 목록을 반환합니다. (색인의 복사본)"""
+        return list(self.weapons_by_rarity.get(rarity, ()))
     
     def get_weapons_in_price_range(self, min_price: int, max_price: int) -> List[Weapon]:
-        """가격 범위 내의 무기 목록을 반환합니다."""
-        return [weapon for weapon in self.weapons.values() 
-                if min_price <= weapon.price <= max_price]
+        """가격 범위 내의 무기 목록을 가격 오름차순으로 반환합니다."""
+        start = bisect_left(self._prices, min_price)
+        end = bisect_right(self._prices, max_price)
+        return self._weapons_by_price[start:end]
     
     def search_weapons(self, keyword: str) -> List[Weapon]:
-        """키워드로 무기를 검색합니다."""
-        results = []
-        keyword_lower = keyword.lower()
-        
-        for weapon in self.weapons.values():
-            if (keyword_lower in weapon.name.lower() or 
-                keyword_lower in weapon.description.lower() or
-                keyword_lower in weapon.type.lower()):
-                results.append(weapon)
-        
-        return results
+        """키워드로 무기를 검색합니다 (이름, 설명, 타입)."""
+        return [self.weapons[weapon_id] for weapon_id in self._search_index.search(keyword)]
     
     def show_weapon_catalog(self, player_class: Optional[str] = None):
         """무기 도감을 표시합니다."""
@@ -177,19 +263,15 @@ class WeaponSystem:
             
             for weapon in sorted(weapons, key=lambda w: w.price):
                 # 직업 제한 확인
-                if player_class is not None and not weapon.can_be_used_by(player_class):
+                effective_attack = weapon.attack_for(player_class) if player_class is not None else None
+                if player_class is not None and effective_attack is None:
                     continue
                 
                 print(f"  {weapon.get_rarity_color()} {weapon.name}")
                 print(f"    공격력: {weapon.attack} | 가격: {weapon.price}전")
                 
-                if player_class is not None:
-                    try:
-                        effective_attack = weapon.get_effective_attack(player_class)
-                        if effective_attack != weapon.attack:
-                            print(f"    → {player_class} 효과적 공격력: {effective_attack}")
-                    except ValueError:
-                        print(f"    ❌ {player_class}은(는) 사용 불가")
+                if effective_attack is not None and effective_attack != weapon.attack:
+                    print(f"    → {player_class} 효과적 공격력: {effective_attack}")
                 
                 print()
     
@@ -216,7 +298,7 @@ class WeaponSystem:
             print("-" * 20)
             
             for weapon in sorted(weapons, key=lambda w: w.price):
-                effective_attack = weapon.get_effective_attack(player_class)
+                effective_attack = weapon.attack_for(player_class)
                 penalty_info = ""
                 if effective_attack != weapon.attack:
                     penalty_info = f" → {effective_attack}"
@@ -228,6 +310,18 @@ class WeaponSystem:
                 print()
 
 
+# 공유 무기 레지스트리 (첫 사용 시 한 번만 로드)
+_weapon_system: Optional[WeaponSystem] = None
+
+
+def get_weapon_system() -> WeaponSystem:
+    """모든 플레이어와 상점이 공유하는 무기 시스템 인스턴스 반환"""
+    global _weapon_system
+    if _weapon_system is None:
+        _weapon_system = WeaponSystem()
+    return _weapon_system
+
+
 def test_weapon_system():
     """무기 시스템 테스트 함수"""
     print("🧪 무기 시스템 테스트 시작")
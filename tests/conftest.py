@@ -0,0 +1,16 @@
+"""
+전란 그리고 요괴 - 조선시대 RPG
+파일: tests/conftest.py
+설명: pytest 공통 설정 (프로젝트 루트 임포트 경로, 임시 세이브 디렉터리)
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# config.SAVE_DIR은 임포트 시점에 정해지므로 게임 모듈을 임포트하기 전에 지정
+os.environ.setdefault("JEONRAN_SAVE_DIR", tempfile.mkdtemp(prefix="jeonran-tests-"))
@@ -0,0 +1,86 @@
+"""
+전란 그리고 요괴 - 조선시대 RPG
+파일: tests/test_quest_events.py
+설명: 퀘스트 이벤트 라우팅 (색인된 퀘스트만 갱신, 수집 경로 구분, 완료 후 색인 해제)
+"""
+import pytest
+
+from characters.player import Player
+from systems.quest_system import accept_quest, update_kill_quest, update_travel_quest
+
+
+@pytest.fixture
+def player():
+    return Player("테스트", "무사")
+
+
+def progress(player, quest_id):
+    return player.active_quests[quest_id]["progress"]
+
+
+def test_kill_event_updates_only_matching_quest(player):
+    accept_quest(player, "quest_001")  # 도깨비불 3마리
+    accept_quest(player, "quest_002")  # 소형 약초 5개
+
+    assert update_kill_quest(player, "도깨비불") == []
+    assert progress(player, "quest_001") == {"kill:도깨비불": 1}
+    assert progress(player, "quest_002") == {"collect:소형 약초": 0}
+
+    update_kill_quest(player, "검은물귀")  # 진행 중인 퀘스트의 목표가 아님
+    assert progress(player, "quest_001") == {"kill:도깨비불": 1}
+
+
+def test_completion_rewards_and_untracks(player):
+    accept_quest(player, "quest_001")
+    exp_before = player.exp
+
+    update_kill_quest(player, "도깨비불")
+    update_kill_quest(player, "도깨비불")
+    assert update_kill_quest(player, "도깨비불") == ["quest_001"]
+
+    assert "quest_001" not in player.active_quests
+    assert "quest_001" in player.completed_quests
+    assert player.inventory.items.get("대형 약초") == 1
+    assert player.exp > exp_before or player.level > 1
+    assert ("kill", "도깨비불") not in player.quest_tracker._index
+
+    # 완료 후 같은 이벤트는 아무것도 갱신하지 않음
+    assert update_kill_quest(player, "도깨비불") == []
+
+
+def test_shop_purchase_does_not_count_toward_collect(player):
+    accept_quest(player, "quest_002")
+
+    player.inventory.add_item("소형 약초", 3)  # 상점 구매, 보상, 시작 아이템
+    assert progress(player, "quest_002") == {"collect:소형 약초": 0}
+
+    player.inventory.add_item("소형 약초", 3, source="loot")
+    player.inventory.add_item("소형 약초", 2, source="pickup")
+    assert "quest_002" in player.completed_quests
+
+
+def test_progress_is_capped_at_objective_count(player):
+    accept_quest(player, "quest_002")
+
+    player.inventory.add_item("소형 약초", 3, source="loot")
+    assert progress(player, "quest_002") == {"collect:소형 약초": 3}
+    player.inventory.add_item("소형 약초", 10, source="loot")
+    assert "quest_002" in player.completed_quests
+
+
+def test_kill_status_routes_by_status_name(player):
+    accept_quest(player, "paralyzed_sword")  # 마비 상태의 적 3마리
+
+    update_kill_quest(player, "도깨비불")
+    update_kill_quest(player, "도깨비불", statuses=["중독"])
+    assert progress(player, "paralyzed_sword") == {"kill_status:마비": 0}
+
+    update_kill_quest(player, "도깨비불", statuses=["마비", "중독"])
+    assert progress(player, "paralyzed_sword") == {"kill_status:마비": 1}
+
+
+def test_travel_event_completes_travel_quest(player):
+    accept_quest(player, "quest_005")  # 소머리골 도달
+
+    assert update_travel_quest(player, "한양") == []
+    assert update_travel_quest(player, "소머리골") == ["quest_005"]
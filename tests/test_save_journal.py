@@ -0,0 +1,110 @@
+"""
+전란 그리고 요괴 - 조선시대 RPG
+파일: tests/test_save_journal.py
+설명: 세이브 저널 재적용, 이전 세대 저널 무시, 스냅샷 합치기
+"""
+import json
+import os
+
+import pytest
+
+from systems.save_system.constants import JOURNAL_COMPACT_ENTRIES
+from systems.save_system.core import SaveSystem
+from systems.save_system.exceptions import SaveFileError
+
+SNAPSHOT = {"name": "홍길동", "job": "무사", "stats": {"level": 1, "gold": 0}, "location": {"current": "한양"}}
+
+
+@pytest.fixture(params=[False, True], ids=["sync", "background"])
+def save_system(request, tmp_path):
+    system = SaveSystem(tmp_path, background=request.param)
+    yield system
+    system.close()
+
+
+def journal_path(save_system, slot=1):
+    return save_system.save_dir / f"save_data_{slot}.journal"
+
+
+def test_deltas_replay_in_order(save_system, tmp_path):
+    save_system.save_game(1, SNAPSHOT)
+    save_system.save_delta(1, {"stats": {"level": 2, "gold": 10}})
+    save_system.save_delta(1, {"location": {"current": "한밭"}})
+    save_system.save_delta(1, {"stats": {"level": 3, "gold": 5}})
+
+    data = SaveSystem(tmp_path).load_game(1)
+
+    assert data["stats"] == {"level": 3, "gold": 5}
+    assert data["location"] == {"current": "한밭"}
+    assert "journal_generation" not in data
+
+
+def test_full_save_replaces_journal(save_system, tmp_path):
+    save_system.save_game(1, SNAPSHOT)
+    save_system.save_delta(1, {"stats": {"level": 2, "gold": 10}})
+    save_system.save_game(1, {**SNAPSHOT, "location": {"current": "한밭"}})
+    save_system.flush()
+
+    assert not journal_path(save_system).exists()
+    assert SaveSystem(tmp_path).load_game(1)["stats"] == {"level": 1, "gold": 0}
+
+
+def test_journal_left_by_crash_is_ignored_even_if_newer(save_system, tmp_path):
+    save_system.save_game(1, SNAPSHOT)
+    save_system.save_delta(1, {"stats": {"level": 9, "gold": 999}})
+    leftover = journal_path(save_system).read_text(encoding="utf-8")
+
+    # 새 스냅샷을 쓴 뒤 저널을 지우기 전에 종료된 상황 (저널이 더 최근 시각)
+    save_system.save_game(1, {**SNAPSHOT, "stats": {"level": 2, "gold": 20}})
+    save_system.flush()
+    journal_path(save_system).write_text(leftover, encoding="utf-8")
+    snapshot_mtime = (tmp_path / "save_data_1.json").stat().st_mtime_ns
+    os.utime(journal_path(save_system), ns=(snapshot_mtime, snapshot_mtime))
+
+    reloaded = SaveSystem(tmp_path)
+    assert reloaded.load_game(1)["stats"] == {"level": 2, "gold": 20}
+
+    # 다음 변경분은 남은 저널을 버리고 새로 시작
+    reloaded.save_delta(1, {"location": {"current": "한밭"}})
+    data = SaveSystem(tmp_path).load_game(1)
+    assert data["stats"] == {"level": 2, "gold": 20}
+    assert data["location"] == {"current": "한밭"}
+
+
+def test_truncated_last_line_is_skipped(save_system, tmp_path):
+    save_system.save_game(1, SNAPSHOT)
+    save_system.save_delta(1, {"stats": {"level": 2, "gold": 10}})
+    with journal_path(save_system).open("a", encoding="utf-8") as f:
+        f.write('{"stats": {"lev')  # 추가 쓰기 도중 종료
+
+    assert SaveSystem(tmp_path).load_game(1)["stats"] == {"level": 2, "gold": 10}
+
+
+def test_journal_without_generation_still_applies(tmp_path):
+    # 세대 기록 이전 형식: 스냅샷에 세대가 없고 저널 첫 줄부터 변경분
+    (tmp_path / "save_data_1.json").write_text(json.dumps({"version": 2, **SNAPSHOT}), encoding="utf-8")
+    journal_path(SaveSystem(tmp_path)).write_text(json.dumps({"stats": {"level": 4, "gold": 1}}) + "\n",
+                                                  encoding="utf-8")
+
+    assert SaveSystem(tmp_path).load_game(1)["stats"] == {"level": 4, "gold": 1}
+
+
+def test_journal_compacts_into_snapshot(save_system, tmp_path):
+    save_system.save_game(1, SNAPSHOT)
+    for gold in range(1, JOURNAL_COMPACT_ENTRIES + 1):
+        save_system.save_delta(1, {"stats": {"level": 1, "gold": gold}})
+    save_system.flush()
+
+    assert not journal_path(save_system).exists()
+    snapshot = json.loads((tmp_path / "save_data_1.json").read_text(encoding="utf-8"))
+    assert snapshot["stats"]["gold"] == JOURNAL_COMPACT_ENTRIES
+
+    save_system.save_delta(1, {"location": {"current": "한밭"}})
+    data = SaveSystem(tmp_path).load_game(1)
+    assert data["stats"]["gold"] == JOURNAL_COMPACT_ENTRIES
+    assert data["location"] == {"current": "한밭"}
+
+
+def test_delta_without_snapshot_is_rejected(save_system):
+    with pytest.raises(SaveFileError):
+        save_system.save_delta(1, {"stats": {"level": 2}})
@@ -0,0 +1,91 @@
+"""
+전란 그리고 요괴 - 조선시대 RPG
+파일: tests/test_save_migration.py
+설명: 세이브 스키마 v1 → v2 마이그레이션과 코덱 왕복
+"""
+import json
+
+import pytest
+
+from characters.player import Player
+from systems.experience import exp_system
+from systems.save_system.core import SaveSystem
+from systems.save_system.exceptions import SaveFileError
+from systems.save_system.schema import (
+    SAVE_CODECS, SAVE_FORMAT_VERSION, decode_save, encode_save, migrate, msgpack, slot_metadata,
+)
+
+V1_SAVE = {
+    "name": "홍길동",
+    "job": "무사",
+    "level": 5,
+    "exp": 40,  # v1: 현재 레벨 안에서의 경험치
+    "hp": 80,
+    "mp": 20,
+    "inventory": {"소형 약초": 3},  # v1: 아이템 딕셔너리만 저장
+    "location": "한밭",
+}
+
+
+def test_v1_is_upgraded_to_sections():
+    data = migrate(dict(V1_SAVE))
+
+    assert data["version"] == SAVE_FORMAT_VERSION
+    assert data["stats"] == {
+        "level": 5,
+        "exp": exp_system.total_exp_for_level(5) + 40,
+        "hp": 80,
+        "mp": 20,
+    }
+    assert data["inventory"] == {"items": {"소형 약초": 3}}
+    assert data["location"] == {"current": "한밭"}
+    assert data["quests"] == {"active": {}, "completed": []}
+    assert data["equipped_weapon"] is None
+    assert data["status_effects"] == {}
+
+
+def test_v1_missing_stats_are_left_to_defaults():
+    data = migrate({"name": "홍길동", "job": "무사", "level": 1})
+
+    assert data["stats"] == {"level": 1, "exp": exp_system.total_exp_for_level(1)}
+    assert data["inventory"] == {}
+
+
+def test_current_version_passes_through_unchanged():
+    data = Player("홍길동", "무사").to_state()
+    data["version"] = SAVE_FORMAT_VERSION
+
+    assert migrate(dict(data)) == data
+
+
+@pytest.mark.parametrize("version", [0, SAVE_FORMAT_VERSION + 1])
+def test_unsupported_versions_are_rejected(version):
+    with pytest.raises(SaveFileError):
+        migrate({"version": version})
+
+
+def test_slot_metadata_reads_both_layouts():
+    expected = {"name": "홍길동", "level": 5, "location": "한밭"}
+
+    assert slot_metadata(V1_SAVE) == expected
+    assert slot_metadata(migrate(dict(V1_SAVE))) == expected
+
+
+def test_v1_file_loads_into_player(tmp_path):
+    (tmp_path / "save_data_1.json").write_text(json.dumps(V1_SAVE, ensure_ascii=False), encoding="utf-8")
+
+    player = Player.from_state(SaveSystem(tmp_path).load_game(1))
+
+    assert (player.name, player.job, player.level) == ("홍길동", "무사", 5)
+    assert player.current_hp == 80
+    assert player.current_location == "한밭"
+    assert player.inventory.items == {"소형 약초": 3}
+
+
+@pytest.mark.parametrize("codec", SAVE_CODECS)
+def test_codecs_round_trip(codec):
+    if codec == "msgpack" and msgpack is None:
+        pytest.skip("msgpack이 설치되어 있지 않음")
+    data = {"version": SAVE_FORMAT_VERSION, **Player("홍길동", "무사").to_state()}
+
+    assert decode_save(encode_save(data, codec)) == data
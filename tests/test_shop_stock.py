@@ -0,0 +1,81 @@
+"""
+전란 그리고 요괴 - 조선시대 RPG
+파일: tests/test_shop_stock.py
+설명: 상점 재고 차감의 원자성 (동시 구매, 세션 간 공유, 재입고)
+"""
+import threading
+
+import pytest
+
+from systems.shop_stock import ShopStockStore
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "shop_stock.db")
+
+
+@pytest.fixture
+def store(db_path):
+    store = ShopStockStore(db_path)
+    store.register_shop("약방", {"소형 약초": 5}, restock_interval=3)
+    yield store
+    store.close()
+
+
+def test_take_fails_without_changing_stock_when_short(store):
+    notified = []
+    store.add_listener(lambda shop_id, item_name: notified.append(item_name))
+
+    assert store.take("약방", "소형 약초", 3)
+    assert not store.take("약방", "소형 약초", 3)
+    assert store.get_stock("약방", "소형 약초") == 2
+    assert notified == ["소형 약초"]  # 실패한 차감은 알리지 않음
+    assert not store.take("약방", "없는 아이템")
+
+
+def test_concurrent_takes_never_oversell(store):
+    results = []
+    barrier = threading.Barrier(8)
+
+    def buyer():
+        barrier.wait()
+        for _ in range(5):
+            results.append(store.take("약방", "소형 약초"))
+
+    threads = [threading.Thread(target=buyer) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count(True) == 5
+    assert store.get_stock("약방", "소형 약초") == 0
+
+
+def test_sessions_sharing_a_database_never_go_negative(store, db_path):
+    other = ShopStockStore(db_path)
+    try:
+        assert other.take("약방", "소형 약초", 4)
+        assert not store.take("약방", "소형 약초", 2)
+        assert store.take("약방", "소형 약초", 1)
+        assert not other.take("약방", "소형 약초", 1)
+        assert store.get_stock("약방", "소형 약초") == 0
+    finally:
+        other.close()
+
+
+def test_stock_survives_reopen_and_restocks_on_schedule(store, db_path):
+    store.take("약방", "소형 약초", 5)
+    store.close()
+
+    reopened = ShopStockStore(db_path)
+    try:
+        reopened.register_shop("약방", {"소형 약초": 5}, restock_interval=3)
+        assert reopened.get_stock("약방", "소형 약초") == 0  # 저장된 재고 유지
+
+        assert reopened.advance_time(2) == []
+        assert reopened.advance_time(1) == [("약방", "소형 약초")]
+        assert reopened.get_stock("약방", "소형 약초") == 5
+    finally:
+        reopened.close()
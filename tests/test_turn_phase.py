@@ -0,0 +1,93 @@
+"""
+전란 그리고 요괴 - 조선시대 RPG
+파일: tests/test_turn_phase.py
+설명: end_turn_phase 처리 순서 (효과 적용 → 쓰러짐 알림 → 남은 턴 감소 → 턴 종료 훅)
+"""
+from characters.base_character import BaseCharacter, begin_turn_phase, end_turn_phase
+
+
+class RecordingCharacter(BaseCharacter):
+    """턴 종료 훅이 불릴 때 전투원들의 상태를 기록하는 캐릭터"""
+
+    def __init__(self, name, log, max_hp=100):
+        super().__init__(name, max_hp, attack=10, defence=0, speed=10)
+        self.log = log
+        self.others = []
+
+    def on_turn_end(self):
+        self.log.append(("turn_end", self.name, [dict(other.status_effects) for other in self.others]))
+
+
+def make_pair(log):
+    first, second = RecordingCharacter("갑", log), RecordingCharacter("을", log)
+    first.others = second.others = [first, second]
+    return first, second
+
+
+def test_last_turn_of_effect_still_ticks_before_removal():
+    first, second = make_pair([])
+    first.apply_status("poison", duration=1)
+
+    end_turn_phase((first, second))
+
+    assert first.current_hp == 95  # 최대 HP의 5%
+    assert first.status_effects == {}
+
+
+def test_defeat_is_reported_before_any_effect_expires():
+    log = []
+    first, second = make_pair(log)
+    first.current_hp = 3
+    first.apply_status("burn", duration=1)
+    second.apply_status("poison", duration=2)
+
+    def on_defeat(combatant):
+        log.append(("defeat", combatant.name, dict(first.status_effects), dict(second.status_effects)))
+
+    end_turn_phase((first, second), on_defeat=on_defeat)
+
+    # 쓰러짐 알림 시점에는 모든 전투원의 상태이상과 남은 턴이 그대로
+    assert log[0] == ("defeat", "갑", {"burn": 1}, {"poison": 2})
+    assert second.current_hp == 95  # 두 번째 전투원도 효과는 적용됨
+    assert first.status_effects == {}
+    assert second.status_effects == {"poison": 1}
+
+
+def test_already_defeated_combatants_are_not_reported_again():
+    defeated = []
+    first, second = make_pair([])
+    first.current_hp = 0
+    first.apply_status("poison")
+
+    end_turn_phase((first, second), on_defeat=defeated.append)
+
+    assert defeated == []
+
+
+def test_turn_end_hooks_run_after_every_combatant_is_updated():
+    log = []
+    first, second = make_pair(log)
+    first.apply_status("poison", duration=2)
+    second.apply_status("stun", duration=1)
+
+    end_turn_phase((first, second))
+
+    # 첫 전투원의 훅에서도 두 번째 전투원의 남은 턴 감소와 해제가 이미 반영됨
+    assert log == [
+        ("turn_end", "갑", [{"poison": 1}, {}]),
+        ("turn_end", "을", [{"poison": 1}, {}]),
+    ]
+
+
+def test_turn_decision_is_kept_until_end_of_phase():
+    first, second = make_pair([])
+    second.apply_status("stun", duration=2)
+
+    begin_turn_phase((first, second))
+    assert first.can_act() and not second.can_act()
+    second.status_effects.clear()
+    assert not second.can_act()  # 턴 중에는 정해 둔 판정 유지
+
+    end_turn_phase((first, second))
+    assert first._turn_can_act is None and second._turn_can_act is None
+    assert second.can_act()
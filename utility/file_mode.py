@@ -0,0 +1,51 @@
+"""
+전란 그리고 요괴 - 조선시대 RPG
+파일: utility/file_mode.py
+설명: 임시 파일을 바꿔치기해 만드는 파일에 줄 권한 (프로세스 umask 적용)
+"""
+
+__all__ = [
+    "process_umask",
+    "new_file_mode",
+]
+
+import os
+import threading
+from typing import Optional
+
+_umask: Optional[int] = None
+_lock = threading.Lock()
+
+
+def process_umask(directory: str) -> int:
+    """
+    프로세스 umask를 읽습니다. (처음 한 번만 읽고 캐시)
+
+    os.umask()는 값을 읽으려면 잠시 바꿔야 해서, 그 사이 다른 스레드가 만든
+    파일이 umask 0으로 생길 수 있습니다. 대신 directory에 0666으로 빈 파일을
+    만들어 커널이 umask를 적용한 권한을 읽고 바로 지웁니다.
+    """
+    global _umask
+    if _umask is not None:
+        return _umask
+
+    with _lock:
+        if _umask is None:
+            scratch = os.path.join(directory, f".umask.{os.getpid()}.{threading.get_ident()}.tmp")
+            fd = os.open(scratch, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            try:
+                _umask = 0o666 & ~os.fstat(fd).st_mode & 0o777
+            finally:
+                os.close(fd)
+                os.unlink(scratch)
+    return _umask
+
+
+def new_file_mode(directory: str, mode: int = 0o666) -> int:
+    """
+    directory에 새로 만드는 파일의 권한 (mode에서 umask를 뺀 값)
+
+    mkstemp의 임시 파일은 소유자 전용(0600)이므로, 임시 파일을 os.replace로
+    바꿔치기하는 쪽에서 교체 전에 이 권한으로 맞춥니다.
+    """
+    return mode & ~process_umask(directory)
@@ -0,0 +1,407 @@
+"""
+전란 그리고 요괴 - 조선시대 RPG
+파일: utility/metrics.py
+설명: 핫 패스 계측 (카운터, 히스토그램, 시간 구간) 및 텍스트/Prometheus 내보내기
+"""
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "SECONDS_BUCKETS",
+    "Counter",
+    "Histogram",
+    "MetricsRegistry",
+    "registry",
+    "counter",
+    "histogram",
+    "span",
+    "enable_metrics",
+    "disable_metrics",
+    "metrics_enabled",
+    "render_text",
+    "render_prometheus",
+    "write_prometheus",
+    "start_prometheus_writer",
+]
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# 값 히스토그램 기본 구간 (피해량, 바이트 수 등)
+DEFAULT_BUCKETS: Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, 10000)
+
+# 시간 구간(span) 히스토그램 구간 (초)
+SECONDS_BUCKETS: Tuple[float, ...] = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Prometheus 지표 이름 접두사
+METRIC_PREFIX = "jeonran_"
+
+# 환경 변수로 켜기 / 주기적으로 쓸 Prometheus 텍스트 파일 경로
+METRICS_ENV = "JEONRAN_METRICS"
+METRICS_FILE_ENV = "JEONRAN_METRICS_FILE"
+
+# Prometheus 파일 권한 (umask 적용 전, 수집기가 다른 사용자로 읽을 수 있도록)
+PROMETHEUS_FILE_MODE = 0o644
+
+
+class _State:
+    """계측 켜짐 여부 (모든 지표가 공유하는 단일 플래그)"""
+    __slots__ = ("enabled",)
+
+    def __init__(self):
+        self.enabled = os.environ.get(METRICS_ENV, "") not in ("", "0")
+
+
+_state = _State()
+
+
+class Counter:
+    """
+    단조 증가 카운터
+
+    꺼져 있으면 inc()는 플래그 하나만 확인하고 반환하며, labels()는 자식을
+    만들지 않고 공유 null 자식을 돌려줍니다. 자주 쓰는 레이블 조합은 모듈
+    수준에서 child()로 한 번 묶어 두고 재사용합니다.
+    """
+
+    __slots__ = ("name", "help", "label_names", "value", "_children", "_lock")
+
+    def __init__(self, name: str, help: str = "", label_names: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self.value = 0.0
+        self._children: Dict[Tuple[str, ...], "Counter"] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        if not _state.enabled:
+            return
+        self.value += amount
+
+    def labels(self, *values) -> "Counter":
+        """레이블 값 조합별 자식 카운터를 반환합니다. (꺼져 있으면 기록을 버리는 공유 자식)"""
+        if not _state.enabled:
+            return _NULL_COUNTER
+        return self.child(*values)
+
+    def child(self, *values) -> "Counter":
+        """레이블 값 조합별 자식 카운터를 켜짐 여부와 상관없이 만들거나 찾습니다."""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, Counter(self.name))
+        return child
+
+    def samples(self) -> List[Tuple[Dict[str, str], float]]:
+        """(레이블, 값) 목록"""
+        if not self.label_names:
+            return [({}, self.value)]
+        return [(dict(zip(self.label_names, key)), child.value) for key, child in self._children.items()]
+
+    def reset(self):
+        self.value = 0.0
+        for child in self._children.values():
+            child.reset()
+
+
+class Histogram:
+    """누적 구간 히스토그램 (관측 수, 합계, 구간별 개수)"""
+
+    __slots__ = ("name", "help", "label_names", "buckets", "counts", "count", "sum", "_children", "_lock")
+
+    def __init__(self, name: str, help: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS,
+                 label_names: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self._children: Dict[Tuple[str, ...], "Histogram"] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        if not _state.enabled:
+            return
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def labels(self, *values) -> "Histogram":
+        """레이블 값 조합별 자식 히스토그램을 반환합니다. (꺼져 있으면 기록을 버리는 공유 자식)"""
+        if not _state.enabled:
+            return _NULL_HISTOGRAM
+        return self.child(*values)
+
+    def child(self, *values) -> "Histogram":
+        """레이블 값 조합별 자식 히스토그램을 켜짐 여부와 상관없이 만들거나 찾습니다."""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, Histogram(self.name, buckets=self.buckets))
+        return child
+
+    def time(self) -> "_Span":
+        """with 블록의 경과 시간(초)을 관측하는 구간"""
+        return _Span(self) if _state.enabled else _NULL_SPAN
+
+    def series(self) -> List[Tuple[Dict[str, str], "Histogram"]]:
+        if not self.label_names:
+            return [({}, self)]
+        return [(dict(zip(self.label_names, key)), child) for key, child in self._children.items()]
+
+    def reset(self):
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        for child in self._children.values():
+            child.reset()
+
+
+class _Span:
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start)
+        return False
+
+
+class _NullSpan:
+    """계측이 꺼져 있을 때 쓰는 아무것도 하지 않는 구간 (공유 인스턴스)"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _NullCounter:
+    """계측이 꺼져 있을 때 labels()가 돌려주는 카운터 (공유 인스턴스)"""
+    __slots__ = ()
+
+    def inc(self, amount: float = 1):
+        pass
+
+    def labels(self, *values) -> "_NullCounter":
+        return self
+
+
+class _NullHistogram:
+    """계측이 꺼져 있을 때 labels()가 돌려주는 히스토그램 (공유 인스턴스)"""
+    __slots__ = ()
+
+    def observe(self, value: float):
+        pass
+
+    def time(self) -> _NullSpan:
+        return _NULL_SPAN
+
+    def labels(self, *values) -> "_NullHistogram":
+        return self
+
+
+_NULL_COUNTER = _NullCounter()
+_NULL_HISTOGRAM = _NullHistogram()
+
+
+class MetricsRegistry:
+    """지표 등록소 (같은 이름은 같은 지표 객체를 반환)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str = "", label_names: Sequence[str] = ()) -> Counter:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = Counter(name, help, label_names)
+        return metric
+
+    def histogram(self, name: str, help: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS,
+                  label_names: Sequence[str] = ()) -> Histogram:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = Histogram(name, help, buckets, label_names)
+        return metric
+
+    def metrics(self) -> List[object]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def reset(self):
+        """모든 지표 값을 0으로 되돌립니다."""
+        for metric in self.metrics():
+            metric.reset()
+
+
+# 전역 등록소
+registry = MetricsRegistry()
+
+
+def counter(name: str, help: str = "", label_names: Sequence[str] = ()) -> Counter:
+    """전역 등록소의 카운터 (모듈 수준에서 한 번 만들어 두고 사용)"""
+    return registry.counter(name, help, label_names)
+
+
+def histogram(name: str, help: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS,
+              label_names: Sequence[str] = ()) -> Histogram:
+    """전역 등록소의 히스토그램 (모듈 수준에서 한 번 만들어 두고 사용)"""
+    return registry.histogram(name, help, buckets, label_names)
+
+
+def span(name: str, help: str = ""):
+    """
+    이름으로 찾은 시간 히스토그램(초)에 with 블록의 경과 시간을 기록합니다.
+
+    자주 호출되는 곳은 histogram(..., SECONDS_BUCKETS).time()을 모듈 수준
+    객체로 쓰는 편이 등록소 조회를 건너뛰어 더 빠릅니다.
+    """
+    if not _state.enabled:
+        return _NULL_SPAN
+    return registry.histogram(name, help, SECONDS_BUCKETS).time()
+
+
+def enable_metrics():
+    """계측을 켭니다."""
+    _state.enabled = True
+
+
+def disable_metrics():
+    """계측을 끕니다. (이미 모은 값은 유지)"""
+    _state.enabled = False
+
+
+def metrics_enabled() -> bool:
+    return _state.enabled
+
+
+# --- 내보내기 ---
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render_text() -> str:
+    """사람이 읽는 지표 요약"""
+    lines = []
+    for metric in sorted(registry.metrics(), key=lambda m: m.name):
+        if isinstance(metric, Counter):
+            for labels, value in metric.samples():
+                suffix = f" {labels}" if labels else ""
+                lines.append(f"{metric.name}{suffix}: {_format_value(value)}")
+        else:
+            for labels, series in metric.series():
+                if series.count == 0:
+                    continue
+                suffix = f" {labels}" if labels else ""
+                lines.append(f"{metric.name}{suffix}: 횟수 {series.count}, 합계 {series.sum:.6g},"
+                             f" 평균 {series.sum / series.count:.6g}")
+    return "\n".join(lines) if lines else "(기록된 지표 없음)"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_str(labels: Dict[str, str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels.items()) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def render_prometheus() -> str:
+    """Prometheus 텍스트 노출 형식 (0.0.4)"""
+    lines = []
+    for metric in sorted(registry.metrics(), key=lambda m: m.name):
+        name = METRIC_PREFIX + metric.name
+        if metric.help:
+            lines.append(f"# HELP {name} {_escape(metric.help)}")
+
+        if isinstance(metric, Counter):
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in metric.samples():
+                lines.append(f"{name}{_label_str(labels)} {_format_value(value)}")
+            continue
+
+        lines.append(f"# TYPE {name} histogram")
+        for labels, series in metric.series():
+            cumulative = 0
+            for bound, count in zip(series.buckets, series.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{_label_str(labels, ('le', repr(float(bound))))} {cumulative}")
+            lines.append(f"{name}_bucket{_label_str(labels, ('le', '+Inf'))} {series.count}")
+            lines.append(f"{name}_sum{_label_str(labels)} {repr(float(series.sum))}")
+            lines.append(f"{name}_count{_label_str(labels)} {series.count}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path: str):
+    """
+    Prometheus 텍스트 파일을 원자적으로 씁니다.
+
+    node_exporter의 textfile 수집기 등이 반쯤 쓰인 파일을 읽지 않도록
+    임시 파일에 쓴 뒤 교체합니다. 권한은 PROMETHEUS_FILE_MODE에서 umask를
+    뺀 값입니다.
+    """
+    import tempfile  # 시작 시간 절약 (내보낼 때만 필요)
+    from utility.file_mode import new_file_mode
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_name = tempfile.mkstemp(prefix=".metrics.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(render_prometheus())
+        os.chmod(tmp_name, new_file_mode(directory, PROMETHEUS_FILE_MODE))
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def start_prometheus_writer(path: Optional[str] = None, interval: float = 15.0) -> Optional[threading.Thread]:
+    """
+    interval초마다 Prometheus 파일을 쓰는 데몬 스레드를 시작합니다.
+
+    path가 없으면 JEONRAN_METRICS_FILE 환경 변수를 사용하고, 그것도 없으면
+    시작하지 않습니다. 시작하면 계측도 함께 켭니다.
+    """
+    path = path or os.environ.get(METRICS_FILE_ENV)
+    if not path:
+        return None
+    enable_metrics()
+
+    def run():
+        while True:
+            time.sleep(interval)
+            try:
+                write_prometheus(path)
+            except OSError as e:
+                print(f"⚠️ 지표 파일 저장 실패: {e}")
+
+    thread = threading.Thread(target=run, name="metrics-writer", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,209 @@
+"""
+전란 그리고 요괴 - 조선시대 RPG
+파일: utility/sampling_profiler.py
+설명: 실행 중인 게임에 붙였다 뗄 수 있는 샘플링 프로파일러 (flamegraph용 collapsed stack 출력)
+"""
+
+__all__ = [
+    "DEFAULT_SAMPLE_INTERVAL",
+    "PROFILE_OUTPUT_TEMPLATE",
+    "SamplingProfiler",
+    "get_sampling_profiler",
+    "toggle_profiling",
+    "install_signal_toggle",
+]
+
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+# 샘플 간격 (초). 100Hz면 샘플당 수십 µs로 부하가 1% 안팎입니다.
+DEFAULT_SAMPLE_INTERVAL = 0.01
+
+# 한 스택에서 기록할 최대 프레임 수 (깊은 재귀에서 샘플 비용 제한)
+MAX_STACK_DEPTH = 128
+
+# 결과 파일 이름 (strftime 형식)
+PROFILE_OUTPUT_TEMPLATE = "profile_%Y%m%d_%H%M%S.collapsed"
+
+
+class SamplingProfiler:
+    """
+    sys._current_frames()를 주기적으로 읽는 샘플링 프로파일러
+
+    백그라운드 스레드가 interval초마다 모든 스레드(자신 제외)의 호출 스택을
+    "스레드;바깥 함수;...;안쪽 함수" 형태로 세어 두고, stop() 때
+    flamegraph.pl / speedscope가 읽는 collapsed stack 파일로 씁니다.
+    대상 코드에는 아무것도 끼워 넣지 않으므로 꺼져 있을 때 비용이 없습니다.
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL, max_depth: int = MAX_STACK_DEPTH):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.sampling_seconds = 0.0  # 샘플 수집에 쓴 시간 (부하 추정용)
+        self.started_at: Optional[float] = None
+        self.elapsed = 0.0
+        self._labels: Dict[object, str] = {}  # 코드 객체 → 프레임 이름
+        self._thread_names: Dict[int, str] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def _frame_label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def _thread_name(self, ident: int) -> str:
+        name = self._thread_names.get(ident)
+        if name is None:
+            self._thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            name = self._thread_names.get(ident, f"thread-{ident}")
+        return name
+
+    def _sample(self, own_ident: int):
+        """모든 스레드의 현재 스택을 한 번 기록합니다."""
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            labels = []
+            while frame is not None and len(labels) < self.max_depth:
+                labels.append(self._frame_label(frame.f_code))
+                frame = frame.f_back
+            labels.append(self._thread_name(ident))
+            labels.reverse()
+            self.stacks[";".join(labels)] += 1
+        self.samples += 1
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        clock = time.perf_counter
+        while not self._stop_event.wait(self.interval):
+            start = clock()
+            with self._lock:
+                self._sample(own_ident)
+            self.sampling_seconds += clock() - start
+
+    def start(self) -> bool:
+        """샘플링을 시작합니다. 이미 실행 중이면 False."""
+        if self._thread is not None:
+            return False
+        self._stop_event.clear()
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self, output: Optional[str] = None) -> Optional[str]:
+        """
+        샘플링을 멈추고 결과를 collapsed stack 파일로 씁니다.
+
+        Args:
+            output: 결과 파일 경로 (없으면 PROFILE_OUTPUT_TEMPLATE)
+
+        Returns:
+            쓴 파일 경로 (실행 중이 아니었으면 None)
+        """
+        if self._thread is None:
+            return None
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self.elapsed += time.perf_counter() - self.started_at
+
+        path = output or time.strftime(PROFILE_OUTPUT_TEMPLATE)
+        self.write_collapsed(path)
+        return path
+
+    def write_collapsed(self, path: str):
+        """"스택 횟수" 줄로 된 collapsed stack 파일을 씁니다. (많이 잡힌 순)"""
+        with self._lock:
+            lines = [f"{stack} {count}\n" for stack, count in self.stacks.most_common()]
+        with open(path, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+
+    def overhead(self) -> float:
+        """측정 구간 대비 샘플 수집에 쓴 시간 비율"""
+        elapsed = self.elapsed
+        if self._thread is not None:
+            elapsed += time.perf_counter() - self.started_at
+        return self.sampling_seconds / elapsed if elapsed > 0 else 0.0
+
+    def reset(self):
+        """모은 샘플을 버립니다."""
+        with self._lock:
+            self.stacks.clear()
+            self.samples = 0
+            self.sampling_seconds = 0.0
+            self.elapsed = 0.0
+            if self._thread is not None:
+                self.started_at = time.perf_counter()
+
+
+_sampling_profiler: Optional[SamplingProfiler] = None
+
+
+def get_sampling_profiler() -> SamplingProfiler:
+    """전역 샘플링 프로파일러 인스턴스 반환"""
+    global _sampling_profiler
+    if _sampling_profiler is None:
+        _sampling_profiler = SamplingProfiler()
+    return _sampling_profiler
+
+
+def toggle_profiling() -> Tuple[bool, Optional[str]]:
+    """
+    전역 프로파일러를 켜거나 끕니다.
+
+    Returns:
+        (켜졌는지, 끈 경우 결과 파일 경로 - 저장에 실패하면 None)
+    """
+    profiler = get_sampling_profiler()
+    if profiler.running:
+        # 시그널 처리기에서도 불리므로 결과 파일을 못 써도 예외를 내지 않습니다.
+        path = None
+        try:
+            path = profiler.stop()
+            print(f"⏹️ 샘플링 프로파일러 중지: 샘플 {profiler.samples}개, 부하 {profiler.overhead():.2%} → {path}")
+        except OSError as e:
+            print(f"⚠️ 프로파일 결과 저장 실패: {e}")
+        finally:
+            profiler.reset()
+        return False, path
+
+    profiler.start()
+    print(f"⏺️ 샘플링 프로파일러 시작 ({1 / profiler.interval:.0f}Hz)")
+    return True, None
+
+
+def install_signal_toggle(signum: Optional[int] = None) -> bool:
+    """
+    시그널(기본 SIGUSR2)을 받으면 전역 프로파일러를 켜고 끄도록 등록합니다.
+
+    예: kill -USR2 <pid>
+    시그널을 지원하지 않는 플랫폼(Windows)이나 메인 스레드가 아닌 곳에서는
+    등록하지 않고 False를 반환합니다.
+    """
+    if signum is None:
+        signum = getattr(signal, "SIGUSR2", None)
+        if signum is None:
+            return False
+
+    try:
+        signal.signal(signum, lambda received, frame: toggle_profiling())
+    except (ValueError, OSError) as e:
+        print(f"⚠️ 프로파일러 시그널 등록 실패: {e}")
+        return False
+    return True
@@ -0,0 +1,175 @@
+"""
+전란 그리고 요괴 - 조선시대 RPG
+파일: utility/startup_profiler.py
+설명: 게임 진입점의 모듈별 임포트 시간과 초기화 함수별 시간을 재는 시작 시간 프로파일러
+"""
+
+__all__ = [
+    "STARTUP_ENTRY",
+    "STARTUP_INITIALIZERS",
+    "parse_importtime",
+    "profile_startup",
+    "print_startup_report",
+    "main",
+]
+
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# 프로파일할 진입점 모듈
+STARTUP_ENTRY = "main_optimized"
+
+# 게임 시작 시 호출되는 초기화 함수 (표시 이름, 모듈, 함수) - 호출 순서대로
+STARTUP_INITIALIZERS: Tuple[Tuple[str, str, str], ...] = (
+    ("DataManager.initialize", "systems.data_manager", "initialize_data"),
+    ("QuestSystem.initialize", "systems.quest_system", "initialize_quests"),
+    ("WeaponSystem 로드", "systems.weapon_system", "get_weapon_system"),
+)
+
+# 자식 프로세스가 측정 결과를 출력할 때 붙이는 표식 (초기화 함수의 출력과 구분)
+_RESULT_MARKER = "@@startup-profile@@"
+# 자식 프로세스가 진입점 임포트 직전에 stderr에 남기는 표식 (-X importtime 출력 구분)
+_ENTRY_MARKER = "@@startup-entry@@"
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """
+    `python -X importtime` 출력을 모듈별 (자체, 누적) 시간으로 변환합니다.
+
+    형식: "import time: self [us] | cumulative | imported package"
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # 머리글 줄
+        rows.append({
+            "module": parts[2].strip(),
+            "self_ms": self_us / 1000,
+            "cumulative_ms": cumulative_us / 1000,
+        })
+    return rows
+
+
+def _run_child(entry: str) -> int:
+    """자식 프로세스: 진입점을 임포트하고 초기화 함수를 차례로 호출하며 시간을 잽니다."""
+    import importlib
+
+    sys.stderr.write(_ENTRY_MARKER + "\n")
+    sys.stderr.flush()
+    start = time.perf_counter()
+    importlib.import_module(entry)
+    import_ms = (time.perf_counter() - start) * 1000
+
+    initializers = []
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        for label, module_name, function_name in STARTUP_INITIALIZERS:
+            function = getattr(importlib.import_module(module_name), function_name)
+            start = time.perf_counter()
+            function()
+            initializers.append({"name": label, "ms": (time.perf_counter() - start) * 1000})
+
+    print(_RESULT_MARKER + json.dumps({"import_ms": import_ms, "initializers": initializers}))
+    return 0
+
+
+def profile_startup(entry: str = STARTUP_ENTRY, importtime: bool = True) -> Dict[str, Any]:
+    """
+    새 파이썬 프로세스에서 진입점의 콜드 스타트를 측정합니다.
+
+    Args:
+        entry: 진입점 모듈
+        importtime: -X importtime으로 모듈별 임포트 시간도 잴지 여부.
+            importtime은 임포트마다 기록 비용이 붙어 전체 시간을 부풀리므로,
+            시간 자체를 비교할 때는 False로 두고 순위표에만 씁니다.
+
+    Returns:
+        {"entry", "import_ms", "imports": [모듈별 시간], "initializers": [함수별 시간], "total_ms"}
+        (importtime이 False면 imports는 빈 목록)
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [_PROJECT_ROOT, env.get("PYTHONPATH")]))
+
+    command = [sys.executable, "-m", "utility.startup_profiler", "--child", entry]
+    if importtime:
+        command[1:1] = ["-X", "importtime"]
+    proc = subprocess.run(command, capture_output=True, text=True, env=env)
+    result_line = next((line for line in proc.stdout.splitlines() if line.startswith(_RESULT_MARKER)), None)
+    if proc.returncode != 0 or result_line is None:
+        raise RuntimeError(f"시작 시간 측정 실패 (종료 코드 {proc.returncode}): {proc.stderr.strip()[-500:]}")
+
+    measured = json.loads(result_line[len(_RESULT_MARKER):])
+    # 프로파일러 자신이 먼저 임포트한 모듈(argparse, subprocess 등)은 표식 앞에 있으므로 제외
+    _, _, entry_stderr = proc.stderr.partition(_ENTRY_MARKER)
+    imports = parse_importtime(entry_stderr)
+    return {
+        "entry": entry,
+        "import_ms": measured["import_ms"],
+        "imports": imports,
+        "initializers": measured["initializers"],
+        "total_ms": measured["import_ms"] + sum(item["ms"] for item in measured["initializers"]),
+    }
+
+
+def print_startup_report(profile: Dict[str, Any], top: int = 15):
+    """임포트(자체 시간순)와 초기화 함수(시간순) 순위표를 출력합니다."""
+    print(f"\n⏱️ 시작 시간 프로파일: {profile['entry']}")
+    print("=" * 60)
+    print(f"전체 {profile['total_ms']:.1f}ms = 임포트 {profile['import_ms']:.1f}ms"
+          f" + 초기화 {profile['total_ms'] - profile['import_ms']:.1f}ms")
+    if profile["imports"]:
+        print("(-X importtime 기록 비용이 포함되어 실제 시작 시간보다 깁니다)")
+
+    print(f"\n📦 모듈 임포트 (자체 시간 상위 {top}개, -X importtime 기준)")
+    print(f"{'순위':>4}  {'자체(ms)':>9}  {'누적(ms)':>9}  모듈")
+    ranked = sorted(profile["imports"], key=lambda row: row["self_ms"], reverse=True)
+    for rank, row in enumerate(ranked[:top], 1):
+        print(f"{rank:>4}  {row['self_ms']:>9.2f}  {row['cumulative_ms']:>9.2f}  {row['module']}")
+
+    print("\n🔧 초기화 함수")
+    print(f"{'순위':>4}  {'시간(ms)':>9}  함수")
+    ranked = sorted(profile["initializers"], key=lambda item: item["ms"], reverse=True)
+    for rank, item in enumerate(ranked, 1):
+        print(f"{rank:>4}  {item['ms']:>9.2f}  {item['name']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="게임 진입점 시작 시간 프로파일러")
+    parser.add_argument("--entry", default=STARTUP_ENTRY, help="프로파일할 진입점 모듈")
+    parser.add_argument("--top", type=int, default=15, help="표시할 임포트 모듈 수")
+    parser.add_argument("--json", action="store_true", help="순위표 대신 JSON으로 출력")
+    parser.add_argument("--child", metavar="ENTRY", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        return _run_child(args.child)
+
+    try:
+        profile = profile_startup(args.entry)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+
+    if args.json:
+        print(json.dumps(profile, ensure_ascii=False, indent=2))
+    else:
+        print_startup_report(profile, args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+전란 그리고 요괴 - 조선시대 RPG
+파일: utility/text_index.py
+설명: 부분 문자열 검색용 n-gram 역색인
+"""
+
+__all__ = ["NgramIndex"]
+
+from typing import Dict, Hashable, Iterable, List, Set
+
+
+class NgramIndex:
+    """
+    부분 문자열 검색용 문자 n-gram 역색인
+
+    한글 음절은 코드 포인트 하나이므로 문자 n-gram이 곧 음절 n-gram입니다.
+    색인 시 모든 필드를 한 번만 소문자로 변환해 두고, 검색 시에는
+    키워드의 n-gram 목록(posting)을 교집합한 후보만 부분 문자열로 확인합니다.
+    """
+
+    def __init__(self, n: int = 2):
+        self.n = n
+        self._postings: Dict[str, Set[Hashable]] = {}
+        self._texts: Dict[Hashable, List[str]] = {}  # 키별 소문자 필드
+        self._order: Dict[Hashable, int] = {}        # 삽입 순서 (결과 정렬용)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def _grams(self, text: str) -> Iterable[str]:
+        """텍스트의 1~n 글자 n-gram 생성"""
+        for size in range(1, self.n + 1):
+            for i in range(len(text) - size + 1):
+                yield text[i:i + size]
+
+    def add(self, key: Hashable, *fields: str):
+        """키와 검색 대상 필드들을 색인에 추가합니다."""
+        texts = [field.lower() for field in fields if field]
+        self._texts[key] = texts
+        self._order.setdefault(key, len(self._order))
+
+        for text in texts:
+            for gram in self._grams(text):
+                self._postings.setdefault(gram, set()).add(key)
+
+    def search(self, keyword: str) -> List[Hashable]:
+        """키워드를 부분 문자열로 포함하는 키 목록을 삽입 순서대로 반환합니다."""
+        keyword = keyword.lower()
+        if not keyword:
+            return sorted(self._texts, key=self._order.__getitem__)
+
+        size = min(len(keyword), self.n)
+        grams = {keyword[i:i + size] for i in range(len(keyword) - size + 1)}
+
+        # 가장 작은 posting부터 교집합
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return []
+
+        # n글자보다 긴 키워드는 실제 부분 문자열인지 확인
+        if len(keyword) > self.n:
+            candidates = {key for key in candidates
+                          if any(keyword in text for text in self._texts[key])}
+
+        return sorted(candidates, key=self._order.__getitem__)